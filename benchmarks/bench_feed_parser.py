@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark del parser de feeds: entradas/s de feedparser vs parser nativo (xml.etree).
+
+Uso:
+    python benchmarks/bench_feed_parser.py                  # 5000 entradas, RSS y Atom
+    python benchmarks/bench_feed_parser.py --entries 20000 --repeat 5
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+_repo_root = Path(__file__).resolve().parent.parent
+if str(_repo_root) not in sys.path:
+    sys.path.insert(0, str(_repo_root))
+
+from digest.adapters.feed_parser import parse_feed, parse_with_feedparser
+
+
+def synthetic_rss(n: int) -> bytes:
+    items = "".join(
+        f"<item><title>Post {i} about transformers &amp; scaling</title>"
+        f"<link>https://blog.example.com/posts/{i}</link>"
+        f"<description><![CDATA[<p>Snippet {i}: " + "lorem ipsum " * 20 + "</p>]]></description>"
+        f"<pubDate>Mon, 0{1 + i % 9} Jan 2024 10:00:00 +0000</pubDate>"
+        f"<guid>https://blog.example.com/posts/{i}</guid></item>"
+        for i in range(n)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel>{items}</channel></rss>'.encode()
+
+
+def synthetic_atom(n: int) -> bytes:
+    entries = "".join(
+        f"<entry><id>t3_{i}</id><title>Post {i}</title>"
+        f'<link href="https://www.reddit.com/r/MachineLearning/comments/{i}/x/"/>'
+        f'<category term="MachineLearning" label="r/MachineLearning"/>'
+        f"<published>2024-01-0{1 + i % 9}T10:00:00+00:00</published>"
+        f'<content type="html">' + "&lt;p&gt;body&lt;/p&gt; " * 20 + "</content></entry>"
+        for i in range(n)
+    )
+    return (
+        f'<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom">{entries}</feed>'
+    ).encode()
+
+
+def measure(parse: Callable[[bytes], list | None], doc: bytes, repeat: int) -> tuple[float, int]:
+    """Mejor tiempo de `repeat` ejecuciones y nº de entradas devueltas."""
+    best = float("inf")
+    count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        entries = parse(doc) or []
+        best = min(best, time.perf_counter() - start)
+        count = len(entries)
+    return best, count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--entries", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for name, doc in (
+        ("RSS 2.0", synthetic_rss(args.entries)),
+        ("Atom", synthetic_atom(args.entries)),
+    ):
+        print(f"{name}: {args.entries} entradas, {len(doc) / 1024:.0f} KiB")
+        results = {}
+        for label, fn in (("feedparser", parse_with_feedparser), ("nativo", parse_feed)):
+            seconds, count = measure(fn, doc, args.repeat)
+            results[label] = seconds
+            print(f"  {label:<11} {seconds:8.3f}s  {count / seconds:>10.0f} entradas/s")
+        print(f"  aceleración x{results['feedparser'] / results['nativo']:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark de resúmenes por lotes: peticiones, tokens de entrada/salida y tiempo total de
+resumir N candidatos uno por petición frente a summarize_batch con distintos tamaños de lote.
+
+El LLM es un stand-in local compatible con la API de chat de OpenAI que simula la latencia
+(coste fijo por petición + tiempo por token generado). Los tokens se estiman como
+caracteres / 4; sirven para comparar los modos entre sí, no para facturar.
+
+Uso:
+    python benchmarks/bench_llm_batch.py                      # 30 candidatos, lotes 5/10/30
+    python benchmarks/bench_llm_batch.py --items 60 --batch-sizes 10,20 --workers 8
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+
+_repo_root = Path(__file__).resolve().parent.parent
+if str(_repo_root) not in sys.path:
+    sys.path.insert(0, str(_repo_root))
+
+from digest.adapters.llm_openai import OpenAILLM
+from digest.domain.models import Item
+from digest.use_cases.build_digest import summarize_candidates
+from tests.local_server import local_server
+
+SUMMARY = "Resumen simulado de dos o tres líneas sobre el artículo, con el dato principal. " * 2
+_ID_RE = re.compile(r"\[id: ([^\]]+)\]")
+_RANK_RE = re.compile(r"^\[(\d+)\] Título:", re.MULTILINE)
+
+
+def tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+class StandIn:
+    """
+    API de chat simulada: cuenta peticiones y tokens, y duerme overhead + salida.
+    Los prompts de ranking reciben el orden de los índices tal cual ("0, 1, 2, ...").
+    """
+
+    def __init__(self, overhead: float, per_token: float) -> None:
+        self.overhead = overhead
+        self.per_token = per_token
+        self.requests = 0
+        self.tokens_in = 0
+        self.tokens_out = 0
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        self.requests = self.tokens_in = self.tokens_out = 0
+
+    def __call__(self, method: str, path: str, headers: dict[str, str], body: bytes):
+        prompt = json.loads(body)["messages"][0]["content"]
+        ids = _ID_RE.findall(prompt)
+        ranked = _RANK_RE.findall(prompt)
+        if ids:
+            content = json.dumps({i: SUMMARY for i in ids}, ensure_ascii=False)
+        elif ranked:
+            content = ", ".join(ranked)
+        else:
+            content = SUMMARY
+        with self._lock:
+            self.requests += 1
+            self.tokens_in += tokens(prompt)
+            self.tokens_out += tokens(content)
+        time.sleep(self.overhead + tokens(content) * self.per_token)
+        payload = {
+            "id": "chatcmpl-bench",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "stand-in",
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }
+            ],
+        }
+        return 200, {"Content-Type": "application/json"}, json.dumps(payload).encode()
+
+
+def candidates(n: int) -> list[Item]:
+    description = "Descripción del artículo con contexto técnico sobre modelos y datos. " * 12
+    return [
+        Item(
+            title=f"Artículo {i}",
+            url=f"https://example.com/{i}",
+            source="rss",
+            description=description,
+        )
+        for i in range(n)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=30)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--batch-sizes", default="5,10,30")
+    parser.add_argument("--overhead", type=float, default=0.3, help="s fijos por petición")
+    parser.add_argument("--per-token", type=float, default=0.002, help="s por token generado")
+    args = parser.parse_args()
+
+    api = StandIn(args.overhead, args.per_token)
+    items = candidates(args.items)
+    print(f"{args.items} candidatos, {args.workers} peticiones en vuelo")
+    print(f"{'modo':>12} {'peticiones':>10} {'tokens in':>10} {'tokens out':>10} {'tiempo':>8}")
+    with local_server(api) as base:
+        os.environ["OPENAI_BASE_URL"] = base + "/v1"
+        llm = OpenAILLM(api_key="bench")
+        for batch_size in [1] + [int(b) for b in args.batch_sizes.split(",") if b.strip()]:
+            api.reset()
+            start = time.perf_counter()
+            asyncio.run(
+                summarize_candidates(items, llm, max_workers=args.workers, batch_size=batch_size)
+            )
+            elapsed = time.perf_counter() - start
+            label = "por ítem" if batch_size == 1 else f"lote {batch_size}"
+            print(
+                f"{label:>12} {api.requests:>10} {api.tokens_in:>10} {api.tokens_out:>10} "
+                f"{elapsed:>7.2f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
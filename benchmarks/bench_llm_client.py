@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark del coste por llamada de OpenAILLM: un cliente OpenAI nuevo en cada
+petición (comportamiento anterior) frente a un único cliente reutilizado por instancia.
+
+El servidor es un stand-in local de la API de chat que responde al instante, así que la
+diferencia es solo construcción del cliente y apertura de conexión. Es HTTP sin TLS: contra
+la API real cada cliente nuevo paga además un handshake TLS, por lo que el ahorro real es mayor.
+
+Uso:
+    python benchmarks/bench_llm_client.py                 # 30 resúmenes, 5 repeticiones
+    python benchmarks/bench_llm_client.py --calls 100 --repeat 3
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+_repo_root = Path(__file__).resolve().parent.parent
+if str(_repo_root) not in sys.path:
+    sys.path.insert(0, str(_repo_root))
+
+from digest.adapters.llm_openai import OpenAILLM
+from tests.local_server import local_server
+
+
+def chat_api(method: str, path: str, headers: dict[str, str], body: bytes):
+    payload = {
+        "id": "chatcmpl-bench",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "stand-in",
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": "Resumen simulado."},
+                "finish_reason": "stop",
+            }
+        ],
+    }
+    return 200, {"Content-Type": "application/json"}, json.dumps(payload).encode()
+
+
+class PerCallClientLLM(OpenAILLM):
+    """Como antes: un OpenAI(api_key=...) nuevo (pool y conexiones nuevos) por llamada."""
+
+    def _get_client(self):
+        from openai import OpenAI
+
+        return OpenAI(api_key=self._api_key, timeout=self._timeout)
+
+
+def run(llm: OpenAILLM, calls: int) -> float:
+    start = time.perf_counter()
+    for i in range(calls):
+        llm.summarize(f"Artículo {i}", "Descripción breve del artículo.")
+    return (time.perf_counter() - start) / calls * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with local_server(chat_api) as base:
+        os.environ["OPENAI_BASE_URL"] = base + "/v1"
+        results: dict[str, list[float]] = {"cliente por llamada": [], "cliente reutilizado": []}
+        for _ in range(args.repeat):
+            results["cliente por llamada"].append(
+                run(PerCallClientLLM(api_key="bench"), args.calls)
+            )
+            shared = OpenAILLM(api_key="bench")
+            results["cliente reutilizado"].append(run(shared, args.calls))
+            shared.close()
+
+    print(f"{args.calls} resúmenes seguidos, mediana de {args.repeat} repeticiones")
+    for label, values in results.items():
+        print(f"{label:>20}: {statistics.median(values):6.2f} ms/llamada")
+    before, after = (statistics.median(v) for v in results.values())
+    print(f"{'ahorro':>20}: {before - after:6.2f} ms/llamada ({(1 - after / before) * 100:.0f} %)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark de casi duplicados: tiempo de cluster_near_duplicates (MinHash + LSH) con miles
+de candidatos sintéticos y una fracción de copias retocadas (prefijo "[N] ", sufijo de
+dominio o una palabra menos), frente a comparar todas las firmas de título por pares.
+
+Informa recall (copias agrupadas con su original) y fusiones erróneas. La comparación
+por pares es cuadrática y solo se ejecuta hasta --brute-max candidatos.
+
+Uso:
+    python benchmarks/bench_near_dup.py                       # 300, 5000, 20000 candidatos
+    python benchmarks/bench_near_dup.py --sizes 50000 --dup-rate 0.1
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+_repo_root = Path(__file__).resolve().parent.parent
+if str(_repo_root) not in sys.path:
+    sys.path.insert(0, str(_repo_root))
+
+from digest.domain.models import Item
+from digest.domain.near_dup import (
+    cluster_near_duplicates,
+    minhash_signatures,
+    shingles,
+)
+
+WORDS = [f"w{i}" for i in range(5000)]
+
+
+def variant(title: str, rng: random.Random) -> str:
+    words = title.split()
+    kind = rng.randrange(3)
+    if kind == 0:
+        return "[N] " + title
+    if kind == 1:
+        return title + " (example.com)"
+    del words[rng.randrange(len(words))]
+    return " ".join(words)
+
+
+def dataset(
+    n: int, dup_rate: float, rng: random.Random
+) -> tuple[list[Item], list[tuple[int, int]]]:
+    """Ítems y pares (original, copia) plantados."""
+    items: list[Item] = []
+    planted: list[tuple[int, int]] = []
+    while len(items) < n:
+        if items and rng.random() < dup_rate:
+            original = rng.randrange(len(items))
+            title = variant(items[original].title, rng)
+            planted.append((original, len(items)))
+        else:
+            title = " ".join(rng.choices(WORDS, k=10))
+        items.append(
+            Item(
+                title=title,
+                url=f"https://example.com/{len(items)}",
+                source=rng.choice(["rss", "hacker_news", "reddit"]),
+                description=" ".join(rng.choices(WORDS, k=40)),
+            )
+        )
+    return items, planted
+
+
+def brute_force(items: list[Item], threshold: float, block: int = 256) -> int:
+    """Pares de títulos con firmas que coinciden en >= threshold, comparando todos contra todos."""
+    sigs = minhash_signatures([shingles(item.title) for item in items])
+    found = 0
+    for start in range(0, len(sigs), block):
+        agree = (sigs[start : start + block, None, :] == sigs[None, :, :]).mean(axis=2)
+        rows, cols = np.nonzero(agree >= threshold)
+        found += int(np.count_nonzero(cols > rows + start))
+    return found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="300,5000,20000")
+    parser.add_argument("--dup-rate", type=float, default=0.05)
+    parser.add_argument("--threshold", type=float, default=0.6)
+    parser.add_argument("--brute-max", type=int, default=5000)
+    args = parser.parse_args()
+
+    print(f"copias {args.dup_rate:.0%}, umbral {args.threshold}")
+    print(
+        f"{'candidatos':>10} {'LSH':>9} {'por pares':>10} {'grupos':>8} {'recall':>7} "
+        f"{'fusiones erróneas':>18}"
+    )
+    for n in [int(s) for s in args.sizes.split(",") if s.strip()]:
+        items, planted = dataset(n, args.dup_rate, random.Random(n))
+        start = time.perf_counter()
+        groups = cluster_near_duplicates(items, threshold=args.threshold)
+        lsh_s = time.perf_counter() - start
+
+        group_of = {i: g for g, members in enumerate(groups) for i in members}
+        recall = sum(group_of[a] == group_of[b] for a, b in planted) / max(len(planted), 1)
+        expected = n - len({b for _, b in planted})
+        wrong = max(0, expected - len(groups))
+
+        brute = "-"
+        if n <= args.brute_max:
+            start = time.perf_counter()
+            brute_force(items, args.threshold)
+            brute = f"{time.perf_counter() - start:.2f}s"
+        print(f"{n:>10} {lsh_s:>8.2f}s {brute:>10} {len(groups):>8} {recall:>7.1%} {wrong:>18}")
+
+
+if __name__ == "__main__":
+    main()
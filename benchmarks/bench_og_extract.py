@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la extracción de og:image: bytes leídos y CPU del escaneo del <head> en
+streaming frente a descargar y parsear la página entera (BeautifulSoup si está instalado).
+
+Uso:
+    python benchmarks/bench_og_extract.py                   # página de ~2 MB
+    python benchmarks/bench_og_extract.py --body-kb 500 --repeat 20
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Callable, Iterator
+from html.parser import HTMLParser
+from pathlib import Path
+
+_repo_root = Path(__file__).resolve().parent.parent
+if str(_repo_root) not in sys.path:
+    sys.path.insert(0, str(_repo_root))
+
+from digest.adapters.fetch_og_image import CHUNK_SIZE, scan_head
+
+
+def synthetic_page(head_kb: int, body_kb: int) -> bytes:
+    """Artículo típico: <head> con CSS/JSON-LD en línea y og:image al final, cuerpo grande."""
+    head = (
+        "<head><meta charset='utf-8'><title>Post</title>"
+        + "<style>"
+        + ".c{color:red}" * (head_kb * 1024 // 13)
+        + "</style>"
+        + '<meta name="twitter:image" content="/tw.png">'
+        + '<meta property="og:image" content="https://cdn.example.com/og.png"></head>'
+    )
+    paragraph = "<p>" + "Lorem ipsum dolor sit amet. " * 30 + "</p>"
+    body = "<body>" + paragraph * (body_kb * 1024 // len(paragraph)) + "</body>"
+    return f"<!DOCTYPE html><html>{head}{body}</html>".encode()
+
+
+def chunked(data: bytes) -> Iterator[bytes]:
+    for start in range(0, len(data), CHUNK_SIZE):
+        yield data[start : start + CHUNK_SIZE]
+
+
+def full_page(data: bytes) -> tuple[str | None, int]:
+    """Método anterior: todo el documento a un árbol y búsqueda de metas en <head>."""
+    try:
+        from bs4 import BeautifulSoup
+    except ImportError:
+        # Sin bs4: un HTMLParser sobre la página completa como cota inferior del coste anterior.
+        parser = HTMLParser()
+        parser.feed(data.decode())
+        parser.close()
+        return None, len(data)
+    head = BeautifulSoup(data.decode(), "html.parser").find("head")
+    meta = head.find("meta", attrs={"property": "og:image"}) if head else None
+    return (meta.get("content") if meta else None), len(data)
+
+
+def streaming(data: bytes) -> tuple[str | None, int]:
+    scan = scan_head(chunked(data))
+    return scan.image, scan.bytes_read
+
+
+def measure(fn: Callable[[bytes], tuple[str | None, int]], data: bytes, repeat: int):
+    """CPU media por página (process_time) y bytes consumidos."""
+    start = time.process_time()
+    for _ in range(repeat):
+        image, bytes_read = fn(data)
+    return (time.process_time() - start) / repeat, bytes_read, image
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--head-kb", type=int, default=30)
+    parser.add_argument("--body-kb", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    page = synthetic_page(args.head_kb, args.body_kb)
+    print(f"Página sintética: {len(page) / 1024:.0f} KiB (head ~{args.head_kb} KiB)")
+    try:
+        import bs4  # noqa: F401
+
+        old_label = "página completa (bs4)"
+    except ImportError:
+        old_label = "página completa (HTMLParser, sin bs4)"
+    rows = [(old_label, *measure(full_page, page, args.repeat))]
+    rows.append(("head en streaming", *measure(streaming, page, args.repeat)))
+    for label, cpu, bytes_read, image in rows:
+        print(
+            f"  {label:<38} {cpu * 1000:8.1f} ms CPU  {bytes_read / 1024:8.0f} KiB leídos  {image}"
+        )
+    old_cpu, old_bytes = rows[0][1], rows[0][2]
+    new_cpu, new_bytes = rows[1][1], rows[1][2]
+    print(
+        f"  ahorro: {100 * (1 - new_bytes / old_bytes):.1f}% bytes, "
+        f"{100 * (1 - new_cpu / old_cpu):.1f}% CPU"
+    )
+
+
+if __name__ == "__main__":
+    main()
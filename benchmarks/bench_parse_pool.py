@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark del pool de parseo: tiempo total y CPU del proceso principal al "descargar" y
+parsear decenas de feeds con los hilos de fetch, con y sin ParsePool.
+
+La descarga se simula con trozos de 16 KiB de feeds RSS sintéticos en memoria; una
+fracción (--malformed) lleva una entidad HTML que rompe expat y obliga a usar feedparser,
+el caso en el que el pool compensa. También compara lo que cuesta en el proceso principal
+contar entradas para el corte temprano: etiquetas de cierre sobre bytes (lo que hace
+read_feed con extract=False) frente a pasar cada byte por un XMLPullParser.
+
+Uso:
+    python benchmarks/bench_parse_pool.py                   # 40 feeds, 500 entradas, 25 % rotos
+    python benchmarks/bench_parse_pool.py --feeds 80 --workers 4 --malformed 0.5
+"""
+
+import argparse
+import sys
+import time
+import xml.etree.ElementTree as ET
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+_repo_root = Path(__file__).resolve().parent.parent
+if str(_repo_root) not in sys.path:
+    sys.path.insert(0, str(_repo_root))
+
+from digest.adapters.feed_parser import ENTRY_TAGS, local_name
+from digest.adapters.feed_stream import CHUNK_SIZE, FeedPayload, parse_payload, read_feed
+from digest.adapters.parse_pool import ParsePool
+
+
+def synthetic_rss(n: int, *, broken: bool) -> bytes:
+    entity = "&nbsp;" if broken else "&amp;"
+    items = "".join(
+        f"<item><title>Post {i} about transformers {entity} scaling</title>"
+        f"<link>https://blog.example.com/posts/{i}</link>"
+        f"<description><![CDATA[<p>Snippet {i}: " + "lorem ipsum " * 20 + "</p>]]></description>"
+        f"<pubDate>Mon, 0{1 + i % 9} Jan 2024 10:00:00 +0000</pubDate>"
+        f"<guid>https://blog.example.com/posts/{i}</guid></item>"
+        for i in range(n)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel>{items}</channel></rss>'.encode()
+
+
+def chunks(doc: bytes):
+    for start in range(0, len(doc), CHUNK_SIZE):
+        yield doc[start : start + CHUNK_SIZE]
+
+
+def pull_parser_count(doc: bytes, max_entries: int) -> int:
+    """Conteo con XMLPullParser sobre cada trozo (lo que se hacía antes en el padre)."""
+    parser = ET.XMLPullParser(events=("end",))
+    seen = 0
+    for chunk in chunks(doc):
+        try:
+            parser.feed(chunk)
+            for _event, elem in parser.read_events():
+                if local_name(elem.tag) in ENTRY_TAGS:
+                    seen += 1
+                    elem.clear()
+        except ET.ParseError:
+            return seen  # antes se seguía descargando hasta el final sin contar
+        if seen >= max_entries:
+            break
+    return seen
+
+
+def run(docs: list[bytes], fetch: Callable[[bytes], list], threads: int) -> tuple[float, float]:
+    """Tiempo de reloj y CPU del proceso principal para procesar todos los feeds."""
+    wall, cpu = time.perf_counter(), time.process_time()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(executor.map(fetch, docs))
+    assert all(results)
+    return time.perf_counter() - wall, time.process_time() - cpu
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--feeds", type=int, default=40)
+    parser.add_argument("--entries", type=int, default=500)
+    parser.add_argument("--max-entries", type=int, default=50)
+    parser.add_argument("--malformed", type=float, default=0.25)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    broken_every = round(1 / args.malformed) if args.malformed > 0 else 0
+    docs = [
+        synthetic_rss(args.entries, broken=bool(broken_every) and i % broken_every == 0)
+        for i in range(args.feeds)
+    ]
+    limit = args.max_entries
+
+    def in_process(doc: bytes) -> list:
+        return parse_payload(read_feed(chunks(doc), max_entries=limit))
+
+    start = time.perf_counter()
+    pool = ParsePool(args.workers)
+    pool.parse(FeedPayload(content=docs[0]), max_entries=1)
+    startup = time.perf_counter() - start
+
+    def with_pool(doc: bytes) -> list:
+        return pool.parse(
+            read_feed(chunks(doc), max_entries=limit, extract=False), max_entries=limit
+        )
+
+    print(
+        f"{args.feeds} feeds de {args.entries} entradas ({len(docs[0]) / 1024:.0f} KiB), "
+        f"cuota {limit}, {args.malformed:.0%} mal formados, {args.threads} hilos"
+    )
+    with pool:
+        for label, fetch in (("en proceso", in_process), (f"pool x{args.workers}", with_pool)):
+            wall, cpu = run(docs, fetch, args.threads)
+            print(f"  {label:<12} {wall * 1000:8.1f} ms total  {cpu * 1000:8.1f} ms CPU padre")
+    print(f"  arranque del pool (forkserver + primer parseo): {startup * 1000:.0f} ms")
+
+    print("Conteo en el padre (un feed, hasta la cuota o el final):")
+    for label, count in (
+        ("XMLPullParser", lambda d: pull_parser_count(d, limit)),
+        ("bytes", lambda d: read_feed(chunks(d), max_entries=limit, extract=False).entries_seen),
+        ("parseo completo", lambda d: len(in_process(d))),
+    ):
+        start = time.perf_counter()
+        for doc in docs:
+            count(doc)
+        print(f"  {label:<16} {(time.perf_counter() - start) / len(docs) * 1000:7.2f} ms/feed")
+
+
+if __name__ == "__main__":
+    main()
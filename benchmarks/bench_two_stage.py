@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark del flujo en dos etapas: peticiones, tokens y tiempo de resumir y rankear todos
+los candidatos frente a pre-rankear por título, resumir solo la shortlist y rankear esa.
+
+Usa el mismo LLM stand-in que bench_llm_batch.py (coste fijo por petición + tiempo por
+token generado, tokens estimados como caracteres / 4).
+
+Uso:
+    python benchmarks/bench_two_stage.py                       # 30 candidatos, top 5, factor 2
+    python benchmarks/bench_two_stage.py --items 100 --factor 3 --batch-size 10
+"""
+
+import argparse
+import asyncio
+import math
+import os
+import sys
+import time
+from pathlib import Path
+
+_repo_root = Path(__file__).resolve().parent.parent
+if str(_repo_root) not in sys.path:
+    sys.path.insert(0, str(_repo_root))
+
+from benchmarks.bench_llm_batch import StandIn, candidates
+from digest.adapters.llm_openai import OpenAILLM
+from digest.use_cases.build_digest import (
+    rank_candidates,
+    shortlist_candidates,
+    summarize_candidates,
+)
+from tests.local_server import local_server
+
+
+async def flow(items, llm, *, top_n: int, keep: int, workers: int, batch_size: int) -> None:
+    if keep:
+        items = await shortlist_candidates(items, llm, keep=keep, max_workers=workers)
+    with_summaries = await summarize_candidates(
+        items, llm, max_workers=workers, batch_size=batch_size
+    )
+    await rank_candidates(with_summaries, llm, top_n=top_n, max_workers=workers)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=30)
+    parser.add_argument("--top-n", type=int, default=5)
+    parser.add_argument("--factor", type=float, default=2.0)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=1)
+    parser.add_argument("--overhead", type=float, default=0.3, help="s fijos por petición")
+    parser.add_argument("--per-token", type=float, default=0.002, help="s por token generado")
+    args = parser.parse_args()
+
+    api = StandIn(args.overhead, args.per_token)
+    items = candidates(args.items)
+    keep = math.ceil(args.top_n * args.factor)
+    print(
+        f"{args.items} candidatos, top {args.top_n}, shortlist {keep}, "
+        f"lote {args.batch_size}, {args.workers} peticiones en vuelo"
+    )
+    print(f"{'flujo':>12} {'peticiones':>10} {'tokens in':>10} {'tokens out':>10} {'tiempo':>8}")
+    with local_server(api) as base:
+        os.environ["OPENAI_BASE_URL"] = base + "/v1"
+        llm = OpenAILLM(api_key="bench")
+        for label, shortlist in (("una etapa", 0), ("dos etapas", keep)):
+            api.reset()
+            start = time.perf_counter()
+            asyncio.run(
+                flow(
+                    items,
+                    llm,
+                    top_n=args.top_n,
+                    keep=shortlist,
+                    workers=args.workers,
+                    batch_size=args.batch_size,
+                )
+            )
+            elapsed = time.perf_counter() - start
+            print(
+                f"{label:>12} {api.requests:>10} {api.tokens_in:>10} {api.tokens_out:>10} "
+                f"{elapsed:>7.2f}s"
+            )
+        llm.close()
+
+
+if __name__ == "__main__":
+    main()
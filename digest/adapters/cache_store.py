@@ -0,0 +1,149 @@
+"""Caché clave → valor persistida en un archivo JSON, con TTL opcional y tope de entradas."""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+
+# Archivos de caché dentro de cache_dir (nombre lógico → archivo), usados por fetch_all y la CLI.
+CACHE_FILES = {
+    "feeds": "feeds.json",
+    "hn-search": "hn-search.json",
+    "hn-watermarks": "hn-watermarks.json",
+    "hn-watermarks-pending": "hn-watermarks.pending.json",
+    "source-health": "source-health.json",
+    "og-images": "og-images.json",
+    "summaries": "summaries.json",
+}
+
+
+class JsonCache:
+    """
+    Caché persistente y thread-safe guardada como {"version", "entries": {clave: entrada}}.
+
+    Cada entrada guarda el valor, cuándo se guardó, cuándo expira (None = nunca) y el último
+    acceso. Al superar max_entries se descartan las menos usadas recientemente (LRU).
+    Un archivo ausente o corrupto se trata como caché vacía (nunca rompe el pipeline).
+    Los cambios solo llegan a disco con save().
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_entries: int = 1000,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = Path(path)
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, Any]] = _load_entries(self.path)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any | None:
+        """Valor vigente para la clave, o None si no existe o expiró (cuenta hit/miss)."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and _expired(entry, now):
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            entry["accessed_at"] = now
+            self.hits += 1
+            return entry["value"]
+
+    def peek(self, key: str) -> Any | None:
+        """Como get() pero sin contar hit/miss ni tocar el orden LRU."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or _expired(entry, self._clock()):
+                return None
+            return entry["value"]
+
+    def set(self, key: str, value: Any, *, ttl: float | None = None) -> None:
+        """Guarda el valor; ttl explícito sustituye al TTL por defecto de la caché."""
+        now = self._clock()
+        ttl = ttl if ttl is not None else self.ttl
+        with self._lock:
+            self._entries[key] = {
+                "value": value,
+                "stored_at": now,
+                "expires_at": now + ttl if ttl is not None else None,
+                "accessed_at": now,
+            }
+            self._evict()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def entries(self) -> dict[str, dict[str, Any]]:
+        """Copia de las entradas (con metadatos) para inspección."""
+        with self._lock:
+            return {k: dict(v) for k, v in self._entries.items()}
+
+    def save(self) -> None:
+        """Escribe la caché a disco de forma atómica, omitiendo entradas ya expiradas."""
+        now = self._clock()
+        with self._lock:
+            live = {k: v for k, v in self._entries.items() if not _expired(v, now)}
+            payload = {"version": CACHE_VERSION, "entries": live}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def _evict(self) -> None:
+        overflow = len(self._entries) - self.max_entries
+        if overflow <= 0:
+            return
+        oldest = sorted(self._entries, key=lambda k: self._entries[k]["accessed_at"])
+        for key in oldest[:overflow]:
+            del self._entries[key]
+
+
+def _expired(entry: dict[str, Any], now: float) -> bool:
+    expires_at = entry.get("expires_at")
+    return expires_at is not None and now >= expires_at
+
+
+def _load_entries(path: Path) -> dict[str, dict[str, Any]]:
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning("Caché ilegible %s, se ignora: %s", path, e)
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return {}
+    entries = data.get("entries")
+    if not isinstance(entries, dict):
+        return {}
+    return {
+        k: v
+        for k, v in entries.items()
+        if isinstance(v, dict) and "value" in v and "accessed_at" in v
+    }
@@ -0,0 +1,141 @@
+"""Ejecución concurrente acotada de tareas de red: fan-out por fuente con deadline (RNF-06)."""
+
+import asyncio
+import inspect
+import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Granularidad con la que se revisan deadlines de tareas que arrancaron tarde (cola llena).
+_POLL_INTERVAL = 0.05
+
+
+@dataclass
+class Task(Generic[T]):
+    """Una unidad de trabajo independiente (un feed, una query, un subreddit...)."""
+
+    label: str
+    fn: Callable[[], T]
+
+
+def run_tasks(
+    tasks: list[Task[T]],
+    *,
+    max_workers: int = 8,
+    task_deadline: float | None = None,
+    overall_deadline: float | None = None,
+    on_expired: Callable[[str], None] | None = None,
+) -> list[T | None]:
+    """
+    Ejecuta las tareas en un pool de hilos acotado y devuelve sus resultados en el mismo orden.
+
+    - max_workers: tope global de tareas en vuelo.
+    - task_deadline: segundos máximos por tarea, contados desde que empieza a ejecutarse.
+    - overall_deadline: segundos máximos para el conjunto, contados desde la llamada.
+    - on_expired: se llama con la etiqueta de cada tarea abandonada por deadline, antes
+      de devolver (p. ej. para contarla como fallo en el circuit breaker).
+
+    Una tarea que lanza excepción o supera su deadline se registra y su resultado es None;
+    nunca aborta al resto. Las tareas abandonadas por deadline siguen en su hilo hasta que
+    su propio timeout de red las corte, pero no bloquean el retorno.
+    """
+    if not tasks:
+        return []
+
+    start = time.monotonic()
+    overall_end = start + overall_deadline if overall_deadline is not None else None
+    started_at: dict[int, float] = {}
+
+    def _wrap(index: int, task: Task[T]) -> T:
+        started_at[index] = time.monotonic()
+        return task.fn()
+
+    results: list[T | None] = [None] * len(tasks)
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tasks))))
+    try:
+        futures: dict[Future, int] = {
+            executor.submit(_wrap, i, task): i for i, task in enumerate(tasks)
+        }
+        pending = set(futures)
+        while pending:
+            timeout = _next_timeout(pending, futures, started_at, task_deadline, overall_end)
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except Exception as e:  # noqa: BLE001
+                    logger.warning("%s falló: %s", tasks[index].label, e)
+            pending = _drop_expired(
+                pending, futures, tasks, started_at, task_deadline, overall_end, on_expired
+            )
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return results
+
+
+def _next_timeout(
+    pending: set[Future],
+    futures: dict[Future, int],
+    started_at: dict[int, float],
+    task_deadline: float | None,
+    overall_end: float | None,
+) -> float | None:
+    """Tiempo a esperar antes de volver a revisar deadlines (None = sin límite)."""
+    now = time.monotonic()
+    candidates: list[float] = []
+    if overall_end is not None:
+        candidates.append(overall_end - now)
+    if task_deadline is not None:
+        for future in pending:
+            began = started_at.get(futures[future])
+            if began is None:
+                candidates.append(_POLL_INTERVAL)
+            else:
+                candidates.append(began + task_deadline - now)
+    if not candidates:
+        return None
+    return max(0.0, min(candidates))
+
+
+def _drop_expired(
+    pending: set[Future],
+    futures: dict[Future, int],
+    tasks: list[Task],
+    started_at: dict[int, float],
+    task_deadline: float | None,
+    overall_end: float | None,
+    on_expired: Callable[[str], None] | None = None,
+) -> set[Future]:
+    """Abandona (resultado None) las tareas que superaron su deadline o el global."""
+    now = time.monotonic()
+    still_pending: set[Future] = set()
+    for future in pending:
+        index = futures[future]
+        began = started_at.get(index)
+        overall_expired = overall_end is not None and now >= overall_end
+        task_expired = (
+            task_deadline is not None and began is not None and now >= began + task_deadline
+        )
+        if overall_expired or task_expired:
+            future.cancel()
+            logger.warning("%s superó el deadline; se descarta", tasks[index].label)
+            if on_expired is not None:
+                on_expired(tasks[index].label)
+        else:
+            still_pending.add(future)
+    return still_pending
+
+
+async def await_or_thread(fn: Callable, *args, **kwargs):
+    """Await directo si fn es una corrutina (puertos async); si es síncrona, en un hilo."""
+    if inspect.iscoroutinefunction(fn):
+        return await fn(*args, **kwargs)
+    return await asyncio.to_thread(fn, *args, **kwargs)
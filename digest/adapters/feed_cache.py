@@ -0,0 +1,82 @@
+"""Caché de validadores HTTP (ETag / Last-Modified) para GET condicional de feeds RSS y Reddit."""
+
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import httpx
+
+from digest.domain.models import Item
+
+from .cache_store import JsonCache
+
+
+@dataclass
+class FeedCacheStats:
+    """Contadores de la ejecución: 304 reutilizados, descargas completas y bytes no descargados."""
+
+    hits: int = 0
+    misses: int = 0
+    bytes_saved: int = 0
+
+
+class FeedCache:
+    """
+    Por URL de feed guarda ETag, Last-Modified, tamaño del documento y los Item ya parseados.
+
+    conditional_headers() da las cabeceras If-None-Match / If-Modified-Since; ante un 304
+    reuse() devuelve los Item guardados sin volver a llamar a feedparser.
+    """
+
+    def __init__(self, path: str | Path, *, max_entries: int = 500) -> None:
+        self._store = JsonCache(path, max_entries=max_entries)
+        self._lock = threading.Lock()
+        self.stats = FeedCacheStats()
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        value = self._store.peek(url)
+        if not value:
+            return {}
+        headers: dict[str, str] = {}
+        if value.get("etag"):
+            headers["If-None-Match"] = value["etag"]
+        if value.get("last_modified"):
+            headers["If-Modified-Since"] = value["last_modified"]
+        return headers
+
+    def reuse(self, url: str) -> list[Item] | None:
+        """Ítems guardados para la URL tras un 304; None si no hay entrada (no debería pasar)."""
+        value = self._store.get(url)
+        if value is None:
+            return None
+        with self._lock:
+            self.stats.hits += 1
+            self.stats.bytes_saved += int(value.get("bytes") or 0)
+        return [Item(**data) for data in value.get("items") or []]
+
+    def store(
+        self, url: str, response: httpx.Response, items: list[Item], *, size: int | None = None
+    ) -> None:
+        """
+        Tras un 200 guarda validadores e ítems; sin ETag ni Last-Modified no hay nada que guardar.
+        size: bytes leídos cuando la respuesta se consumió en streaming (sin response.content).
+        """
+        with self._lock:
+            self.stats.misses += 1
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if not etag and not last_modified:
+            self._store.delete(url)
+            return
+        self._store.set(
+            url,
+            {
+                "etag": etag,
+                "last_modified": last_modified,
+                "bytes": size if size is not None else len(response.content),
+                "items": [asdict(it) for it in items],
+            },
+        )
+
+    def save(self) -> None:
+        self._store.save()
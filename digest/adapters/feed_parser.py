@@ -0,0 +1,197 @@
+"""
+Parser ligero de RSS 2.0 / RDF / Atom sobre xml.etree: solo enlace, título, descripción,
+fecha, id y categorías de cada entrada. feedparser queda como respaldo para feeds mal formados.
+"""
+
+import io
+import time
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import feedparser
+
+# Etiquetas (sin espacio de nombres) que cierran una entrada: <item> en RSS/RDF, <entry> en Atom.
+ENTRY_TAGS = frozenset({"item", "entry"})
+
+_DESCRIPTION_TAGS = ("summary", "description")
+_CONTENT_TAGS = ("content", "encoded")  # Atom <content>, RSS <content:encoded>
+_DATE_TAGS = ("published", "pubDate", "date", "issued", "updated", "modified", "created")
+
+
+@dataclass(frozen=True, slots=True)
+class FeedEntry:
+    """Lo que los adaptadores usan de una entrada de feed, ya normalizado (fecha YYYY-MM-DD)."""
+
+    title: str
+    link: str | None
+    description: str | None = None
+    date: str | None = None
+    id: str | None = None
+    categories: tuple[str, ...] = ()
+
+
+def local_name(tag: str) -> str:
+    """Nombre sin espacio de nombres: '{http://www.w3.org/2005/Atom}entry' → 'entry'."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def parse_feed(content: bytes, *, max_entries: int | None = None) -> list[FeedEntry] | None:
+    """
+    Parsea un documento ya descargado y devuelve sus entradas (como mucho max_entries), o
+    None si el XML está mal formado o no tiene entradas (el llamador recurre a
+    parse_with_feedparser). Un prefijo cortado por la descarga no es un error: se
+    devuelven las entradas que llegaron a cerrarse.
+    """
+    parser = ET.XMLPullParser(events=("end",))
+    entries: list[FeedEntry] = []
+    try:
+        parser.feed(content)
+        for _event, elem in parser.read_events():
+            if local_name(elem.tag) in ENTRY_TAGS:
+                entries.append(entry_from_element(elem))
+                elem.clear()
+                if max_entries and len(entries) >= max_entries:
+                    break
+    except ET.ParseError:
+        return None
+    return entries or None
+
+
+def entry_from_element(elem: ET.Element) -> FeedEntry:
+    """Extrae los campos de un <item> / <entry> ya cerrado."""
+    fields: dict[str, str] = {}
+    links: list[ET.Element] = []
+    categories: list[str] = []
+    for child in elem:
+        name = local_name(child.tag)
+        if name == "link":
+            links.append(child)
+        elif name == "category":
+            term = (child.get("term") or _text(child)).strip()
+            if term:
+                categories.append(term)
+        elif name not in fields:
+            fields[name] = _text(child)
+
+    description = _first(fields, _DESCRIPTION_TAGS) or _first(fields, _CONTENT_TAGS)
+    raw_date = _first(fields, _DATE_TAGS)
+    return FeedEntry(
+        title=(fields.get("title") or "").strip(),
+        link=_entry_link(links, fields),
+        description=description,
+        date=normalize_date(raw_date) if raw_date else None,
+        id=(fields.get("id") or fields.get("guid") or "").strip() or None,
+        categories=tuple(categories),
+    )
+
+
+def normalize_date(value: str) -> str | None:
+    """RFC 822 (RSS) o ISO 8601 (Atom, dc:date) → YYYY-MM-DD en UTC; si no se entiende, el texto."""
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            # Python 3.10 no acepta el sufijo "Z" en fromisoformat
+            parsed = datetime.fromisoformat(
+                value.removesuffix("Z") + "+00:00" if value.endswith("Z") else value
+            )
+        except ValueError:
+            return value
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc)
+    return parsed.strftime("%Y-%m-%d")
+
+
+def parse_with_feedparser(content: bytes, content_type: str = "") -> list[FeedEntry]:
+    """Respaldo tolerante: feedparser sobre los bytes (como stream, nunca como ruta o URL)."""
+    parsed = feedparser.parse(io.BytesIO(content), response_headers={"content-type": content_type})
+    return [
+        FeedEntry(
+            title=(entry.get("title") or "").strip(),
+            link=_feedparser_link(entry),
+            description=_feedparser_description(entry),
+            date=_feedparser_date(entry),
+            id=entry.get("id"),
+            categories=tuple(
+                (tag.get("term") or "").strip()
+                for tag in entry.get("tags") or []
+                if (tag.get("term") or "").strip()
+            ),
+        )
+        for entry in parsed.entries
+    ]
+
+
+def _text(elem: ET.Element) -> str:
+    # itertext cubre también contenido XHTML anidado (Atom type="xhtml").
+    return "".join(elem.itertext()) if len(elem) else (elem.text or "")
+
+
+def _first(fields: dict[str, str], names: tuple[str, ...]) -> str | None:
+    for name in names:
+        value = (fields.get(name) or "").strip()
+        if value:
+            return value
+    return None
+
+
+def _entry_link(links: list[ET.Element], fields: dict[str, str]) -> str | None:
+    """Atom: href con rel="alternate" (o sin rel); RSS: texto de <link> o <guid> permalink."""
+    fallback: str | None = None
+    for link in links:
+        href = (link.get("href") or "").strip()
+        if not href:
+            text = _text(link).strip()
+            if text.startswith("http"):
+                return text
+            continue
+        if not href.startswith("http"):
+            continue
+        if link.get("rel", "alternate") == "alternate":
+            return href
+        fallback = fallback or href
+    if fallback:
+        return fallback
+    guid = (fields.get("guid") or "").strip()
+    return guid if guid.startswith("http") else None
+
+
+def _feedparser_link(entry) -> str | None:
+    """URL canónica de un entry de feedparser (link o primer enlace http)."""
+    link = getattr(entry, "link", None)
+    if link and isinstance(link, str) and link.strip().startswith("http"):
+        return link.strip()
+    for ln in getattr(entry, "links", None) or []:
+        href = getattr(ln, "href", None)
+        if href and str(href).strip().startswith("http"):
+            return str(href).strip()
+    return None
+
+
+def _feedparser_description(entry) -> str | None:
+    for attr in ("summary", "description", "content"):
+        val = getattr(entry, attr, None)
+        if val:
+            if isinstance(val, list):
+                val = val[0]
+            if hasattr(val, "value"):
+                return (val.value or "").strip() or None
+            if isinstance(val, str) and val.strip():
+                return val.strip()
+    return None
+
+
+def _feedparser_date(entry) -> str | None:
+    for attr in ("published", "updated", "created"):
+        val = getattr(entry, f"{attr}_parsed", None)
+        if val:
+            return time.strftime("%Y-%m-%d", val)
+    published = getattr(entry, "published", None)
+    if published and isinstance(published, str):
+        return published.strip()
+    return None
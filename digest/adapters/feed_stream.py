@@ -0,0 +1,152 @@
+"""Descarga de feeds en streaming: tope de bytes y corte temprano al completar la cuota."""
+
+import logging
+import re
+import xml.etree.ElementTree as ET
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import httpx
+
+from .feed_parser import (
+    ENTRY_TAGS,
+    FeedEntry,
+    entry_from_element,
+    local_name,
+    parse_feed,
+    parse_with_feedparser,
+)
+from .http_session import get_session
+
+logger = logging.getLogger(__name__)
+
+# Tamaño de lectura del cuerpo y tope por defecto de un feed (bytes ya descomprimidos).
+CHUNK_SIZE = 16 * 1024
+DEFAULT_MAX_FEED_BYTES = 5 * 1024 * 1024
+
+# Cierre de una entrada (</item>, </entry>, </atom:entry>...) para contar sin parsear.
+_ENTRY_END_RE = re.compile(rb"</(?:[\w.-]+:)?(?:item|entry)\s*>")
+# Bytes del final del buffer que se vuelven a examinar por si un cierre quedó partido.
+_MAX_END_TAG = 64
+
+
+@dataclass
+class FeedPayload:
+    """
+    Cuerpo leído de un feed, entradas ya extraídas por el parser nativo (None si el XML
+    resultó mal formado) y por qué se dejó de leer.
+    """
+
+    content: bytes = b""
+    entries: list[FeedEntry] | None = None
+    entries_seen: int = 0
+    stopped_early: bool = False
+    truncated: bool = False
+    response: httpx.Response | None = None
+
+
+def download_feed(
+    url: str,
+    *,
+    timeout: float,
+    headers: dict | None = None,
+    params: dict | None = None,
+    max_entries: int | None = None,
+    max_bytes: int = DEFAULT_MAX_FEED_BYTES,
+    extract: bool = True,
+) -> FeedPayload:
+    """
+    GET en streaming con la sesión compartida. El cuerpo solo se lee entero si es un 200;
+    ante 304 o error se devuelve sin contenido (el llamador decide con status_code).
+    extract=False solo cuenta entradas (el parseo se hará en otro proceso).
+    """
+    with get_session().stream("GET", url, params=params, headers=headers, timeout=timeout) as r:
+        if r.status_code != 200:
+            return FeedPayload(response=r)
+        payload = read_feed(
+            r.iter_bytes(CHUNK_SIZE), max_entries=max_entries, max_bytes=max_bytes, extract=extract
+        )
+        payload.response = r
+    if payload.truncated:
+        logger.warning("%s supera %d bytes; se parsea solo el principio", url, max_bytes)
+    return payload
+
+
+def read_feed(
+    chunks: Iterable[bytes],
+    *,
+    max_entries: int | None = None,
+    max_bytes: int = DEFAULT_MAX_FEED_BYTES,
+    extract: bool = True,
+) -> FeedPayload:
+    """
+    Acumula trozos del cuerpo pasándolos a un XMLPullParser que extrae cada entrada en
+    cuanto se cierra. Deja de leer (sin descargar el resto) cuando ya hay max_entries
+    entradas completas o se alcanza max_bytes. Si el XML está mal formado se descartan
+    las entradas nativas y se sigue leyendo hasta el tope: feedparser tolera lo que expat no.
+    Con extract=False no se parsea nada en este proceso: se cuentan las etiquetas de cierre
+    de entrada sobre los bytes (payload.entries queda en None) y el XML mal formado ya no
+    se detecta aquí; el worker que parsea el prefijo recurre a feedparser si hace falta.
+    """
+    parser: ET.XMLPullParser | None = ET.XMLPullParser(events=("end",)) if extract else None
+    entries: list[FeedEntry] = []
+    seen = 0
+    scan_from = 0
+    buffer = bytearray()
+    payload = FeedPayload()
+    for chunk in chunks:
+        room = max_bytes - len(buffer)
+        if len(chunk) > room:
+            chunk = chunk[:room]
+            payload.truncated = True
+        buffer += chunk
+        if not extract:
+            closed, scan_from = _count_entry_ends(buffer, scan_from)
+            seen += closed
+        elif parser is not None:
+            try:
+                parser.feed(chunk)
+                for _event, elem in parser.read_events():
+                    if local_name(elem.tag) in ENTRY_TAGS:
+                        seen += 1
+                        entries.append(entry_from_element(elem))
+                        elem.clear()
+            except ET.ParseError:
+                parser = None
+        if payload.truncated:
+            break
+        if (parser is not None or not extract) and max_entries and seen >= max_entries:
+            payload.stopped_early = True
+            break
+    payload.content = bytes(buffer)
+    payload.entries_seen = seen
+    if parser is not None and entries:
+        payload.entries = entries
+    return payload
+
+
+def _count_entry_ends(buffer: bytearray, start: int) -> tuple[int, int]:
+    """Cierres de entrada desde start y posición desde la que seguir en el próximo trozo."""
+    count, resume = 0, max(start, len(buffer) - _MAX_END_TAG)
+    for match in _ENTRY_END_RE.finditer(buffer, start):
+        count += 1
+        resume = max(resume, match.end())
+    return count, resume
+
+
+def parse_payload(payload: FeedPayload) -> list[FeedEntry]:
+    """Entradas del parser nativo; si el XML estaba mal formado (o sin entradas), feedparser."""
+    if payload.entries is not None:
+        return payload.entries
+    content_type = payload.response.headers.get("content-type", "") if payload.response else ""
+    return parse_with_feedparser(payload.content, content_type)
+
+
+def entries_from_bytes(
+    content: bytes, content_type: str = "", *, max_entries: int | None = None
+) -> list[FeedEntry]:
+    """Parseo completo de un cuerpo ya descargado (lo que hace cada proceso del pool)."""
+    entries = parse_feed(content, max_entries=max_entries)
+    if entries is None:
+        entries = parse_with_feedparser(content, content_type)
+    return entries[:max_entries] if max_entries else entries
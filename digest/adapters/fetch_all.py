@@ -1,42 +1,142 @@
 """Orquestador de adaptadores de entrada: llama a todos y une resultados (T3.5)."""
 
 import logging
+import os
 from pathlib import Path
 
 from digest.config.sources import SourcesConfig
 from digest.domain.models import Item
 
-from .input_hacker_news import fetch_hacker_news_items
+from .cache_store import CACHE_FILES, JsonCache
+from .concurrency import Task, run_tasks
+from .feed_cache import FeedCache
+from .input_hacker_news import hacker_news_tasks, merge_hacker_news_results
 from .input_manual import fetch_manual_items
-from .input_reddit import fetch_reddit_items
-from .input_rss import fetch_rss_items
+from .input_reddit import merge_reddit_results, reddit_tasks
+from .input_rss import merge_rss_results, rss_tasks
+from .parse_pool import parse_pool_for
+from .resilience import SourceHealth, guard_tasks
 
 logger = logging.getLogger(__name__)
 
+# Tope de búsquedas de HN guardadas (queries × variantes de hitsPerPage).
+HN_CACHE_MAX_ENTRIES = 200
+
 
 def fetch_all_items(
     sources_config: SourcesConfig,
     links_path: str | Path,
     *,
     timeout: float = 15.0,
+    cache_dir: str | Path | None = None,
 ) -> list[Item]:
     """
     Ejecuta todos los adaptadores de entrada y une sus resultados en una sola lista.
 
-    Cada fuente se ejecuta en try/except: si una falla se registra el error y
-    se sigue con el resto (resiliencia por fuente, RNF-06). No se lanza excepción
+    Cada feed, query de HN y subreddit es una tarea independiente; todas se lanzan
+    a la vez en un único pool con tope global (fetch.max_workers) y deadline por
+    fuente (fetch.source_deadline). El orden del resultado es el de siempre:
+    RSS, manual, Hacker News, Reddit.
+
+    Con cache_dir, RSS y Reddit hacen GET condicional con la caché de validadores
+    (cache_dir/feeds.json) y las búsquedas de HN se reutilizan dentro del TTL
+    (cache_dir/hn-search.json). Todo se guarda al terminar. En modo incremental las marcas
+    de agua de HN se leen de cache_dir/hn-watermarks.json pero las nuevas se dejan en
+    cache_dir/hn-watermarks.pending.json: solo commit_hn_watermarks (tras enviar el
+    digest) las da por buenas, así un envío fallido no pierde historias.
+
+    Los errores transitorios (red, 5xx) se reintentan con backoff exponencial con jitter
+    (fetch.retries). Con cache_dir además hay circuit breaker por fuente
+    (cache_dir/source-health.json): una fuente con fetch.breaker_threshold fallos seguidos
+    se omite hasta que vence su espera y luego se sondea con un único intento.
+
+    Con fetch.parse_workers > 0 y al menos fetch.parse_pool_min_sources feeds, el parseo
+    de RSS y Reddit se hace en un pool de procesos mientras los hilos siguen descargando.
+
+    Cada fuente está aislada: si una falla o vence su deadline se registra el error
+    y se sigue con el resto (resiliencia por fuente, RNF-06). No se lanza excepción
     por fallos individuales.
     """
+    groups: dict[str, list[Task[list[Item]]]] = {"rss": [], "hacker_news": [], "reddit": []}
+    feed_cache: FeedCache | None = None
+    hn_cache: JsonCache | None = None
+    hn_watermarks: JsonCache | None = None
+    health: SourceHealth | None = None
+    fetch_config = sources_config.fetch
+    if cache_dir is not None:
+        health = SourceHealth(
+            Path(cache_dir) / CACHE_FILES["source-health"],
+            threshold=fetch_config.breaker_threshold,
+            cooldown_hours=fetch_config.breaker_cooldown_hours,
+        )
+        feed_cache = FeedCache(Path(cache_dir) / CACHE_FILES["feeds"])
+        hn_config = sources_config.hacker_news
+        if hn_config and hn_config.cache_ttl_minutes > 0:
+            hn_cache = JsonCache(
+                Path(cache_dir) / CACHE_FILES["hn-search"],
+                ttl=hn_config.cache_ttl_minutes * 60,
+                max_entries=HN_CACHE_MAX_ENTRIES,
+            )
+        if hn_config and hn_config.incremental:
+            hn_watermarks = JsonCache(Path(cache_dir) / CACHE_FILES["hn-watermarks"])
+
+    parse_pool = parse_pool_for(
+        _feed_count(sources_config),
+        fetch_config.parse_workers,
+        min_sources=fetch_config.parse_pool_min_sources,
+    )
+    with parse_pool as pool:
+        if sources_config.rss:
+            try:
+                groups["rss"] = rss_tasks(
+                    sources_config.rss,
+                    timeout,
+                    cache=feed_cache,
+                    pool=pool,
+                    max_items=fetch_config.max_items_per_feed,
+                    max_bytes=fetch_config.max_feed_bytes,
+                )
+            except Exception as e:  # noqa: BLE001
+                logger.warning("Adaptador RSS falló: %s", e)
+        if sources_config.hacker_news:
+            try:
+                groups["hacker_news"] = hacker_news_tasks(
+                    sources_config.hacker_news, timeout, cache=hn_cache, watermarks=hn_watermarks
+                )
+            except Exception as e:  # noqa: BLE001
+                logger.warning("Adaptador Hacker News falló: %s", e)
+        if sources_config.reddit:
+            try:
+                groups["reddit"] = reddit_tasks(
+                    sources_config.reddit,
+                    timeout,
+                    cache=feed_cache,
+                    pool=pool,
+                    max_bytes=fetch_config.max_feed_bytes,
+                )
+            except Exception as e:  # noqa: BLE001
+                logger.warning("Adaptador Reddit falló: %s", e)
+
+        all_tasks = [task for tasks in groups.values() for task in tasks]
+        results = run_tasks(
+            guard_tasks(all_tasks, fetch_config, health),
+            max_workers=fetch_config.max_workers,
+            task_deadline=fetch_config.source_deadline,
+            on_expired=health.expire if health is not None else None,
+        )
+    by_group: dict[str, list[list[Item] | None]] = {}
+    offset = 0
+    for name, tasks in groups.items():
+        by_group[name] = results[offset : offset + len(tasks)]
+        offset += len(tasks)
+
     combined: list[Item] = []
 
     # RSS
     if sources_config.rss:
-        try:
-            items = fetch_rss_items(sources_config.rss, timeout=timeout)
-            combined.extend(items)
-            logger.info("RSS: %d ítems", len(items))
-        except Exception as e:  # noqa: BLE001
-            logger.warning("Adaptador RSS falló: %s", e)
+        items = merge_rss_results(by_group["rss"])
+        combined.extend(items)
+        logger.info("RSS: %d ítems", len(items))
 
     # Manual (links.md)
     try:
@@ -49,20 +149,72 @@ def fetch_all_items(
 
     # Hacker News
     if sources_config.hacker_news:
-        try:
-            items = fetch_hacker_news_items(sources_config.hacker_news, timeout=timeout)
-            combined.extend(items)
-            logger.info("Hacker News: %d ítems", len(items))
-        except Exception as e:  # noqa: BLE001
-            logger.warning("Adaptador Hacker News falló: %s", e)
+        items = merge_hacker_news_results(sources_config.hacker_news, by_group["hacker_news"])
+        combined.extend(items)
+        logger.info("Hacker News: %d ítems", len(items))
 
     # Reddit
     if sources_config.reddit:
-        try:
-            items = fetch_reddit_items(sources_config.reddit, timeout=timeout)
-            combined.extend(items)
-            logger.info("Reddit: %d ítems", len(items))
-        except Exception as e:  # noqa: BLE001
-            logger.warning("Adaptador Reddit falló: %s", e)
+        items = merge_reddit_results(by_group["reddit"])
+        combined.extend(items)
+        logger.info("Reddit: %d ítems", len(items))
+
+    if feed_cache is not None:
+        stats = feed_cache.stats
+        logger.info(
+            "Caché de feeds: %d sin cambios (304), %d descargados, %d bytes ahorrados",
+            stats.hits,
+            stats.misses,
+            stats.bytes_saved,
+        )
+        _save_cache("feeds", feed_cache)
+    if hn_cache is not None:
+        logger.info("Caché de Hacker News: %d hits, %d misses", hn_cache.hits, hn_cache.misses)
+        _save_cache("hn-search", hn_cache)
+    if hn_watermarks is not None and cache_dir is not None:
+        hn_watermarks.path = Path(cache_dir) / CACHE_FILES["hn-watermarks-pending"]
+        _save_cache("hn-watermarks-pending", hn_watermarks)
+    if health is not None:
+        summary = health.summary
+        if summary.skipped or summary.probed or summary.opened:
+            logger.info(
+                "Circuit breaker: %d fuentes omitidas, %d sondeadas, %d abiertas en esta ejecución",
+                summary.skipped,
+                summary.probed,
+                summary.opened,
+            )
+        _save_cache("source-health", health)
 
     return combined
+
+
+def commit_hn_watermarks(cache_dir: str | Path) -> bool:
+    """
+    Da por consumidas las historias de HN de la última ejecución: las marcas de agua
+    pendientes pasan a ser las vigentes. Llamar solo tras enviar el digest con éxito.
+    Devuelve False si no había marcas pendientes.
+    """
+    pending = Path(cache_dir) / CACHE_FILES["hn-watermarks-pending"]
+    if not pending.exists():
+        return False
+    try:
+        os.replace(pending, Path(cache_dir) / CACHE_FILES["hn-watermarks"])
+    except OSError as e:
+        logger.warning("No se pudieron guardar las marcas de agua de HN: %s", e)
+        return False
+    return True
+
+
+def _feed_count(sources_config: SourcesConfig) -> int:
+    """Feeds XML que se van a parsear (RSS + subreddits; el modo combinado es uno solo)."""
+    reddit = sources_config.reddit
+    subreddits = len(reddit.subreddits) if reddit and not reddit.combined else int(bool(reddit))
+    return len(sources_config.rss) + subreddits
+
+
+def _save_cache(name: str, cache: FeedCache | JsonCache | SourceHealth) -> None:
+    """Persiste una caché; un fallo de disco no debe tumbar el digest."""
+    try:
+        cache.save()
+    except OSError as e:
+        logger.warning("No se pudo guardar la caché %s: %s", name, e)
@@ -1,56 +1,141 @@
 """Extracción de imagen OG (Open Graph) de URLs de artículos para el email del digest."""
 
+import codecs
 import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+from html.parser import HTMLParser
 from urllib.parse import urljoin
 
 import httpx
-from bs4 import BeautifulSoup
+
+from .http_session import get_session
+from .og_cache import OgImageCache
 
 logger = logging.getLogger(__name__)
 
-DEFAULT_UA = "DigestBot/1.0 (weekly AI/ML digest)"
 FETCH_TIMEOUT = 5.0
+# Se lee como mucho esto del HTML (las metas van en <head>, normalmente en los primeros KB).
+OG_MAX_BYTES = 512 * 1024
+CHUNK_SIZE = 16 * 1024
+# Respuestas que no pueden llevar metas HTML: se descartan sin leer el cuerpo.
+_BINARY_TYPES = ("image/", "audio/", "video/", "application/pdf", "application/octet-stream")
+
+
+@dataclass
+class OgScan:
+    """Resultado de escanear el <head>: imagen elegida (sin resolver) y bytes consumidos."""
+
+    image: str | None
+    bytes_read: int
+    finished_head: bool
+
+
+class _HeadMetaParser(HTMLParser):
+    """Recoge og:image y twitter:image hasta </head> o <body>; og:image corta en el acto."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.og_image: str | None = None
+        self.twitter_image: str | None = None
+        self.done = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if self.done:
+            return
+        if tag == "body":
+            self.done = True
+            return
+        if tag != "meta":
+            return
+        attributes = dict(attrs)
+        content = (attributes.get("content") or "").strip()
+        if not content:
+            return
+        if attributes.get("property") == "og:image":
+            # og:image tiene prioridad: no hace falta seguir leyendo
+            self.og_image = content
+            self.done = True
+        elif attributes.get("name") == "twitter:image" and self.twitter_image is None:
+            self.twitter_image = content
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "head":
+            self.done = True
+
+
+def scan_head(
+    chunks: Iterable[bytes], *, encoding: str = "utf-8", max_bytes: int = OG_MAX_BYTES
+) -> OgScan:
+    """
+    Pasa los trozos del HTML a un HTMLParser incremental y deja de consumirlos en cuanto
+    aparece og:image, </head> o <body>, o se llega a max_bytes.
+    """
+    parser = _HeadMetaParser()
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    bytes_read = 0
+    for chunk in chunks:
+        chunk = chunk[: max_bytes - bytes_read]
+        bytes_read += len(chunk)
+        parser.feed(decoder.decode(chunk))
+        if parser.done or bytes_read >= max_bytes:
+            break
+    return OgScan(
+        image=parser.og_image or parser.twitter_image,
+        bytes_read=bytes_read,
+        finished_head=parser.done,
+    )
 
 
-def fetch_og_image(url: str, *, timeout: float = FETCH_TIMEOUT) -> str | None:
+def fetch_og_image(
+    url: str, *, timeout: float = FETCH_TIMEOUT, cache: OgImageCache | None = None
+) -> str | None:
     """
     Obtiene la URL de la imagen OG (og:image) o twitter:image de la página.
 
+    Descarga en streaming y solo hasta el final del <head> (o OG_MAX_BYTES): el resto
+    del artículo no se baja ni se parsea. Las URLs relativas se resuelven contra la página.
+    Con cache se consulta antes de ir a la red (también los negativos) y se guarda el resultado.
     Devuelve None si no hay meta de imagen, error HTTP, timeout o conexión.
     No lanza excepciones (resiliente para el pipeline).
     """
     if not url or not url.strip().startswith("http"):
         return None
+    if cache is not None:
+        hit = cache.get(url)
+        if hit is not None:
+            return hit.image
+    image, outcome = _lookup(url, timeout)
+    if cache is not None:
+        cache.store(url, image, outcome)
+    return image
+
+
+def _lookup(url: str, timeout: float) -> tuple[str | None, str]:
+    """
+    Imagen (absoluta) y motivo: found, missing, not-html, timeout, http-<código>,
+    http-5xx o error.
+    """
     try:
-        headers = {"User-Agent": DEFAULT_UA}
-        with httpx.Client(timeout=timeout, headers=headers) as client:
-            response = client.get(url)
+        with get_session().stream("GET", url, timeout=timeout) as response:
             response.raise_for_status()
-            text = response.text
-    except (httpx.HTTPStatusError, httpx.ReadTimeout, httpx.ConnectError) as e:
+            if response.headers.get("content-type", "").lower().startswith(_BINARY_TYPES):
+                return None, "not-html"
+            scan = scan_head(response.iter_bytes(CHUNK_SIZE), encoding=response.encoding or "utf-8")
+    except httpx.TimeoutException as e:
         logger.debug("OG image fetch failed for %s: %s", url, e)
-        return None
-
-    soup = BeautifulSoup(text, "html.parser")
-    head = soup.find("head")
-    if not head:
-        return None
+        return None, "timeout"
+    except httpx.HTTPStatusError as e:
+        logger.debug("OG image fetch failed for %s: %s", url, e)
+        status = e.response.status_code
+        return None, "http-5xx" if status >= 500 else f"http-{status}"
+    except httpx.HTTPError as e:
+        logger.debug("OG image fetch failed for %s: %s", url, e)
+        return None, "error"
 
-    # og:image tiene prioridad
-    for meta in head.find_all("meta", attrs={"property": "og:image"}):
-        content = meta.get("content")
-        if content and (content := content.strip()):
-            if content.startswith("http://") or content.startswith("https://"):
-                return content
-            # URL relativa: convertir a absoluta respecto a la página
-            return urljoin(url, content)
-
-    # Fallback: twitter:image
-    for meta in head.find_all("meta", attrs={"name": "twitter:image"}):
-        content = meta.get("content")
-        if content and (content := content.strip()):
-            if content.startswith("http://") or content.startswith("https://"):
-                return content
-            return urljoin(url, content)
-
-    return None
+    if not scan.image:
+        return None, "missing"
+    if scan.image.startswith("http://") or scan.image.startswith("https://"):
+        return scan.image, "found"
+    # URL relativa: convertir a absoluta respecto a la página
+    return urljoin(url, scan.image), "found"
@@ -0,0 +1,265 @@
+"""Sesión HTTP compartida por los adaptadores: pool keep-alive, límites por host y métricas."""
+
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+import httpx
+
+from digest.config.sources import FetchConfig
+
+from .rate_limit import HostRateLimiter, retry_after_seconds
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_UA = "DigestBot/1.0 (weekly AI/ML digest)"
+# Reintentos tras 429 / 503 con Retry-After, y pausa base si un 429 no trae Retry-After.
+THROTTLE_RETRIES = 2
+DEFAULT_THROTTLE_PAUSE = 2.0
+
+
+@dataclass
+class HttpStats:
+    """Contadores de la sesión: peticiones y conexiones TCP abiertas vs reutilizadas."""
+
+    requests: int = 0
+    connections_opened: int = 0
+
+    @property
+    def connections_reused(self) -> int:
+        return max(0, self.requests - self.connections_opened)
+
+
+class HttpSession:
+    """
+    Envoltorio de un único httpx.Client para toda la ejecución.
+
+    - Keep-alive: las peticiones al mismo host reutilizan conexión (sin nuevo TCP/TLS).
+    - max_connections: tope global del pool; max_per_host: peticiones simultáneas por host.
+    - http2: se activa solo si el paquete `h2` está instalado (extra httpx[http2]).
+    - Compresión: httpx anuncia y decodifica gzip/deflate (y br/zstd si están instalados).
+    - limiter: token bucket por host; un 429 (o 503 con Retry-After) pausa el host y se
+      reintenta hasta THROTTLE_RETRIES veces si la espera no supera max_retry_after.
+
+    Es thread-safe: el pool de fetch_all la usa desde varios hilos.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 20,
+        max_per_host: int = 4,
+        http2: bool = False,
+        keepalive_expiry: float = 30.0,
+        user_agent: str = DEFAULT_UA,
+        limiter: HostRateLimiter | None = None,
+        max_retry_after: float = 60.0,
+    ) -> None:
+        if http2 and not _h2_available():
+            logger.warning("HTTP/2 pedido pero el paquete h2 no está instalado; se usa HTTP/1.1")
+            http2 = False
+        self._client = httpx.Client(
+            headers={"User-Agent": user_agent},
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=http2,
+        )
+        self._max_per_host = max(1, max_per_host)
+        self.limiter = limiter
+        self._max_retry_after = max_retry_after
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self._stats = HttpStats()
+
+    @classmethod
+    def from_config(cls, config: FetchConfig) -> "HttpSession":
+        return cls(
+            max_connections=config.max_connections,
+            max_per_host=config.max_per_host,
+            http2=config.http2,
+            limiter=HostRateLimiter.from_config(config),
+            max_retry_after=config.max_retry_after,
+        )
+
+    @property
+    def stats(self) -> HttpStats:
+        with self._lock:
+            return HttpStats(
+                requests=self._stats.requests,
+                connections_opened=self._stats.connections_opened,
+            )
+
+    def get(
+        self,
+        url: str,
+        *,
+        params: dict | None = None,
+        headers: dict | None = None,
+        timeout: float | None = None,
+    ) -> httpx.Response:
+        """GET con la conexión del pool; respeta el límite de peticiones simultáneas por host."""
+        return self.request("GET", url, params=params, headers=headers, timeout=timeout)
+
+    def post(
+        self,
+        url: str,
+        *,
+        json: object | None = None,
+        headers: dict | None = None,
+        timeout: float | None = None,
+    ) -> httpx.Response:
+        """POST con cuerpo JSON (p. ej. multi-query de Algolia)."""
+        return self.request("POST", url, json=json, headers=headers, timeout=timeout)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict | None = None,
+        json: object | None = None,
+        headers: dict | None = None,
+        timeout: float | None = None,
+    ) -> httpx.Response:
+        """Petición genérica a través del pool compartido (base de get y post)."""
+        host = urlsplit(url).netloc.lower()
+        for attempt in range(THROTTLE_RETRIES + 1):
+            with self._host_slot(host):
+                if self.limiter is not None:
+                    self.limiter.acquire(host)
+                response = self._client.request(
+                    method,
+                    url,
+                    params=params,
+                    json=json,
+                    headers=headers,
+                    timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+                    extensions={"trace": self._trace},
+                )
+            pause = self._throttle_pause(response, attempt)
+            if pause is None or attempt == THROTTLE_RETRIES:
+                return response
+            logger.info("%s respondió %d; reintento en %.1fs", host, response.status_code, pause)
+            response.close()
+            if self.limiter is not None:
+                self.limiter.pause(host, pause)
+            else:
+                time.sleep(pause)
+        return response
+
+    @contextmanager
+    def stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict | None = None,
+        headers: dict | None = None,
+        timeout: float | None = None,
+    ) -> Iterator[httpx.Response]:
+        """
+        Como request() pero sin leer el cuerpo: el llamador lo consume con iter_bytes()
+        dentro del with (el hueco del host se mantiene hasta salir).
+        """
+        host = urlsplit(url).netloc.lower()
+        for attempt in range(THROTTLE_RETRIES + 1):
+            with self._host_slot(host):
+                if self.limiter is not None:
+                    self.limiter.acquire(host)
+                with self._client.stream(
+                    method,
+                    url,
+                    params=params,
+                    headers=headers,
+                    timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+                    extensions={"trace": self._trace},
+                ) as response:
+                    pause = self._throttle_pause(response, attempt)
+                    if pause is None or attempt == THROTTLE_RETRIES:
+                        yield response
+                        return
+            logger.info("%s respondió %d; reintento en %.1fs", host, response.status_code, pause)
+            if self.limiter is not None:
+                self.limiter.pause(host, pause)
+            else:
+                time.sleep(pause)
+
+    def _throttle_pause(self, response: httpx.Response, attempt: int) -> float | None:
+        """Segundos a esperar si la respuesta pide frenar; None si no hay que reintentar."""
+        if response.status_code not in (429, 503):
+            return None
+        pause = retry_after_seconds(response.headers.get("retry-after"))
+        if pause is None:
+            if response.status_code == 503:
+                return None
+            pause = DEFAULT_THROTTLE_PAUSE * (attempt + 1)
+        return pause if pause <= self._max_retry_after else None
+
+    def close(self) -> None:
+        self._client.close()
+
+    @contextmanager
+    def _host_slot(self, host: str):
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                limit = self.limiter.concurrency(host) if self.limiter is not None else None
+                slot = self._host_slots[host] = threading.BoundedSemaphore(
+                    limit or self._max_per_host
+                )
+            self._stats.requests += 1
+        with slot:
+            yield
+
+    def _trace(self, event_name: str, info: dict) -> None:
+        # httpcore solo emite connect_tcp cuando abre una conexión nueva.
+        if event_name == "connection.connect_tcp.complete":
+            with self._lock:
+                self._stats.connections_opened += 1
+
+
+def _h2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+_default_session: HttpSession | None = None
+_default_lock = threading.Lock()
+
+
+def get_session() -> HttpSession:
+    """Sesión compartida del proceso; se crea con valores por defecto si nadie la configuró."""
+    global _default_session
+    with _default_lock:
+        if _default_session is None:
+            _default_session = HttpSession()
+        return _default_session
+
+
+def configure_session(config: FetchConfig | None = None) -> HttpSession:
+    """(Re)crea la sesión compartida con los parámetros de `fetch` en sources.yaml."""
+    global _default_session
+    with _default_lock:
+        if _default_session is not None:
+            _default_session.close()
+        _default_session = HttpSession.from_config(config or FetchConfig())
+        return _default_session
+
+
+def close_session() -> None:
+    """Cierra la sesión compartida (fin de la ejecución)."""
+    global _default_session
+    with _default_lock:
+        if _default_session is not None:
+            _default_session.close()
+            _default_session = None
@@ -1,63 +1,286 @@
 """Adaptador Hacker News vía Algolia API; queries y límite desde sources.yaml (T3.3)."""
 
+import json
 import logging
-
-import httpx
+import os
+import time
+from urllib.parse import urlencode
 
 from digest.config.sources import HackerNewsConfig
 from digest.domain.models import Item
 
+from .cache_store import JsonCache
+from .concurrency import Task, run_tasks
+from .http_session import get_session
+
 logger = logging.getLogger(__name__)
 
 ALGOLIA_HN_SEARCH = "https://hn.algolia.com/api/v1/search"
-DEFAULT_UA = "DigestBot/1.0 (weekly AI/ML digest)"
 
+# Modo incremental: ventana inicial sin marca de agua (en días completos, así la clave
+# de caché es estable durante el día) y tope de páginas por query si limit > 100.
+BOOTSTRAP_DAYS = 7
+MAX_PAGES = 5
+
+# Modo batch: endpoint multi-query de Algolia (todas las queries en un solo POST).
+# App id e índice de HN Search; la search key se lee de HN_ALGOLIA_API_KEY.
+ALGOLIA_MULTI_QUERY = "https://{app_id}-dsn.algolia.net/1/indexes/*/queries"
+HN_ALGOLIA_APP_ID = "UJ5WYC0L7X"
+HN_ALGOLIA_INDEX = "Item_dev"
 
-def fetch_hacker_news_items(config: HackerNewsConfig, timeout: float = 15.0) -> list[Item]:
+
+def fetch_hacker_news_items(
+    config: HackerNewsConfig,
+    timeout: float = 15.0,
+    *,
+    max_workers: int = 8,
+    source_deadline: float | None = None,
+    cache: JsonCache | None = None,
+    watermarks: JsonCache | None = None,
+) -> list[Item]:
     """
     Obtiene ítems de Hacker News usando la API de Algolia.
 
-    Busca por cada query en config.queries, con límite config.limit (por query
-    o total según implementación). Devuelve ítems con source="hacker_news".
-    Errores de red/API se capturan y se devuelve lista vacía (no detener flujo).
+    Lanza todas las queries de config.queries en paralelo (hasta max_workers), o en
+    una sola petición multi-query con config.batch, y une resultados intercalando
+    queries (round-robin), sin duplicados y hasta config.limit.
+    Devuelve ítems con source="hacker_news". Errores de red/API por query se
+    capturan y se sigue con el resto (no detener flujo). Con cache, las búsquedas
+    recientes (dentro del TTL) no vuelven a llamar a la API. Con config.incremental
+    solo se piden historias posteriores a la marca de agua de cada query.
     """
+    results = run_tasks(
+        hacker_news_tasks(config, timeout, cache=cache, watermarks=watermarks),
+        max_workers=max_workers,
+        task_deadline=source_deadline,
+    )
+    return merge_hacker_news_results(config, results)
+
+
+def hacker_news_tasks(
+    config: HackerNewsConfig,
+    timeout: float,
+    *,
+    cache: JsonCache | None = None,
+    watermarks: JsonCache | None = None,
+) -> list[Task[list[Item]]]:
+    """Una tarea por query; cada una pide su cuota proporcional de config.limit."""
     if not config.queries or config.limit <= 0:
         return []
+    limit_per_query = max(1, (config.limit + len(config.queries) - 1) // len(config.queries))
+
+    if config.batch and config.incremental:
+        logger.warning(
+            "Hacker News: batch no admite modo incremental; se usa una petición por query"
+        )
+    elif config.batch:
+        if os.environ.get("HN_ALGOLIA_API_KEY"):
+            return [
+                Task(
+                    label=f"Hacker News batch ({len(config.queries)} queries)",
+                    fn=lambda: _search_hn_batch(
+                        config.queries, limit_per_query, timeout, cache=cache
+                    ),
+                )
+            ]
+        logger.warning("HN_ALGOLIA_API_KEY no definida; Hacker News usa una petición por query")
+
+    def _task(query: str) -> list[Item]:
+        if config.incremental:
+            return _search_hn_since(
+                query, limit_per_query, timeout, watermarks=watermarks, cache=cache
+            )
+        return _search_hn(query, limit_per_query, timeout, cache=cache)
+
+    return [
+        Task(label=f"Hacker News query {query!r}", fn=lambda query=query: _task(query))
+        for query in config.queries
+    ]
 
+
+def merge_hacker_news_results(
+    config: HackerNewsConfig, results: list[list[Item] | None]
+) -> list[Item]:
+    """
+    Intercala los hits de cada query (round-robin por posición), deduplicando por URL
+    y cortando en config.limit: ninguna query se queda sin cupo por ir la última.
+    """
+    return _interleave([batch or [] for batch in results], config.limit)
+
+
+def _interleave(batches: list[list[Item]], limit: int) -> list[Item]:
     seen_urls: set[str] = set()
     items: list[Item] = []
-    limit_per_query = max(1, (config.limit + len(config.queries) - 1) // len(config.queries))
+    for position in range(max((len(b) for b in batches), default=0)):
+        for batch in batches:
+            if len(items) >= limit:
+                return items
+            if position < len(batch) and batch[position].url not in seen_urls:
+                seen_urls.add(batch[position].url)
+                items.append(batch[position])
+    return items
 
-    for query in config.queries:
-        if len(items) >= config.limit:
-            break
-        try:
-            batch = _search_hn(query, limit_per_query, timeout)
-            for it in batch:
-                if it.url not in seen_urls and len(items) < config.limit:
-                    seen_urls.add(it.url)
-                    items.append(it)
-        except Exception as e:  # noqa: BLE001
-            logger.warning("Hacker News query %r falló: %s", query, e)
-
-    return items[: config.limit]
 
+def _search_hn(
+    query: str,
+    hits_per_page: int,
+    timeout: float,
+    *,
+    cache: JsonCache | None = None,
+) -> list[Item]:
+    """
+    Una petición a Algolia HN search (por relevancia); devuelve list[Item].
 
-def _search_hn(query: str, hits_per_page: int, timeout: float) -> list[Item]:
-    """Una petición a Algolia HN search; devuelve list[Item]."""
+    Con cache (TTL), la respuesta se reutiliza para la misma (query, tags, hitsPerPage)
+    sin volver a llamar a la API.
+    """
     params = {
         "query": query,
         "tags": "story",
         "hitsPerPage": min(hits_per_page, 100),
     }
-    headers = {"User-Agent": DEFAULT_UA}
-    with httpx.Client(timeout=timeout, headers=headers) as client:
-        response = client.get(ALGOLIA_HN_SEARCH, params=params)
+    hits, _ = _algolia_search(ALGOLIA_HN_SEARCH, params, timeout, cache=cache)
+    return _hits_to_items(hits)
+
+
+def _search_hn_since(
+    query: str,
+    limit: int,
+    timeout: float,
+    *,
+    watermarks: JsonCache | None = None,
+    cache: JsonCache | None = None,
+) -> list[Item]:
+    """
+    Modo incremental: solo historias más nuevas que la marca de agua de la query.
+
+    Usa search (por relevancia, como el modo normal) con numericFilters=created_at_i>W:
+    de toda la ventana se quedan las `limit` más relevantes (páginas de hasta 100, máx.
+    MAX_PAGES). Sin marca previa se parte de los últimos BOOTSTRAP_DAYS días, contados
+    desde el inicio del día (UTC). La marca avanza en memoria hasta el created_at_i más
+    reciente devuelto: lo anterior ya compitió por relevancia y lo posterior vuelve a
+    competir en la siguiente ejecución. Quien creó `watermarks` decide cuándo persistirla.
+    """
+    since = watermarks.peek(query) if watermarks is not None else None
+    if not isinstance(since, int):
+        since = (int(time.time()) // 86400 - BOOTSTRAP_DAYS) * 86400
+
+    hits: list[dict] = []
+    page = 0
+    while len(hits) < limit and page < MAX_PAGES:
+        params = {
+            "query": query,
+            "tags": "story",
+            "numericFilters": f"created_at_i>{since}",
+            "hitsPerPage": min(limit, 100),
+            "page": page,
+        }
+        batch, nb_pages = _algolia_search(ALGOLIA_HN_SEARCH, params, timeout, cache=cache)
+        hits.extend(batch)
+        page += 1
+        if not batch or page >= nb_pages:
+            break
+    hits = hits[:limit]
+
+    newest = max(
+        (h["created_at_i"] for h in hits if isinstance(h.get("created_at_i"), int)),
+        default=None,
+    )
+    if watermarks is not None and newest is not None and newest > since:
+        watermarks.set(query, newest)
+    return _hits_to_items(hits)
+
+
+def _search_hn_batch(
+    queries: list[str],
+    hits_per_query: int,
+    timeout: float,
+    *,
+    endpoint: str | None = None,
+    api_key: str | None = None,
+    cache: JsonCache | None = None,
+) -> list[Item]:
+    """
+    Todas las queries en un único POST al endpoint multi-query de Algolia.
+
+    La latencia no crece con el número de queries. Es la API nativa de Algolia, no el
+    wrapper de hn.algolia.com: el filtro de historias va en tagFilters, no en tags. Los
+    hits se unen localmente intercalando queries y deduplicando por URL (mismo criterio
+    que el modo por query).
+    endpoint/api_key por defecto: HN_ALGOLIA_MULTI_URL / HN_ALGOLIA_API_KEY.
+    """
+    app_id = os.environ.get("HN_ALGOLIA_APP_ID", HN_ALGOLIA_APP_ID)
+    endpoint = (
+        endpoint
+        or os.environ.get("HN_ALGOLIA_MULTI_URL")
+        or ALGOLIA_MULTI_QUERY.format(app_id=app_id.lower())
+    )
+    api_key = api_key or os.environ.get("HN_ALGOLIA_API_KEY") or ""
+    index = os.environ.get("HN_ALGOLIA_INDEX", HN_ALGOLIA_INDEX)
+    body = {
+        "requests": [
+            {
+                "indexName": index,
+                "params": urlencode(
+                    {"query": q, "tagFilters": "story", "hitsPerPage": min(hits_per_query, 100)}
+                ),
+            }
+            for q in queries
+        ]
+    }
+
+    key = json.dumps([endpoint, body], ensure_ascii=False)
+    per_query = cache.get(key) if cache is not None else None
+    if per_query is None:
+        response = get_session().post(
+            endpoint,
+            json=body,
+            headers={"X-Algolia-Application-Id": app_id, "X-Algolia-API-Key": api_key},
+            timeout=timeout,
+        )
         response.raise_for_status()
-        data = response.json()
+        results = response.json().get("results") or []
+        per_query = [[_compact_hit(h) for h in (r.get("hits") or [])] for r in results]
+        if cache is not None:
+            cache.set(key, per_query)
+    batches = [_hits_to_items(hits) for hits in per_query]
+    return _interleave(batches, hits_per_query * len(queries))
+
+
+def _algolia_search(
+    endpoint: str,
+    params: dict,
+    timeout: float,
+    *,
+    cache: JsonCache | None = None,
+) -> tuple[list[dict], int]:
+    """GET a Algolia (o su respuesta en caché); devuelve hits compactos y nbPages."""
+    key = json.dumps([endpoint, params], ensure_ascii=False)
+    cached = cache.get(key) if cache is not None else None
+    if cached is not None:
+        return cached["hits"], cached["nb_pages"]
+    response = get_session().get(endpoint, params=params, timeout=timeout)
+    response.raise_for_status()
+    data = response.json()
+    hits = [_compact_hit(hit) for hit in data.get("hits") or []]
+    nb_pages = data.get("nbPages") if isinstance(data.get("nbPages"), int) else 1
+    if cache is not None:
+        cache.set(key, {"hits": hits, "nb_pages": nb_pages})
+    return hits, nb_pages
+
+
+# Campos de cada hit que usa el adaptador (lo único que se guarda en caché).
+_HIT_FIELDS = ("title", "url", "objectID", "created_at", "created_at_i")
+
+
+def _compact_hit(hit: dict) -> dict:
+    return {k: hit.get(k) for k in _HIT_FIELDS if hit.get(k) is not None}
+
 
+def _hits_to_items(hits: list[dict]) -> list[Item]:
+    """Convierte hits de Algolia en Item; sin URL externa se enlaza al item en HN."""
     out: list[Item] = []
-    for hit in data.get("hits") or []:
+    for hit in hits:
         title = (hit.get("title") or "").strip()
         if not title:
             continue
@@ -1,106 +1,243 @@
 """Adaptador Reddit: RSS de subreddits; subreddits y límite desde config (T3.4)."""
 
 import logging
+import re
 from urllib.parse import quote_plus
 
-import feedparser
 import httpx
 
 from digest.config.sources import RedditConfig
 from digest.domain.models import Item
 
+from .concurrency import Task, run_tasks
+from .feed_cache import FeedCache
+from .feed_parser import FeedEntry
+from .feed_stream import DEFAULT_MAX_FEED_BYTES, FeedPayload, download_feed, parse_payload
+from .parse_pool import DEFAULT_MIN_SOURCES, ParsePool, parse_pool_for
+
 logger = logging.getLogger(__name__)
 
 REDDIT_RSS_BASE = "https://www.reddit.com/r/{subreddit}/.rss"
-DEFAULT_UA = "DigestBot/1.0 (weekly AI/ML digest)"
-
-
-def fetch_reddit_items(config: RedditConfig, timeout: float = 15.0) -> list[Item]:
+# Máximo de posts por petición que acepta Reddit en listados.
+REDDIT_MAX_LIMIT = 100
+# Modo combinado: tope de páginas (cursor `after`) por ejecución.
+COMBINED_MAX_PAGES = 5
+
+_SUBREDDIT_IN_LINK = re.compile(r"reddit\.com/r/([^/]+)/", re.IGNORECASE)
+
+
+def fetch_reddit_items(
+    config: RedditConfig,
+    timeout: float = 15.0,
+    *,
+    max_workers: int = 8,
+    source_deadline: float | None = None,
+    cache: FeedCache | None = None,
+    max_bytes: int = DEFAULT_MAX_FEED_BYTES,
+    parse_workers: int = 0,
+    parse_min_sources: int = DEFAULT_MIN_SOURCES,
+) -> list[Item]:
     """
     Obtiene ítems de Reddit vía RSS de cada subreddit.
 
-    Por cada subreddit hace GET a .rss con límite; filtra posts con enlace
-    externo (no reddit.com). source="reddit". Errores por subreddit no
-    detienen el flujo (RNF-06).
+    Por cada subreddit hace GET a .rss con límite (en paralelo, hasta max_workers),
+    o con config.combined un único listado r/a+b+c paginado; incluye enlaces
+    externos y self-posts. source="reddit". Errores o deadline superado en un
+    subreddit no detienen el flujo (RNF-06). Con parse_workers > 0 y al menos
+    parse_min_sources subreddits, el parseo va a un pool de procesos.
+    """
+    n_feeds = 1 if config.combined else len(config.subreddits)
+    with parse_pool_for(n_feeds, parse_workers, min_sources=parse_min_sources) as pool:
+        results = run_tasks(
+            reddit_tasks(config, timeout, cache=cache, pool=pool, max_bytes=max_bytes),
+            max_workers=max_workers,
+            task_deadline=source_deadline,
+        )
+    return merge_reddit_results(results)
+
+
+def reddit_tasks(
+    config: RedditConfig,
+    timeout: float,
+    *,
+    cache: FeedCache | None = None,
+    pool: ParsePool | None = None,
+    max_bytes: int = DEFAULT_MAX_FEED_BYTES,
+) -> list[Task[list[Item]]]:
+    """
+    Una tarea por subreddit válido (o una sola en modo combinado); lista vacía si
+    la config no pide nada.
     """
     if not config.subreddits or config.limit_per_sub <= 0:
         return []
+    subs = [
+        s for s in ((s or "").strip() for s in config.subreddits) if s and not s.startswith("/")
+    ]
+    if config.combined and subs:
+        return [
+            Task(
+                label=f"Reddit r/{'+'.join(subs)}",
+                fn=lambda: _fetch_combined_rss(
+                    subs, config.limit_per_sub, timeout, pool=pool, max_bytes=max_bytes
+                ),
+            )
+        ]
+    tasks: list[Task[list[Item]]] = []
+    for sub in subs:
+        tasks.append(
+            Task(
+                label=f"Reddit r/{sub}",
+                fn=lambda sub=sub: _fetch_subreddit_rss(
+                    sub,
+                    config.limit_per_sub,
+                    timeout,
+                    cache=cache,
+                    pool=pool,
+                    max_bytes=max_bytes,
+                ),
+            )
+        )
+    return tasks
 
-    items: list[Item] = []
-    for sub in config.subreddits:
-        sub = (sub or "").strip()
-        if not sub or sub.startswith("/"):
-            continue
-        try:
-            batch = _fetch_subreddit_rss(sub, config.limit_per_sub, timeout)
-            items.extend(batch)
-        except Exception as e:  # noqa: BLE001
-            logger.warning("Reddit r/%s falló: %s", sub, e)
 
-    return items
+def merge_reddit_results(results: list[list[Item] | None]) -> list[Item]:
+    """Concatena los posts de cada subreddit en el orden de la config."""
+    return [item for batch in results if batch for item in batch]
 
 
-def _fetch_subreddit_rss(subreddit: str, limit: int, timeout: float) -> list[Item]:
-    """Obtiene posts del subreddit vía RSS: enlaces externos y self-posts (reddit.com)."""
-    url = REDDIT_RSS_BASE.format(subreddit=quote_plus(subreddit))
-    headers = {"User-Agent": DEFAULT_UA}
-    with httpx.Client(timeout=timeout, headers=headers) as client:
-        response = client.get(url, params={"limit": min(limit, 25)})
-        response.raise_for_status()
-        text = response.text
+def _fetch_subreddit_rss(
+    subreddit: str,
+    limit: int,
+    timeout: float,
+    *,
+    cache: FeedCache | None = None,
+    pool: ParsePool | None = None,
+    max_bytes: int = DEFAULT_MAX_FEED_BYTES,
+) -> list[Item]:
+    """
+    Obtiene posts del subreddit vía RSS: enlaces externos y self-posts (reddit.com).
+
+    Descarga en streaming y deja de leer al completar `limit` entradas (o max_bytes),
+    así que solo se parsea ese prefijo. Con cache hace GET condicional
+    (clave = URL con límite); un 304 reutiliza los ítems.
+    """
+    url = str(
+        httpx.URL(
+            REDDIT_RSS_BASE.format(subreddit=quote_plus(subreddit)),
+            params={"limit": min(limit, REDDIT_MAX_LIMIT)},
+        )
+    )
+    headers = cache.conditional_headers(url) if cache else {}
+    payload = download_feed(
+        url,
+        timeout=timeout,
+        headers=headers or None,
+        max_entries=limit,
+        max_bytes=max_bytes,
+        extract=pool is None,
+    )
+    response = payload.response
+    if response.status_code == 304 and cache is not None:
+        cached = cache.reuse(url)
+        if cached is not None:
+            return cached
+    response.raise_for_status()
 
-    parsed = feedparser.parse(text)
     out: list[Item] = []
 
-    for entry in parsed.entries:
-        link = _get_entry_link(entry)
-        if not link:
+    for entry in _parse(payload, pool, limit):
+        if not entry.link:
             continue
         # Incluir tanto enlaces externos como self-posts (link a reddit.com)
-        title = (entry.get("title") or "").strip() or "(sin título)"
-        date_str = _get_entry_date(entry)
         out.append(
             Item(
-                title=title,
-                url=link,
+                title=entry.title or "(sin título)",
+                url=entry.link,
                 source="reddit",
                 description=None,
-                date=date_str,
+                date=entry.date,
             )
         )
         if len(out) >= limit:
             break
 
+    if cache is not None:
+        cache.store(url, response, out, size=len(payload.content))
     return out
 
 
-def _get_entry_link(entry) -> str | None:
-    """Extrae la URL del enlace externo si existe; si no, link del post."""
-    link = getattr(entry, "link", None)
-    if link and isinstance(link, str) and link.strip().startswith("http"):
-        return link.strip()
-    links = getattr(entry, "links", None)
-    if links:
-        for ln in links:
-            href = getattr(ln, "href", None)
-            if href:
-                h = str(href).strip()
-                if h.startswith("http"):
-                    return h
-    return None
-
-
-def _get_entry_date(entry) -> str | None:
-    """Extrae fecha publicada si existe."""
-    val = getattr(entry, "published_parsed", None)
-    if val:
-        try:
-            import time
-
-            return time.strftime("%Y-%m-%d", val)
-        except Exception:
-            pass
-    published = getattr(entry, "published", None)
-    if published and isinstance(published, str):
-        return published.strip()
-    return None
+def _fetch_combined_rss(
+    subreddits: list[str],
+    limit_per_sub: int,
+    timeout: float,
+    *,
+    pool: ParsePool | None = None,
+    max_bytes: int = DEFAULT_MAX_FEED_BYTES,
+) -> list[Item]:
+    """
+    Un solo listado r/a+b+c para todos los subreddits, paginado con el cursor `after`.
+
+    Cada página es completa (100 entradas): el listado mezcla subreddits, así que pedir
+    solo lo que falta en total dejaría sin posts a los menos activos. Las entradas se
+    reparten por subreddit (categoría del entry o /r/<sub>/ del enlace) y cada lista se
+    corta en limit_per_sub. Se para cuando todos están llenos, el listado se agota
+    o se llega a COMBINED_MAX_PAGES. Devuelve los posts agrupados en el orden de la config.
+    """
+    wanted = {s.lower(): s for s in subreddits}
+    buckets: dict[str, list[Item]] = {s.lower(): [] for s in subreddits}
+    path = "+".join(quote_plus(s) for s in subreddits)
+    after: str | None = None
+
+    for _ in range(COMBINED_MAX_PAGES):
+        if all(len(b) >= limit_per_sub for b in buckets.values()):
+            break
+        params = {"limit": REDDIT_MAX_LIMIT}
+        if after:
+            params["after"] = after
+        payload = download_feed(
+            REDDIT_RSS_BASE.format(subreddit=path),
+            params=params,
+            timeout=timeout,
+            max_entries=params["limit"],
+            max_bytes=max_bytes,
+            extract=pool is None,
+        )
+        payload.response.raise_for_status()
+        entries = _parse(payload, pool, params["limit"])
+        if not entries:
+            break
+
+        for entry in entries:
+            sub = _entry_subreddit(entry)
+            bucket = buckets.get(sub.lower()) if sub else None
+            if bucket is None or len(bucket) >= limit_per_sub:
+                continue
+            if not entry.link:
+                continue
+            bucket.append(
+                Item(
+                    title=entry.title or "(sin título)",
+                    url=entry.link,
+                    source="reddit",
+                    description=None,
+                    date=entry.date,
+                )
+            )
+        after = entries[-1].id
+        if not after:
+            break
+
+    return [item for key in wanted for item in buckets[key]]
+
+
+def _parse(payload: FeedPayload, pool: ParsePool | None, limit: int) -> list[FeedEntry]:
+    """Entradas del listado: en el hilo actual o, con pool, en otro proceso."""
+    return pool.parse(payload, max_entries=limit) if pool else parse_payload(payload)
+
+
+def _entry_subreddit(entry: FeedEntry) -> str | None:
+    """Subreddit del entry: término de categoría (Atom de Reddit) o /r/<sub>/ del enlace."""
+    if entry.categories:
+        return entry.categories[0].removeprefix("r/")
+    match = _SUBREDDIT_IN_LINK.search(entry.link or "")
+    return match.group(1) if match else None
@@ -1,105 +1,132 @@
 """Adaptador RSS/Atom: GET a URLs de sources.yaml, parsear feed, devolver list[Item] (T3.1)."""
 
 import logging
-import feedparser
-import httpx
 
 from digest.config.sources import RssSource
 from digest.domain.models import Item
 
+from .concurrency import Task, run_tasks
+from .feed_cache import FeedCache
+from .feed_stream import DEFAULT_MAX_FEED_BYTES, download_feed, parse_payload
+from .parse_pool import DEFAULT_MIN_SOURCES, ParsePool, parse_pool_for
+
 logger = logging.getLogger(__name__)
 
 
-def fetch_rss_items(sources: list[RssSource], timeout: float = 15.0) -> list[Item]:
+def fetch_rss_items(
+    sources: list[RssSource],
+    timeout: float = 15.0,
+    *,
+    max_workers: int = 8,
+    source_deadline: float | None = None,
+    cache: FeedCache | None = None,
+    max_items: int | None = None,
+    max_bytes: int = DEFAULT_MAX_FEED_BYTES,
+    parse_workers: int = 0,
+    parse_min_sources: int = DEFAULT_MIN_SOURCES,
+) -> list[Item]:
     """
     Obtiene ítems de cada fuente RSS/Atom configurada.
 
-    Por cada feed: GET a la URL, parseo con feedparser; si un feed falla
-    se registra el error y se sigue con el resto (RNF-06).
+    Los feeds se descargan en paralelo (hasta max_workers a la vez) y en streaming:
+    se deja de leer al completar max_items entradas o al pasar max_bytes. Parser nativo
+    (xml.etree) con feedparser como respaldo si el feed está mal formado; con
+    parse_workers > 0 y al menos parse_min_sources feeds, en un pool de procesos. Con
+    cache, GET condicional: un 304 reutiliza los ítems ya parseados.
+    Si un feed falla o supera source_deadline se registra el error y se sigue
+    con el resto (RNF-06).
     Devuelve ítems con source="rss"; título, URL y descripción/fecha si existen.
     """
-    items: list[Item] = []
-    for src in sources:
-        try:
-            feed_items = _fetch_one_feed(src.url, timeout)
-            for entry in feed_items:
-                items.append(entry)
-        except Exception as e:  # noqa: BLE001
-            logger.warning("RSS feed falló %s: %s", src.url, e)
-    return items
+    with parse_pool_for(len(sources), parse_workers, min_sources=parse_min_sources) as pool:
+        results = run_tasks(
+            rss_tasks(
+                sources,
+                timeout,
+                cache=cache,
+                pool=pool,
+                max_items=max_items,
+                max_bytes=max_bytes,
+            ),
+            max_workers=max_workers,
+            task_deadline=source_deadline,
+        )
+    return merge_rss_results(results)
+
+
+def rss_tasks(
+    sources: list[RssSource],
+    timeout: float,
+    *,
+    cache: FeedCache | None = None,
+    pool: ParsePool | None = None,
+    max_items: int | None = None,
+    max_bytes: int = DEFAULT_MAX_FEED_BYTES,
+) -> list[Task[list[Item]]]:
+    """Una tarea por feed, para ejecutarlas en el pool de fetch_all o de fetch_rss_items."""
+    return [
+        Task(
+            label=f"RSS feed {src.url}",
+            fn=lambda url=src.url: _fetch_one_feed(
+                url, timeout, cache=cache, pool=pool, max_items=max_items, max_bytes=max_bytes
+            ),
+        )
+        for src in sources
+    ]
 
 
-DEFAULT_UA = "DigestBot/1.0 (weekly AI/ML digest)"
+def merge_rss_results(results: list[list[Item] | None]) -> list[Item]:
+    """Concatena los ítems de cada feed en el orden de sources.yaml (None = feed fallido)."""
+    return [item for batch in results if batch for item in batch]
 
 
-def _fetch_one_feed(url: str, timeout: float) -> list[Item]:
-    """Hace GET a una URL de feed, parsea y devuelve lista de Item."""
-    headers = {"User-Agent": DEFAULT_UA}
-    with httpx.Client(timeout=timeout, headers=headers) as client:
-        response = client.get(url)
-        response.raise_for_status()
-        text = response.text
+def _fetch_one_feed(
+    url: str,
+    timeout: float,
+    *,
+    cache: FeedCache | None = None,
+    pool: ParsePool | None = None,
+    max_items: int | None = None,
+    max_bytes: int = DEFAULT_MAX_FEED_BYTES,
+) -> list[Item]:
+    """
+    Hace GET en streaming a una URL de feed (sesión compartida), parsea y devuelve lista de Item.
 
-    parsed = feedparser.parse(text)
+    Las entradas se extraen a medida que llegan y se deja de descargar en cuanto hay
+    max_items completas (o max_bytes leídos). Con pool, el hilo solo cuenta entradas y
+    el parseo va a otro proceso. Con cache envía If-None-Match / If-Modified-Since;
+    ante 304 devuelve los ítems guardados sin parsear.
+    """
+    headers = cache.conditional_headers(url) if cache else {}
+    payload = download_feed(
+        url,
+        timeout=timeout,
+        headers=headers or None,
+        max_entries=max_items,
+        max_bytes=max_bytes,
+        extract=pool is None,
+    )
+    response = payload.response
+    if response.status_code == 304 and cache is not None:
+        cached = cache.reuse(url)
+        if cached is not None:
+            return cached
+    response.raise_for_status()
+
+    entries = pool.parse(payload, max_entries=max_items) if pool else parse_payload(payload)
     out: list[Item] = []
 
-    for entry in parsed.entries:
-        link = _get_entry_link(entry)
-        if not link:
+    for entry in entries[:max_items] if max_items else entries:
+        if not entry.link:
             continue
-        title = (entry.get("title") or "").strip() or "(sin título)"
-        description = _get_entry_description(entry)
-        date_str = _get_entry_date(entry)
         out.append(
             Item(
-                title=title,
-                url=link,
+                title=entry.title or "(sin título)",
+                url=entry.link,
                 source="rss",
-                description=description or None,
-                date=date_str or None,
+                description=entry.description or None,
+                date=entry.date or None,
             )
         )
+    if cache is not None:
+        cache.store(url, response, out, size=len(payload.content))
     return out
-
-
-def _get_entry_link(entry) -> str | None:
-    """Extrae la URL canónica del entry (link o enlaces)."""
-    link = getattr(entry, "link", None)
-    if link and isinstance(link, str) and link.strip().startswith("http"):
-        return link.strip()
-    links = getattr(entry, "links", None)
-    if links:
-        for ln in links:
-            href = getattr(ln, "href", None)
-            if href and str(href).strip().startswith("http"):
-                return str(href).strip()
-    return None
-
-
-def _get_entry_description(entry) -> str | None:
-    """Extrae descripción/snippet del entry."""
-    for attr in ("summary", "description", "content"):
-        val = getattr(entry, attr, None)
-        if val:
-            if hasattr(val, "value"):
-                return (val.value or "").strip() or None
-            if isinstance(val, str) and val.strip():
-                return val.strip()
-    return None
-
-
-def _get_entry_date(entry) -> str | None:
-    """Extrae fecha publicada si existe (ISO o legible)."""
-    for attr in ("published", "updated", "created"):
-        val = getattr(entry, f"{attr}_parsed", None)
-        if val:
-            try:
-                import time
-
-                return time.strftime("%Y-%m-%d", val)
-            except Exception:
-                pass
-    published = getattr(entry, "published", None)
-    if published and isinstance(published, str):
-        return published.strip()
-    return None
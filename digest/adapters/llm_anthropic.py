@@ -2,35 +2,74 @@
 
 import os
 
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic, DefaultAsyncHttpxClient, DefaultHttpxClient
 
-from digest.domain.llm_port import ItemWithSummary
+from digest.domain.llm_port import ItemWithSummary, SummaryRequest
+
+from .llm_openai import MAX_CONNECTIONS, REQUEST_TIMEOUT, pool_limits
+from .llm_prompts import (
+    SUMMARY_MAX_TOKENS,
+    parse_order,
+    rank_prompt,
+    summarize_in_rounds,
+    summarize_in_rounds_async,
+    summary_prompt,
+)
+
+RANK_MAX_TOKENS = 150
 
 
 class AnthropicLLM:
     """Implementación del puerto LLM usando la API de Anthropic."""
 
-    def __init__(self, *, api_key: str | None = None, model: str | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        api_key: str | None = None,
+        model: str | None = None,
+        timeout: float = REQUEST_TIMEOUT,
+        max_connections: int = MAX_CONNECTIONS,
+    ) -> None:
         self._api_key = api_key or os.environ.get("LLM_API_KEY")
         # Permitimos reutilizar LLM_MODEL; si no se define, usamos un modelo razonable por defecto.
         self._model = model or os.environ.get("LLM_MODEL", "claude-3-haiku-20240307")
         if not self._api_key:
             raise ValueError("LLM_API_KEY no está definida")
 
-        self._client = Anthropic(api_key=self._api_key)
+        self._client = Anthropic(
+            api_key=self._api_key,
+            timeout=timeout,
+            http_client=DefaultHttpxClient(limits=pool_limits(max_connections), timeout=timeout),
+        )
+
+    @property
+    def model(self) -> str:
+        return self._model
 
     def summarize(self, title: str, snippet: str) -> str:
         """Genera un mini resumen en español (2-3 líneas)."""
-        prompt = f"""Resume en español en 2 o 3 líneas el siguiente artículo. Solo devuelve el resumen, sin introducción ni título.
+        return self._complete(summary_prompt(title, snippet), SUMMARY_MAX_TOKENS)
 
-Título: {title}
+    def summarize_batch(self, requests: list[SummaryRequest]) -> dict[str, str]:
+        """Varios resúmenes en una petición (JSON por id); los ids que falten se piden otra vez."""
+        if not requests:
+            return {}
+        return summarize_in_rounds(requests, self._complete)
 
-Fragmento o descripción:
-{snippet or "(sin descripción)"}"""
+    def rank(self, items: list[ItemWithSummary], top_n: int = 5) -> list[ItemWithSummary]:
+        """Ordena por relevancia para alguien interesado en AI/ML/DS y devuelve top_n."""
+        if not items:
+            return []
+        if len(items) <= top_n:
+            return list(items)
 
+        raw = self._complete(rank_prompt(items), RANK_MAX_TOKENS)
+        return [items[i] for i in parse_order(raw, len(items))[:top_n]]
+
+    def _complete(self, prompt: str, max_tokens: int) -> str:
         resp = self._client.messages.create(
             model=self._model,
-            max_tokens=200,
+            max_tokens=max_tokens,
             messages=[
                 {
                     "role": "user",
@@ -38,58 +77,70 @@ Fragmento o descripción:
                 }
             ],
         )
-        # La API de Anthropic devuelve una lista de bloques de contenido.
-        text = "".join(
-            block.text for block in resp.content if getattr(block, "type", None) == "text"
+        return _text(resp)
+
+
+class AsyncAnthropicLLM:
+    """Puerto LLM asíncrono (AsyncLLMPort) con el cliente AsyncAnthropic."""
+
+    def __init__(
+        self,
+        *,
+        api_key: str | None = None,
+        model: str | None = None,
+        timeout: float = REQUEST_TIMEOUT,
+        max_connections: int = MAX_CONNECTIONS,
+    ) -> None:
+        self._api_key = api_key or os.environ.get("LLM_API_KEY")
+        self._model = model or os.environ.get("LLM_MODEL", "claude-3-haiku-20240307")
+        if not self._api_key:
+            raise ValueError("LLM_API_KEY no está definida")
+
+        self._client = AsyncAnthropic(
+            api_key=self._api_key,
+            timeout=timeout,
+            http_client=DefaultAsyncHttpxClient(
+                limits=pool_limits(max_connections), timeout=timeout
+            ),
         )
-        return text.strip()
 
-    def rank(self, items: list[ItemWithSummary], top_n: int = 5) -> list[ItemWithSummary]:
+    @property
+    def model(self) -> str:
+        return self._model
+
+    async def summarize(self, title: str, snippet: str) -> str:
+        """Genera un mini resumen en español (2-3 líneas)."""
+        return await self._complete(summary_prompt(title, snippet), SUMMARY_MAX_TOKENS)
+
+    async def summarize_batch(self, requests: list[SummaryRequest]) -> dict[str, str]:
+        """Varios resúmenes en una petición (JSON por id); los ids que falten se piden otra vez."""
+        if not requests:
+            return {}
+        return await summarize_in_rounds_async(requests, self._complete)
+
+    async def rank(self, items: list[ItemWithSummary], top_n: int = 5) -> list[ItemWithSummary]:
         """Ordena por relevancia para alguien interesado en AI/ML/DS y devuelve top_n."""
         if not items:
             return []
         if len(items) <= top_n:
             return list(items)
+        raw = await self._complete(rank_prompt(items), RANK_MAX_TOKENS)
+        return [items[i] for i in parse_order(raw, len(items))[:top_n]]
 
-        lines = []
-        for i, x in enumerate(items):
-            lines.append(
-                f"[{i}] Título: {x.item.title}\nURL: {x.item.url}\nResumen: {x.summary}\nFuente: {x.item.source}"
-            )
-        block = "\n\n".join(lines)
-
-        prompt = f"""Eres un experto en IA, aprendizaje automático y ciencia de datos. A continuación hay una lista de artículos con título, URL, resumen y fuente.
-
-Ordena los artículos del más interesante/relevante al menos (para alguien que quiere estar al día en AI/ML/DS). Responde ÚNICAMENTE con una lista de números en el orden elegido, separados por comas, por ejemplo: 2, 0, 4, 1, 3
+    async def _complete(self, prompt: str, max_tokens: int) -> str:
+        resp = await self._client.messages.create(
+            model=self._model,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}],
+        )
+        return _text(resp)
 
-Artículos:
+    async def aclose(self) -> None:
+        await self._client.close()
 
-{block}"""
 
-        resp = self._client.messages.create(
-            model=self._model,
-            max_tokens=150,
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt,
-                }
-            ],
-        )
-        raw = "".join(
-            block.text for block in resp.content if getattr(block, "type", None) == "text"
-        ).strip()
-
-        order: list[int] = []
-        for part in raw.replace(" ", "").split(","):
-            part = part.strip()
-            if part.isdigit():
-                idx = int(part)
-                if 0 <= idx < len(items) and idx not in order:
-                    order.append(idx)
-
-        for i in range(len(items)):
-            if i not in order:
-                order.append(i)
-
-        return [items[i] for i in order[:top_n]]
+def _text(resp) -> str:
+    # La API de Anthropic devuelve una lista de bloques de contenido.
+    return "".join(
+        block.text for block in resp.content if getattr(block, "type", None) == "text"
+    ).strip()
@@ -1,76 +1,178 @@
 """Adaptador LLM con OpenAI (RF-10, RF-13, RNF-03)."""
 
 import os
+import threading
 
-from digest.domain.llm_port import ItemWithSummary
+import httpx
+
+from digest.domain.llm_port import ItemWithSummary, SummaryRequest
+
+from .llm_prompts import (
+    SUMMARY_MAX_TOKENS,
+    parse_order,
+    rank_prompt,
+    summarize_in_rounds,
+    summarize_in_rounds_async,
+    summary_prompt,
+)
+
+RANK_MAX_TOKENS = 100
+
+# Cliente HTTP del SDK: tope por petición (s) y conexiones del pool.
+REQUEST_TIMEOUT = 60.0
+MAX_CONNECTIONS = 10
 
 
 class OpenAILLM:
-    """Implementación del puerto LLM usando la API de OpenAI."""
+    """
+    Implementación del puerto LLM usando la API de OpenAI.
+
+    Un solo cliente por instancia, creado en la primera llamada y compartido por los hilos
+    que resumen en paralelo: el pool de conexiones (max_connections) y el TLS se reutilizan
+    entre peticiones. close() lo libera.
+    """
 
-    def __init__(self, *, api_key: str | None = None, model: str | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        api_key: str | None = None,
+        model: str | None = None,
+        timeout: float = REQUEST_TIMEOUT,
+        max_connections: int = MAX_CONNECTIONS,
+    ) -> None:
         self._api_key = api_key or os.environ.get("LLM_API_KEY")
         self._model = model or os.environ.get("LLM_MODEL", "gpt-4o-mini")
         if not self._api_key:
             raise ValueError("LLM_API_KEY no está definida")
+        self._timeout = timeout
+        self._limits = pool_limits(max_connections)
+        self._client = None
+        self._client_lock = threading.Lock()
+
+    def _get_client(self):
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    from openai import DefaultHttpxClient, OpenAI
+
+                    self._client = OpenAI(
+                        api_key=self._api_key,
+                        timeout=self._timeout,
+                        http_client=DefaultHttpxClient(limits=self._limits, timeout=self._timeout),
+                    )
+        return self._client
+
+    @property
+    def model(self) -> str:
+        return self._model
 
     def summarize(self, title: str, snippet: str) -> str:
         """Genera un mini resumen en español (2-3 líneas)."""
-        prompt = f"""Resume en español en 2 o 3 líneas el siguiente artículo. Solo devuelve el resumen, sin introducción ni título.
+        return self._complete(summary_prompt(title, snippet), SUMMARY_MAX_TOKENS)
 
-Título: {title}
+    def summarize_batch(self, requests: list[SummaryRequest]) -> dict[str, str]:
+        """Varios resúmenes en una petición (JSON por id); los ids que falten se piden otra vez."""
+        if not requests:
+            return {}
+        return summarize_in_rounds(requests, self._complete)
 
-Fragmento o descripción:
-{snippet or "(sin descripción)"}"""
-        from openai import OpenAI
+    def rank(self, items: list[ItemWithSummary], top_n: int = 5) -> list[ItemWithSummary]:
+        """Ordena por relevancia para alguien interesado en AI/ML/DS y devuelve top_n."""
+        if not items:
+            return []
+        if len(items) <= top_n:
+            return list(items)
+        raw = self._complete(rank_prompt(items), RANK_MAX_TOKENS)
+        return [items[i] for i in parse_order(raw, len(items))[:top_n]]
 
-        client = OpenAI(api_key=self._api_key)
-        resp = client.chat.completions.create(
+    def _complete(self, prompt: str, max_tokens: int) -> str:
+        resp = self._get_client().chat.completions.create(
             model=self._model,
             messages=[{"role": "user", "content": prompt}],
-            max_completion_tokens=200,
+            max_completion_tokens=max_tokens,
         )
         return (resp.choices[0].message.content or "").strip()
 
-    def rank(self, items: list[ItemWithSummary], top_n: int = 5) -> list[ItemWithSummary]:
+    def close(self) -> None:
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+
+class AsyncOpenAILLM:
+    """
+    Puerto LLM asíncrono (AsyncLLMPort) con el cliente AsyncOpenAI.
+
+    El cliente se crea en la primera llamada, ya dentro del event loop que lo usará,
+    y se reutiliza en las siguientes; aclose() libera sus conexiones.
+    """
+
+    def __init__(
+        self,
+        *,
+        api_key: str | None = None,
+        model: str | None = None,
+        timeout: float = REQUEST_TIMEOUT,
+        max_connections: int = MAX_CONNECTIONS,
+    ) -> None:
+        self._api_key = api_key or os.environ.get("LLM_API_KEY")
+        self._model = model or os.environ.get("LLM_MODEL", "gpt-4o-mini")
+        if not self._api_key:
+            raise ValueError("LLM_API_KEY no está definida")
+        self._timeout = timeout
+        self._limits = pool_limits(max_connections)
+        self._client = None
+
+    def _get_client(self):
+        if self._client is None:
+            from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+            self._client = AsyncOpenAI(
+                api_key=self._api_key,
+                timeout=self._timeout,
+                http_client=DefaultAsyncHttpxClient(limits=self._limits, timeout=self._timeout),
+            )
+        return self._client
+
+    @property
+    def model(self) -> str:
+        return self._model
+
+    async def summarize(self, title: str, snippet: str) -> str:
+        """Genera un mini resumen en español (2-3 líneas)."""
+        return await self._complete(summary_prompt(title, snippet), SUMMARY_MAX_TOKENS)
+
+    async def summarize_batch(self, requests: list[SummaryRequest]) -> dict[str, str]:
+        """Varios resúmenes en una petición (JSON por id); los ids que falten se piden otra vez."""
+        if not requests:
+            return {}
+        return await summarize_in_rounds_async(requests, self._complete)
+
+    async def rank(self, items: list[ItemWithSummary], top_n: int = 5) -> list[ItemWithSummary]:
         """Ordena por relevancia para alguien interesado en AI/ML/DS y devuelve top_n."""
         if not items:
             return []
         if len(items) <= top_n:
             return list(items)
-        # Construir lista para el LLM
-        lines = []
-        for i, x in enumerate(items):
-            lines.append(
-                f"[{i}] Título: {x.item.title}\nURL: {x.item.url}\nResumen: {x.summary}\nFuente: {x.item.source}"
-            )
-        block = "\n\n".join(lines)
-        prompt = f"""Eres un experto en IA, aprendizaje automático y ciencia de datos. A continuación hay una lista de artículos con título, URL, resumen y fuente.
-
-Ordena los artículos del más interesante/relevante al menos (para alguien que quiere estar al día en AI/ML/DS). Responde ÚNICAMENTE con una lista de números en el orden elegido, separados por comas, por ejemplo: 2, 0, 4, 1, 3
-
-Artículos:
-
-{block}"""
-        from openai import OpenAI
+        raw = await self._complete(rank_prompt(items), RANK_MAX_TOKENS)
+        return [items[i] for i in parse_order(raw, len(items))[:top_n]]
 
-        client = OpenAI(api_key=self._api_key)
-        resp = client.chat.completions.create(
+    async def _complete(self, prompt: str, max_tokens: int) -> str:
+        resp = await self._get_client().chat.completions.create(
             model=self._model,
             messages=[{"role": "user", "content": prompt}],
-            max_completion_tokens=100,
+            max_completion_tokens=max_tokens,
         )
-        raw = (resp.choices[0].message.content or "").strip()
-        # Parsear "2, 0, 4, 1, 3" o similar
-        order: list[int] = []
-        for part in raw.replace(" ", "").split(","):
-            part = part.strip()
-            if part.isdigit():
-                idx = int(part)
-                if 0 <= idx < len(items) and idx not in order:
-                    order.append(idx)
-        # Añadir los no mencionados al final
-        for i in range(len(items)):
-            if i not in order:
-                order.append(i)
-        return [items[i] for i in order[:top_n]]
+        return (resp.choices[0].message.content or "").strip()
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+
+def pool_limits(max_connections: int) -> httpx.Limits:
+    """Límites del pool del cliente del SDK: todas las conexiones se pueden mantener vivas."""
+    n = max(1, max_connections)
+    return httpx.Limits(max_connections=n, max_keepalive_connections=n)
@@ -0,0 +1,158 @@
+"""Prompts y parseo de respuestas compartidos por los adaptadores LLM (sync y async)."""
+
+import json
+import logging
+from collections.abc import Awaitable, Callable
+
+from digest.domain.llm_port import ItemWithSummary, SummaryRequest
+
+logger = logging.getLogger(__name__)
+
+# Subir al cambiar el texto de summary_prompt / batch_summary_prompt: invalida la caché
+# de resúmenes.
+PROMPT_VERSION = 1
+
+# Tope de tokens de salida de un resumen (también por ítem en un lote) y rondas extra
+# para ids que faltan.
+SUMMARY_MAX_TOKENS = 200
+BATCH_TOKENS_PER_ITEM = SUMMARY_MAX_TOKENS
+BATCH_RETRIES = 1
+
+
+def summary_prompt(title: str, snippet: str) -> str:
+    """Prompt de mini resumen en español (2-3 líneas) de un artículo."""
+    return (
+        "Resume en español en 2 o 3 líneas el siguiente artículo. Solo devuelve el resumen, "
+        "sin introducción ni título.\n\n"
+        f"Título: {title}\n\n"
+        f"Fragmento o descripción:\n{snippet or '(sin descripción)'}"
+    )
+
+
+def batch_summary_prompt(requests: list[SummaryRequest]) -> str:
+    """Prompt de varios resúmenes a la vez con respuesta JSON {id: resumen}."""
+    articles = "\n\n".join(
+        f"[id: {r.id}]\nTítulo: {r.title}\n"
+        f"Fragmento o descripción:\n{r.snippet or '(sin descripción)'}"
+        for r in requests
+    )
+    example = json.dumps({r.id: "..." for r in requests[:2]}, ensure_ascii=False)
+    return (
+        "Resume en español en 2 o 3 líneas cada uno de los siguientes artículos. Responde "
+        "ÚNICAMENTE con un objeto JSON cuyas claves son los id de los artículos y cuyos "
+        "valores son los resúmenes, sin introducción ni título, por ejemplo: "
+        f"{example}\n\nArtículos:\n\n{articles}"
+    )
+
+
+def parse_batch_summaries(raw: str, ids: list[str]) -> dict[str, str]:
+    """
+    Resúmenes del objeto JSON de la respuesta (tolera ```json y texto alrededor).
+    Solo se devuelven ids pedidos con un resumen no vacío.
+    """
+    start, end = raw.find("{"), raw.rfind("}")
+    if start < 0 or end <= start:
+        return {}
+    try:
+        data = json.loads(raw[start : end + 1])
+    except json.JSONDecodeError:
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    wanted = set(ids)
+    return {
+        str(key): value.strip()
+        for key, value in data.items()
+        if str(key) in wanted and isinstance(value, str) and value.strip()
+    }
+
+
+def summarize_in_rounds(
+    requests: list[SummaryRequest],
+    complete: Callable[[str, int], str],
+    *,
+    retries: int = BATCH_RETRIES,
+) -> dict[str, str]:
+    """
+    Pide los resúmenes en un prompt con complete(prompt, max_tokens) y vuelve a pedir,
+    hasta retries veces, solo los ids que no vinieron. Los que sigan faltando no están
+    en el resultado (el llamador decide qué hacer con ellos).
+    """
+    summaries: dict[str, str] = {}
+    pending = list(requests)
+    for _round in range(1 + max(0, retries)):
+        raw = complete(batch_summary_prompt(pending), BATCH_TOKENS_PER_ITEM * len(pending))
+        pending = _collect(raw, pending, summaries)
+        if not pending:
+            break
+    return summaries
+
+
+async def summarize_in_rounds_async(
+    requests: list[SummaryRequest],
+    complete: Callable[[str, int], Awaitable[str]],
+    *,
+    retries: int = BATCH_RETRIES,
+) -> dict[str, str]:
+    """summarize_in_rounds con un complete asíncrono."""
+    summaries: dict[str, str] = {}
+    pending = list(requests)
+    for _round in range(1 + max(0, retries)):
+        raw = await complete(batch_summary_prompt(pending), BATCH_TOKENS_PER_ITEM * len(pending))
+        pending = _collect(raw, pending, summaries)
+        if not pending:
+            break
+    return summaries
+
+
+def _collect(
+    raw: str, pending: list[SummaryRequest], summaries: dict[str, str]
+) -> list[SummaryRequest]:
+    """Añade a summaries lo que trae la respuesta y devuelve lo que sigue faltando."""
+    summaries.update(parse_batch_summaries(raw, [r.id for r in pending]))
+    missing = [r for r in pending if r.id not in summaries]
+    if missing:
+        logger.info("Lote de resúmenes: faltan %d de %d ids", len(missing), len(pending))
+    return missing
+
+
+def rank_prompt(items: list[ItemWithSummary]) -> str:
+    """
+    Prompt que pide el orden de relevancia de los artículos como lista de índices.
+    Sin resúmenes (pre-ranking en dos etapas) solo van título, URL y fuente.
+    """
+    with_summary = any(x.summary for x in items)
+    lines = []
+    for i, x in enumerate(items):
+        summary = f"\nResumen: {x.summary}" if with_summary else ""
+        lines.append(
+            f"[{i}] Título: {x.item.title}\nURL: {x.item.url}{summary}\nFuente: {x.item.source}"
+        )
+    block = "\n\n".join(lines)
+    fields = "título, URL, resumen y fuente" if with_summary else "título, URL y fuente"
+    return (
+        "Eres un experto en IA, aprendizaje automático y ciencia de datos. A continuación "
+        f"hay una lista de artículos con {fields}.\n\n"
+        "Ordena los artículos del más interesante/relevante al menos (para alguien que "
+        "quiere estar al día en AI/ML/DS). Responde ÚNICAMENTE con una lista de números en "
+        "el orden elegido, separados por comas, por ejemplo: 2, 0, 4, 1, 3\n\n"
+        f"Artículos:\n\n{block}"
+    )
+
+
+def parse_order(raw: str, n: int) -> list[int]:
+    """
+    Índices de "2, 0, 4, 1, 3" o similar: válidos y sin repetir, en el orden dado,
+    y al final los no mencionados (la lista siempre tiene los n índices).
+    """
+    order: list[int] = []
+    for part in raw.replace(" ", "").split(","):
+        part = part.strip()
+        if part.isdigit():
+            idx = int(part)
+            if 0 <= idx < n and idx not in order:
+                order.append(idx)
+    for i in range(n):
+        if i not in order:
+            order.append(i)
+    return order
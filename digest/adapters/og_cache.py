@@ -0,0 +1,73 @@
+"""Caché persistente de imágenes OG por URL normalizada, con entradas negativas."""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from digest.config.sources import OgConfig
+from digest.domain.urls import normalize_url
+
+from .cache_store import CACHE_FILES, JsonCache
+
+# Resultados que no se guardan: el próximo intento puede salir bien (5xx, red caída, 429 por
+# rate limit o Retry-After demasiado largo, 408). Un timeout sí se guarda: el sitio es lento.
+TRANSIENT_OUTCOMES = frozenset({"http-5xx", "http-429", "http-408", "error"})
+
+
+@dataclass(frozen=True)
+class OgCacheHit:
+    """Entrada vigente: imagen (None si es negativa) y motivo (found, missing, http-404...)."""
+
+    image: str | None
+    outcome: str
+
+
+class OgImageCache:
+    """
+    Resultado de fetch_og_image por normalize_url(url): la imagen encontrada durante
+    ttl_days o el negativo (sin og:image, timeout, 4xx, no HTML) durante negative_ttl_hours.
+    Los fallos transitorios (TRANSIENT_OUTCOMES) no se guardan. LRU con max_entries.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        ttl_days: float = 30.0,
+        negative_ttl_hours: float = 72.0,
+        max_entries: int = 2000,
+    ) -> None:
+        self._store = JsonCache(path, max_entries=max_entries)
+        self.ttl = ttl_days * 86400
+        self.negative_ttl = negative_ttl_hours * 3600
+
+    @classmethod
+    def from_config(cls, cache_dir: str | Path, config: OgConfig) -> "OgImageCache":
+        return cls(
+            Path(cache_dir) / CACHE_FILES["og-images"],
+            ttl_days=config.cache_ttl_days,
+            negative_ttl_hours=config.negative_ttl_hours,
+            max_entries=config.cache_max_entries,
+        )
+
+    @property
+    def hits(self) -> int:
+        return self._store.hits
+
+    @property
+    def misses(self) -> int:
+        return self._store.misses
+
+    def get(self, url: str) -> OgCacheHit | None:
+        value = self._store.get(normalize_url(url))
+        if not isinstance(value, dict):
+            return None
+        return OgCacheHit(image=value.get("image"), outcome=value.get("outcome") or "found")
+
+    def store(self, url: str, image: str | None, outcome: str) -> None:
+        if outcome in TRANSIENT_OUTCOMES:
+            return
+        ttl = self.ttl if image else self.negative_ttl
+        self._store.set(normalize_url(url), {"image": image, "outcome": outcome}, ttl=ttl)
+
+    def save(self) -> None:
+        self._store.save()
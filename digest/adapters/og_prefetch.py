@@ -0,0 +1,72 @@
+"""Prefetch especulativo de imágenes OG: se buscan mientras el LLM resume y se usan al rankear."""
+
+import logging
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PrefetchStats:
+    """Balance del prefetch: cuántas búsquedas se lanzaron y cuántas sirvieron para el top."""
+
+    submitted: int = 0
+    used: int = 0
+    cancelled: int = 0
+    over_cap: int = 0
+
+    @property
+    def extra(self) -> int:
+        """Búsquedas hechas para candidatos que no llegaron al top (el coste del prefetch)."""
+        return self.submitted - self.used - self.cancelled
+
+
+class OgPrefetcher:
+    """
+    Lanza fetch(url) en segundo plano para los candidatos (como mucho max_requests,
+    en orden) y permite recoger después el resultado de los que lleguen al top.
+
+    Las búsquedas que aún no han empezado al cerrar se cancelan; las que están en vuelo
+    terminan solas (las corta el timeout de red de fetch) sin bloquear el cierre.
+    """
+
+    def __init__(
+        self,
+        urls: Iterable[str],
+        fetch: Callable[[str], str | None],
+        *,
+        max_requests: int,
+        max_workers: int = 8,
+    ) -> None:
+        unique = list(dict.fromkeys(url for url in urls if url))
+        selected = unique[: max(0, max_requests)]
+        self.stats = PrefetchStats(submitted=len(selected), over_cap=len(unique) - len(selected))
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(selected) or 1)),
+            thread_name_prefix="og-prefetch",
+        )
+        self._futures: dict[str, Future] = {
+            url: self._executor.submit(fetch, url) for url in selected
+        }
+        self._used: set[str] = set()
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._futures
+
+    def result(self, url: str) -> str | None:
+        """Espera (sin límite propio: lo pone quien llama) el resultado ya lanzado para url."""
+        self._used.add(url)
+        return self._futures[url].result()
+
+    def close(self) -> PrefetchStats:
+        """Cancela lo que no llegó a empezar y devuelve el balance."""
+        cancelled = 0
+        for url, future in self._futures.items():
+            if url not in self._used and future.cancel():
+                cancelled += 1
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.stats.used = len(self._used)
+        self.stats.cancelled = cancelled
+        return self.stats
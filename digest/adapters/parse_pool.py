@@ -0,0 +1,71 @@
+"""Parseo de feeds en un pool de procesos: los hilos de descarga envían bytes y reciben tuplas."""
+
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+
+from .feed_parser import FeedEntry
+from .feed_stream import FeedPayload, entries_from_bytes
+
+logger = logging.getLogger(__name__)
+
+# Por debajo de este número de feeds el arranque de procesos cuesta más de lo que ahorra.
+DEFAULT_MIN_SOURCES = 8
+
+# (title, link, description, date, id, categories): mismo orden que los campos de FeedEntry.
+EntryTuple = tuple[str, str | None, str | None, str | None, str | None, tuple[str, ...]]
+
+
+class ParsePool:
+    """
+    ProcessPoolExecutor para parsear feeds fuera del GIL.
+
+    parse() se llama desde los hilos de fetch (bloquea el hilo, no el proceso): envía el
+    cuerpo ya descargado y recibe tuplas compactas, baratas de serializar, que vuelven a
+    ser FeedEntry en el proceso principal.
+
+    Los workers nacen de un forkserver (spawn donde no existe), nunca de fork: el pool se
+    abre con hilos de descarga en marcha y un fork copiaría locks tomados por ellos.
+    """
+
+    def __init__(self, workers: int) -> None:
+        self.workers = max(1, workers)
+        method = (
+            "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        )
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=multiprocessing.get_context(method)
+        )
+
+    def parse(self, payload: FeedPayload, *, max_entries: int | None = None) -> list[FeedEntry]:
+        content_type = payload.response.headers.get("content-type", "") if payload.response else ""
+        future = self._executor.submit(_parse_compact, payload.content, content_type, max_entries)
+        return [FeedEntry(*row) for row in future.result()]
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> "ParsePool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def parse_pool_for(
+    n_sources: int, workers: int, *, min_sources: int = DEFAULT_MIN_SOURCES
+) -> AbstractContextManager[ParsePool | None]:
+    """
+    Pool de procesos si está activado (workers > 0) y hay al menos min_sources feeds;
+    si no, un contexto vacío (None) y el parseo sigue en el hilo que descarga.
+    """
+    if workers <= 0 or n_sources < max(1, min_sources):
+        return nullcontext(None)
+    logger.info("Parseo de %d feeds en %d procesos", n_sources, workers)
+    return ParsePool(workers)
+
+
+def _parse_compact(content: bytes, content_type: str, max_entries: int | None) -> list[EntryTuple]:
+    entries = entries_from_bytes(content, content_type, max_entries=max_entries)
+    return [(e.title, e.link, e.description, e.date, e.id, e.categories) for e in entries]
@@ -0,0 +1,110 @@
+"""Limitador de tasa por host (token bucket) y pausas por 429 / Retry-After."""
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+
+from digest.config.sources import FetchConfig, HostLimit
+
+
+@dataclass
+class _Bucket:
+    rate: float | None
+    capacity: float
+    tokens: float
+    updated: float
+    blocked_until: float = 0.0
+    waited: float = 0.0
+
+
+class HostRateLimiter:
+    """
+    Un token bucket por host: `rate` peticiones/s con ráfagas de hasta `burst`.
+
+    acquire(host) bloquea el hilo el tiempo necesario (reserva el turno dentro del lock
+    y duerme fuera, así los hilos se encolan en orden). pause(host, s) congela el host
+    tras un 429 o un Retry-After. Hosts sin política propia usan default_rate
+    (None = sin límite, solo pausas).
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, HostLimit] | None = None,
+        *,
+        default_rate: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._limits = {host.lower(): limit for host, limit in (limits or {}).items()}
+        self._default = HostLimit(rate=default_rate, burst=max(1, int(default_rate or 1)))
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._buckets: dict[str, _Bucket] = {}
+
+    @classmethod
+    def from_config(cls, config: FetchConfig) -> "HostRateLimiter":
+        return cls(config.host_limits, default_rate=config.default_host_rate)
+
+    def concurrency(self, host: str) -> int | None:
+        """Peticiones simultáneas permitidas para el host (None = usar el de la sesión)."""
+        limit = self._limits.get(host.lower())
+        return limit.concurrency if limit else None
+
+    def acquire(self, host: str) -> float:
+        """Espera turno para el host; devuelve los segundos esperados."""
+        with self._lock:
+            bucket = self._bucket(host)
+            now = self._clock()
+            wait = max(0.0, bucket.blocked_until - now)
+            if bucket.rate:
+                bucket.tokens = min(
+                    bucket.capacity, bucket.tokens + (now - bucket.updated) * bucket.rate
+                )
+                bucket.updated = now
+                bucket.tokens -= 1
+                if bucket.tokens < 0:
+                    wait = max(wait, -bucket.tokens / bucket.rate)
+            bucket.waited += wait
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def pause(self, host: str, seconds: float) -> None:
+        """Bloquea el host `seconds` (429 / Retry-After); no acorta una pausa mayor en curso."""
+        with self._lock:
+            bucket = self._bucket(host)
+            bucket.blocked_until = max(bucket.blocked_until, self._clock() + seconds)
+
+    def waited(self) -> dict[str, float]:
+        """Segundos de espera acumulados por host (para el informe de la ejecución)."""
+        with self._lock:
+            return {host: b.waited for host, b in self._buckets.items() if b.waited > 0}
+
+    def _bucket(self, host: str) -> _Bucket:
+        key = host.lower()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            limit = self._limits.get(key, self._default)
+            capacity = float(max(1, limit.burst))
+            bucket = _Bucket(
+                rate=limit.rate, capacity=capacity, tokens=capacity, updated=self._clock()
+            )
+            self._buckets[key] = bucket
+        return bucket
+
+
+def retry_after_seconds(value: str | None) -> float | None:
+    """Interpreta Retry-After: segundos o fecha HTTP. None si falta o no se entiende."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
@@ -0,0 +1,260 @@
+"""Reintentos con backoff exponencial y circuit breaker por fuente persistido entre ejecuciones."""
+
+import logging
+import random
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TypeVar
+
+import httpx
+
+from digest.config.sources import FetchConfig
+
+from .cache_store import JsonCache
+from .concurrency import Task
+from .rate_limit import retry_after_seconds
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Tope de espera entre reintentos (s) y de fuentes con historial guardado.
+MAX_RETRY_DELAY = 10.0
+HEALTH_MAX_ENTRIES = 500
+
+
+def is_transient(exc: BaseException) -> bool:
+    """
+    Errores que vale la pena reintentar: red/timeout y 5xx. Los 4xx (403, 404...) son
+    permanentes; los 429 y los 503 con Retry-After ya los reintenta la sesión HTTP (o el
+    servidor pidió esperar más de lo admitido), así que aquí no se reintentan otra vez.
+    """
+    if isinstance(exc, httpx.HTTPStatusError):
+        response = exc.response
+        if response.status_code == 503:
+            return retry_after_seconds(response.headers.get("retry-after")) is None
+        return response.status_code >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+def with_retries(
+    fn: Callable[[], T],
+    *,
+    retries: int = 2,
+    base_delay: float = 1.0,
+    max_delay: float = MAX_RETRY_DELAY,
+    label: str = "",
+    deadline: float | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+    rng: random.Random | None = None,
+    clock: Callable[[], float] = time.monotonic,
+) -> T:
+    """
+    Llama a fn y, ante un error transitorio, reintenta hasta `retries` veces con
+    backoff exponencial "full jitter": espera aleatoria en [0, base_delay * 2^intento]
+    acotada por max_delay. Los errores permanentes se propagan de inmediato.
+
+    Con deadline (segundos desde la llamada) no se reintenta si la espera acabaría
+    fuera de plazo: el error se propaga en vez de consumir el tiempo restante.
+    """
+    rng = rng or random
+    end = clock() + deadline if deadline is not None else None
+    for attempt in range(retries + 1):
+        try:
+            return fn()
+        except Exception as e:
+            if attempt == retries or not is_transient(e):
+                raise
+            delay = rng.uniform(0, min(max_delay, base_delay * 2**attempt))
+            if end is not None and clock() + delay >= end:
+                raise
+            logger.info("%s: error transitorio (%s); reintento en %.1fs", label, e, delay)
+            sleep(delay)
+    raise AssertionError("unreachable")
+
+
+@dataclass
+class HealthSummary:
+    """Resultado de la ejecución para el log: fuentes omitidas, sondeadas y abiertas."""
+
+    skipped: int = 0
+    probed: int = 0
+    opened: int = 0
+
+
+class SourceHealth:
+    """
+    Circuit breaker por fuente (clave = etiqueta de la tarea) guardado en un JsonCache.
+
+    - cerrado: la fuente se pide normalmente, con reintentos.
+    - abierto: tras `threshold` fallos seguidos se omite hasta open_until; la espera
+      empieza en cooldown_hours y se duplica con cada sondeo fallido (tope max_cooldown_hours).
+    - semiabierto: vencida la espera se hace un único intento sin reintentos (sondeo);
+      si sale bien el circuito se cierra, si no vuelve a abrirse.
+
+    También acumula éxitos, fallos, último error y omisiones por fuente (salud).
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        threshold: int = 3,
+        cooldown_hours: float = 24.0,
+        max_cooldown_hours: float = 24.0 * 30,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._store = JsonCache(path, max_entries=HEALTH_MAX_ENTRIES, clock=clock)
+        self.threshold = max(1, threshold)
+        self.cooldown = cooldown_hours * 3600
+        self.max_cooldown = max(self.cooldown, max_cooldown_hours * 3600)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._expired: set[str] = set()
+        self.summary = HealthSummary()
+
+    def state(self, label: str) -> str:
+        """Estado del circuito de la fuente: closed, open o half_open."""
+        record = self._store.peek(label)
+        if not record or record.get("consecutive_failures", 0) < self.threshold:
+            return "closed"
+        if self._clock() < (record.get("open_until") or 0):
+            return "open"
+        return "half_open"
+
+    def record(self, label: str) -> dict[str, Any]:
+        """Historial de la fuente (copia), o dict vacío si nunca se pidió."""
+        return dict(self._store.peek(label) or {})
+
+    def guard(
+        self,
+        task: Task[T],
+        *,
+        retries: int = 2,
+        base_delay: float = 1.0,
+        deadline: float | None = None,
+    ) -> Task[T | None]:
+        """
+        Envuelve la tarea: omite si el circuito está abierto, reintenta dentro del
+        deadline y registra el resultado.
+        """
+
+        def _run() -> T | None:
+            state = self.state(task.label)
+            if state == "open":
+                until = self.record(task.label).get("open_until") or 0
+                logger.info(
+                    "%s: circuito abierto (%d fallos seguidos); se omite hasta %s",
+                    task.label,
+                    self.record(task.label).get("consecutive_failures", 0),
+                    time.strftime("%Y-%m-%d %H:%M", time.gmtime(until)),
+                )
+                self._update(task.label, skipped=True)
+                return None
+            probing = state == "half_open"
+            if probing:
+                with self._lock:
+                    self.summary.probed += 1
+                logger.info("%s: sondeando fuente con circuito abierto", task.label)
+            try:
+                result = with_retries(
+                    task.fn,
+                    retries=0 if probing else retries,
+                    base_delay=base_delay,
+                    label=task.label,
+                    deadline=deadline,
+                )
+            except Exception as e:
+                self._update(task.label, error=e)
+                raise
+            self._update(task.label)
+            return result
+
+        return Task(label=task.label, fn=_run)
+
+    def expire(self, label: str) -> None:
+        """
+        Cuenta como fallo una fuente abandonada por deadline. Su hilo puede terminar
+        más tarde (incluso tras save); ese resultado tardío ya no se registra.
+        """
+        with self._lock:
+            self._expired.add(label)
+        self._update(label, error=TimeoutError("superó source_deadline"), force=True)
+
+    def save(self) -> None:
+        self._store.save()
+
+    def _update(
+        self,
+        label: str,
+        *,
+        error: BaseException | None = None,
+        skipped: bool = False,
+        force: bool = False,
+    ) -> None:
+        now = self._clock()
+        with self._lock:
+            if label in self._expired and not force:
+                return
+            record = dict(self._store.peek(label) or {})
+            if skipped:
+                record["skipped"] = record.get("skipped", 0) + 1
+                self.summary.skipped += 1
+            elif error is None:
+                record["successes"] = record.get("successes", 0) + 1
+                record["consecutive_failures"] = 0
+                record["last_success"] = now
+                record["open_until"] = None
+            else:
+                streak = record.get("consecutive_failures", 0) + 1
+                record["failures"] = record.get("failures", 0) + 1
+                record["consecutive_failures"] = streak
+                record["last_failure"] = now
+                record["last_error"] = f"{type(error).__name__}: {error}"[:300]
+                if streak >= self.threshold:
+                    cooldown = min(
+                        self.max_cooldown, self.cooldown * 2 ** (streak - self.threshold)
+                    )
+                    record["open_until"] = now + cooldown
+                    self.summary.opened += 1
+                    logger.warning(
+                        "%s: %d fallos seguidos; circuito abierto %.0f h",
+                        label,
+                        streak,
+                        cooldown / 3600,
+                    )
+            self._store.set(label, record)
+
+
+def guard_tasks(
+    tasks: list[Task[T]], config: FetchConfig, health: SourceHealth | None
+) -> list[Task[T | None]]:
+    """
+    Aplica reintentos (y el circuit breaker si hay health) a cada tarea de fetch_all. Los
+    reintentos se limitan al tiempo que queda de fetch.source_deadline; las tareas que
+    aun así lo superan se cuentan con health.expire (on_expired de run_tasks).
+    """
+    deadline = config.source_deadline
+    if health is not None:
+        return [
+            health.guard(
+                t, retries=config.retries, base_delay=config.retry_base_delay, deadline=deadline
+            )
+            for t in tasks
+        ]
+    return [
+        Task(
+            label=t.label,
+            fn=lambda t=t: with_retries(
+                t.fn,
+                retries=config.retries,
+                base_delay=config.retry_base_delay,
+                label=t.label,
+                deadline=deadline,
+            ),
+        )
+        for t in tasks
+    ]
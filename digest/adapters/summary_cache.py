@@ -0,0 +1,114 @@
+"""Caché persistente de resúmenes por contenido: el mismo artículo no se vuelve a resumir."""
+
+import asyncio
+import hashlib
+from pathlib import Path
+
+from digest.config.sources import LlmConfig
+from digest.domain.llm_port import AsyncLLMPort, ItemWithSummary, LLMPort, SummaryRequest
+
+from .cache_store import CACHE_FILES, JsonCache
+from .concurrency import await_or_thread
+from .llm_prompts import PROMPT_VERSION
+
+
+def summary_key(model: str, title: str, snippet: str) -> str:
+    """sha256 de modelo, versión de prompts, título y snippet (cambiar cualquiera invalida)."""
+    raw = "\0".join((model, str(PROMPT_VERSION), title, snippet))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class SummaryCache:
+    """
+    Resúmenes guardados por summary_key en un JsonCache: expiran ttl_days después de
+    generarse y, por encima de max_entries, se descartan los menos usados (LRU).
+    """
+
+    def __init__(
+        self, path: str | Path, *, ttl_days: float = 60.0, max_entries: int = 5000
+    ) -> None:
+        self._store = JsonCache(path, max_entries=max_entries, ttl=ttl_days * 86400)
+
+    @classmethod
+    def from_config(cls, cache_dir: str | Path, config: LlmConfig) -> "SummaryCache":
+        return cls(
+            Path(cache_dir) / CACHE_FILES["summaries"],
+            ttl_days=config.summary_cache_days,
+            max_entries=config.summary_cache_max_entries,
+        )
+
+    @property
+    def hits(self) -> int:
+        return self._store.hits
+
+    @property
+    def misses(self) -> int:
+        return self._store.misses
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: str) -> str | None:
+        value = self._store.get(key)
+        return value if isinstance(value, str) else None
+
+    def store(self, key: str, summary: str) -> None:
+        if summary:
+            self._store.set(key, summary)
+
+    def save(self) -> None:
+        self._store.save()
+
+
+class CachingLLM:
+    """
+    AsyncLLMPort delante de cualquier LLMPort / AsyncLLMPort: summarize y summarize_batch
+    consultan la caché y solo llaman al modelo con lo que no está; rank pasa tal cual.
+    Un LLMPort síncrono se ejecuta en hilos (asyncio.to_thread).
+    """
+
+    def __init__(self, llm: LLMPort | AsyncLLMPort, cache: SummaryCache) -> None:
+        self.llm = llm
+        self.cache = cache
+        self.model = getattr(llm, "model", None) or type(llm).__name__
+
+    async def summarize(self, title: str, snippet: str) -> str:
+        key = summary_key(self.model, title, snippet)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        summary = await await_or_thread(self.llm.summarize, title, snippet)
+        self.cache.store(key, summary)
+        return summary
+
+    async def summarize_batch(self, requests: list[SummaryRequest]) -> dict[str, str]:
+        found: dict[str, str] = {}
+        keys: dict[str, str] = {}
+        pending: list[SummaryRequest] = []
+        for request in requests:
+            keys[request.id] = summary_key(self.model, request.title, request.snippet)
+            cached = self.cache.get(keys[request.id])
+            if cached is not None:
+                found[request.id] = cached
+            else:
+                pending.append(request)
+        if not pending:
+            return found
+        inner_batch = getattr(self.llm, "summarize_batch", None)
+        if inner_batch is not None:
+            fresh = await await_or_thread(inner_batch, pending)
+        else:
+            summaries = await asyncio.gather(
+                *(await_or_thread(self.llm.summarize, r.title, r.snippet) for r in pending)
+            )
+            fresh = {r.id: s for r, s in zip(pending, summaries, strict=True)}
+        for request_id, summary in fresh.items():
+            if request_id in keys:
+                self.cache.store(keys[request_id], summary)
+                found[request_id] = summary
+        return found
+
+    async def rank(self, items: list[ItemWithSummary], top_n: int = 5) -> list[ItemWithSummary]:
+        return await await_or_thread(self.llm.rank, items, top_n=top_n)
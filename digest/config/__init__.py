@@ -1,24 +1,34 @@
 """Carga de configuración: sources.yaml, links.md e historial sent-urls."""
 
+from digest.config.digest_history import save_digest_markdown
+from digest.config.history import load_sent_urls, save_sent_urls
+from digest.config.links import load_links
 from digest.config.sources import (
-    load_sources,
-    RssSource,
+    DedupConfig,
+    FetchConfig,
     HackerNewsConfig,
+    HostLimit,
+    LlmConfig,
+    OgConfig,
     RedditConfig,
+    RssSource,
     SourcesConfig,
+    load_sources,
 )
-from digest.config.links import load_links
-from digest.config.digest_history import save_digest_markdown
-from digest.config.history import load_sent_urls, save_sent_urls
 
 __all__ = [
-    "save_digest_markdown",
-    "load_sources",
-    "load_links",
-    "load_sent_urls",
-    "save_sent_urls",
-    "RssSource",
+    "DedupConfig",
+    "FetchConfig",
     "HackerNewsConfig",
+    "HostLimit",
+    "LlmConfig",
+    "OgConfig",
     "RedditConfig",
+    "RssSource",
     "SourcesConfig",
+    "load_links",
+    "load_sent_urls",
+    "load_sources",
+    "save_digest_markdown",
+    "save_sent_urls",
 ]
@@ -1,5 +1,6 @@
 """Persistencia de cada digest como archivo Markdown (historial legible)."""
 
+import re
 from pathlib import Path
 
 from digest.domain.llm_port import ItemWithSummary
@@ -12,6 +13,9 @@ SOURCE_LABELS = {
 }
 
 
+_TITLE_RE = re.compile(r"^## \d+\. (.+)$", re.MULTILINE)
+
+
 def _source_label(source: str) -> str:
     return SOURCE_LABELS.get(source, source)
 
@@ -63,3 +67,21 @@ def save_digest_markdown(items: list[ItemWithSummary], output_dir: str | Path) -
 
     filepath.write_text("\n".join(lines).strip() + "\n", encoding="utf-8")
     return filepath
+
+
+def load_digest_titles(digests_dir: str | Path, *, max_files: int | None = None) -> list[str]:
+    """
+    Títulos de los artículos de los digests guardados por save_digest_markdown
+    (líneas "## N. Título"), de los más recientes a los más antiguos.
+
+    max_files limita cuántos archivos se leen. Si el directorio no existe, devuelve [].
+    """
+    out = Path(digests_dir)
+    if not out.is_dir():
+        return []
+    files = sorted(out.glob("*.md"), reverse=True)[:max_files]
+    titles: list[str] = []
+    for path in files:
+        text = path.read_text(encoding="utf-8")
+        titles.extend(t.replace("\\|", "|").strip() for t in _TITLE_RE.findall(text))
+    return titles
@@ -1,6 +1,6 @@
 """Lectura de config/sources.yaml: RSS, Hacker News y Reddit (RF-04, RF-06, RF-07, RF-08)."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 import yaml
@@ -16,18 +16,115 @@ class RssSource:
 
 @dataclass
 class HackerNewsConfig:
-    """Parámetros de Hacker News: queries y límite de ítems."""
+    """
+    Parámetros de Hacker News: queries, límite de ítems, TTL de la caché de búsquedas
+    modo incremental (solo historias posteriores a la última ejecución) y modo batch
+    (todas las queries en una sola petición multi-query).
+    """
 
     queries: list[str]
     limit: int
+    cache_ttl_minutes: int = 60
+    incremental: bool = False
+    batch: bool = False
 
 
 @dataclass
 class RedditConfig:
-    """Parámetros de Reddit: subreddits y límite por subreddit."""
+    """
+    Parámetros de Reddit: subreddits, límite por subreddit y modo combinado
+    (un solo listado r/a+b+c paginado en vez de una petición por subreddit).
+    """
 
     subreddits: list[str]
     limit_per_sub: int
+    combined: bool = False
+
+
+@dataclass
+class HostLimit:
+    """Cortesía con un host: peticiones/s (None = sin límite), ráfaga y concurrencia máxima."""
+
+    rate: float | None = None
+    burst: int = 1
+    concurrency: int | None = None
+
+
+@dataclass
+class FetchConfig:
+    """
+    Parámetros del motor de descarga: concurrencia, deadline por fuente, pool HTTP,
+    límites de tasa por host (host_limits; default_host_rate para el resto),
+    reintentos de errores transitorios, circuit breaker por fuente y topes de lectura
+    de feeds (bytes y entradas por feed RSS) y pool de procesos para parsearlos.
+    """
+
+    max_workers: int = 8
+    source_deadline: float | None = 30.0
+    max_connections: int = 20
+    max_per_host: int = 4
+    http2: bool = False
+    host_limits: dict[str, HostLimit] = field(default_factory=dict)
+    default_host_rate: float | None = None
+    max_retry_after: float = 60.0
+    retries: int = 2
+    retry_base_delay: float = 1.0
+    breaker_threshold: int = 3
+    breaker_cooldown_hours: float = 24.0
+    max_feed_bytes: int = 5 * 1024 * 1024
+    max_items_per_feed: int | None = 50
+    parse_workers: int = 0
+    parse_pool_min_sources: int = 8
+
+
+@dataclass
+class OgConfig:
+    """
+    Imágenes OG del digest: caché persistente con TTL distinto para aciertos (imagen
+    encontrada) y negativos (sin og:image, timeout, 4xx salvo 408/429) y tope de entradas.
+    prefetch busca las imágenes de los candidatos mientras el LLM resume (como mucho
+    prefetch_max búsquedas); desactivado, solo se buscan las del top tras rankear.
+    """
+
+    cache_ttl_days: float = 30.0
+    negative_ttl_hours: float = 72.0
+    cache_max_entries: int = 2000
+    prefetch: bool = False
+    prefetch_max: int = 30
+
+
+@dataclass
+class LlmConfig:
+    """
+    Etapa LLM del digest: resúmenes simultáneos (summarize_workers=1 = en serie),
+    artículos por petición de resumen (batch_size=1 = uno por petición), caché de
+    resúmenes por contenido (antigüedad máxima y tope de entradas) y cliente HTTP del
+    SDK (timeout por petición en segundos y conexiones del pool). rank_chunk_size > 0
+    rankea por trozos de ese tamaño en paralelo y una ronda final con los ganadores.
+    shortlist_factor > 0 activa el flujo en dos etapas: pre-ranking por título y fuente,
+    y solo shortlist_factor × top_n candidatos (al menos top_n) se resumen y rankean.
+    """
+
+    summarize_workers: int = 4
+    batch_size: int = 1
+    summary_cache_days: float = 60.0
+    summary_cache_max_entries: int = 5000
+    request_timeout: float = 60.0
+    max_connections: int = 10
+    rank_chunk_size: int = 0
+    shortlist_factor: float = 0.0
+
+
+@dataclass
+class DedupConfig:
+    """
+    Casi duplicados antes del LLM: con near_dup, la misma historia llegada por varias
+    fuentes (títulos y descripciones con Jaccard estimado >= near_dup_threshold) se queda
+    en un solo candidato, el primero visto.
+    """
+
+    near_dup: bool = True
+    near_dup_threshold: float = 0.6
 
 
 @dataclass
@@ -37,6 +134,10 @@ class SourcesConfig:
     rss: list[RssSource]
     hacker_news: HackerNewsConfig | None
     reddit: RedditConfig | None
+    fetch: FetchConfig = field(default_factory=FetchConfig)
+    og: OgConfig = field(default_factory=OgConfig)
+    llm: LlmConfig = field(default_factory=LlmConfig)
+    dedup: DedupConfig = field(default_factory=DedupConfig)
 
 
 def load_sources(path: str | Path) -> SourcesConfig:
@@ -69,6 +170,11 @@ def load_sources(path: str | Path) -> SourcesConfig:
         hacker_news = HackerNewsConfig(
             queries=[q for q in (hn.get("queries") or []) if isinstance(q, str)],
             limit=hn.get("limit") if isinstance(hn.get("limit"), int) else 15,
+            cache_ttl_minutes=hn.get("cache_ttl_minutes")
+            if isinstance(hn.get("cache_ttl_minutes"), int)
+            else 60,
+            incremental=hn.get("incremental") is True,
+            batch=hn.get("batch") is True,
         )
     else:
         hacker_news = None
@@ -84,8 +190,129 @@ def load_sources(path: str | Path) -> SourcesConfig:
             limit_per_sub=rd.get("limit_per_sub")
             if isinstance(rd.get("limit_per_sub"), int)
             else 10,
+            combined=rd.get("combined") is True,
         )
     else:
         reddit = None
 
-    return SourcesConfig(rss=rss_list, hacker_news=hacker_news, reddit=reddit)
+    return SourcesConfig(
+        rss=rss_list,
+        hacker_news=hacker_news,
+        reddit=reddit,
+        fetch=_parse_fetch(raw.get("fetch")),
+        og=_parse_og(raw.get("og")),
+        llm=_parse_llm(raw.get("llm")),
+        dedup=_parse_dedup(raw.get("dedup")),
+    )
+
+
+def _parse_fetch(raw) -> FetchConfig:
+    """Sección opcional `fetch`; valores ausentes o inválidos usan los defaults."""
+    defaults = FetchConfig()
+    if not isinstance(raw, dict):
+        return defaults
+    deadline = raw.get("source_deadline", defaults.source_deadline)
+    return FetchConfig(
+        max_workers=_positive_int(raw.get("max_workers"), defaults.max_workers),
+        source_deadline=float(deadline)
+        if isinstance(deadline, (int, float)) and deadline > 0
+        else None,
+        max_connections=_positive_int(raw.get("max_connections"), defaults.max_connections),
+        max_per_host=_positive_int(raw.get("max_per_host"), defaults.max_per_host),
+        http2=raw.get("http2") is True,
+        host_limits=_parse_host_limits(raw.get("host_limits")),
+        default_host_rate=_positive_float(raw.get("default_host_rate")),
+        max_retry_after=_positive_float(raw.get("max_retry_after")) or defaults.max_retry_after,
+        retries=raw.get("retries")
+        if isinstance(raw.get("retries"), int) and raw.get("retries") >= 0
+        else defaults.retries,
+        retry_base_delay=_positive_float(raw.get("retry_base_delay")) or defaults.retry_base_delay,
+        breaker_threshold=_positive_int(raw.get("breaker_threshold"), defaults.breaker_threshold),
+        breaker_cooldown_hours=_positive_float(raw.get("breaker_cooldown_hours"))
+        or defaults.breaker_cooldown_hours,
+        max_feed_bytes=_positive_int(raw.get("max_feed_bytes"), defaults.max_feed_bytes),
+        max_items_per_feed=None
+        if raw.get("max_items_per_feed") == 0
+        else _positive_int(raw.get("max_items_per_feed"), defaults.max_items_per_feed),
+        parse_workers=_positive_int(raw.get("parse_workers"), defaults.parse_workers),
+        parse_pool_min_sources=_positive_int(
+            raw.get("parse_pool_min_sources"), defaults.parse_pool_min_sources
+        ),
+    )
+
+
+def _parse_og(raw) -> OgConfig:
+    """Sección opcional `og`; valores ausentes o inválidos usan los defaults."""
+    defaults = OgConfig()
+    if not isinstance(raw, dict):
+        return defaults
+    return OgConfig(
+        cache_ttl_days=_positive_float(raw.get("cache_ttl_days")) or defaults.cache_ttl_days,
+        negative_ttl_hours=_positive_float(raw.get("negative_ttl_hours"))
+        or defaults.negative_ttl_hours,
+        cache_max_entries=_positive_int(raw.get("cache_max_entries"), defaults.cache_max_entries),
+        prefetch=raw.get("prefetch") is True,
+        prefetch_max=_positive_int(raw.get("prefetch_max"), defaults.prefetch_max),
+    )
+
+
+def _parse_dedup(raw) -> DedupConfig:
+    """Sección opcional `dedup`; valores ausentes o inválidos usan los defaults."""
+    defaults = DedupConfig()
+    if not isinstance(raw, dict):
+        return defaults
+    threshold = _positive_float(raw.get("near_dup_threshold"))
+    return DedupConfig(
+        near_dup=raw.get("near_dup") is not False,
+        near_dup_threshold=threshold
+        if threshold is not None and threshold <= 1
+        else defaults.near_dup_threshold,
+    )
+
+
+def _parse_llm(raw) -> LlmConfig:
+    """Sección opcional `llm`; valores ausentes o inválidos usan los defaults."""
+    defaults = LlmConfig()
+    if not isinstance(raw, dict):
+        return defaults
+    return LlmConfig(
+        summarize_workers=_positive_int(raw.get("summarize_workers"), defaults.summarize_workers),
+        batch_size=_positive_int(raw.get("batch_size"), defaults.batch_size),
+        summary_cache_days=_positive_float(raw.get("summary_cache_days"))
+        or defaults.summary_cache_days,
+        summary_cache_max_entries=_positive_int(
+            raw.get("summary_cache_max_entries"), defaults.summary_cache_max_entries
+        ),
+        request_timeout=_positive_float(raw.get("request_timeout")) or defaults.request_timeout,
+        max_connections=_positive_int(raw.get("max_connections"), defaults.max_connections),
+        rank_chunk_size=_positive_int(raw.get("rank_chunk_size"), defaults.rank_chunk_size),
+        shortlist_factor=_positive_float(raw.get("shortlist_factor")) or defaults.shortlist_factor,
+    )
+
+
+def _parse_host_limits(raw) -> dict[str, HostLimit]:
+    """host_limits: {host: {rate, burst, concurrency}}; entradas inválidas se ignoran."""
+    if not isinstance(raw, dict):
+        return {}
+    limits: dict[str, HostLimit] = {}
+    for host, spec in raw.items():
+        if not isinstance(host, str) or not isinstance(spec, dict):
+            continue
+        limits[host.strip().lower()] = HostLimit(
+            rate=_positive_float(spec.get("rate")),
+            burst=_positive_int(spec.get("burst"), 1),
+            concurrency=spec.get("concurrency")
+            if isinstance(spec.get("concurrency"), int) and spec.get("concurrency") > 0
+            else None,
+        )
+    return limits
+
+
+def _positive_float(value) -> float | None:
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+        return None
+    return float(value)
+
+
+def _positive_int(value, default: int) -> int:
+    return value if isinstance(value, int) and value > 0 else default
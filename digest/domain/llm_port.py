@@ -15,6 +15,15 @@ class ItemWithSummary:
     image_url: str | None = None
 
 
+@dataclass(frozen=True)
+class SummaryRequest:
+    """Un artículo de un lote de resúmenes; id es la clave con la que vuelve su resumen."""
+
+    id: str
+    title: str
+    snippet: str
+
+
 class LLMPort(Protocol):
     """Contrato del servicio LLM: resumir y rankear."""
 
@@ -22,6 +31,29 @@ class LLMPort(Protocol):
         """Genera un mini resumen en español (2-3 líneas) a partir de título y snippet."""
         ...
 
+    def summarize_batch(self, requests: list[SummaryRequest]) -> dict[str, str]:
+        """
+        Resume varios artículos en una sola petición; devuelve {id: resumen}. Los ids que
+        el modelo no devuelva (tras reintentarlos) no aparecen en el resultado.
+        """
+        ...
+
     def rank(self, items: list[ItemWithSummary], top_n: int = 5) -> list[ItemWithSummary]:
         """Ordena por relevancia y devuelve los top_n más interesantes para AI/ML/DS."""
         ...
+
+
+class AsyncLLMPort(Protocol):
+    """Mismo contrato que LLMPort con corrutinas (clientes async de los SDK)."""
+
+    async def summarize(self, title: str, snippet: str) -> str:
+        """Genera un mini resumen en español (2-3 líneas) a partir de título y snippet."""
+        ...
+
+    async def summarize_batch(self, requests: list[SummaryRequest]) -> dict[str, str]:
+        """Resume varios artículos en una sola petición; devuelve {id: resumen}."""
+        ...
+
+    async def rank(self, items: list[ItemWithSummary], top_n: int = 5) -> list[ItemWithSummary]:
+        """Ordena por relevancia y devuelve los top_n más interesantes para AI/ML/DS."""
+        ...
@@ -0,0 +1,142 @@
+"""Casi duplicados: MinHash vectorizado con NumPy y LSH por bandas sobre títulos y descripciones."""
+
+import re
+import zlib
+from itertools import pairwise
+
+import numpy as np
+
+from .models import Item
+
+# Permutaciones por firma y caracteres de descripción que entran en los shingles.
+NUM_PERM = 64
+DESCRIPTION_CHARS = 300
+# Shingles por bloque al calcular firmas (acota la matriz temporal a ~CHUNK × NUM_PERM).
+CHUNK = 1 << 16
+
+_TOKEN_RE = re.compile(r"[^\W_]+")
+_TAG_RE = re.compile(r"<[^>]+>")
+_MAX_HASH = np.iinfo(np.uint32).max
+
+
+def shingles(text: str) -> set[str]:
+    """Palabras y pares de palabras consecutivas, en minúsculas y sin etiquetas HTML."""
+    words = _TOKEN_RE.findall(_TAG_RE.sub(" ", text).lower())
+    return set(words) | {f"{a} {b}" for a, b in pairwise(words)}
+
+
+def minhash_signatures(
+    docs: list[set[str]], *, num_perm: int = NUM_PERM, seed: int = 0
+) -> np.ndarray:
+    """
+    Firma MinHash (docs × num_perm, uint32) de cada conjunto de shingles. Cada shingle se
+    reduce a su crc32 y cada permutación es un hash multiply-shift ((a·x + b) mod 2^64) >> 32;
+    el mínimo por documento sale de np.minimum.reduceat sobre filas contiguas. Un documento
+    vacío queda con todo al máximo. Las firmas son deterministas (mismo seed → misma firma)
+    y la de una unión de conjuntos es el mínimo elemento a elemento de sus firmas.
+    """
+    signatures = np.full((len(docs), num_perm), _MAX_HASH, dtype=np.uint32)
+    lengths = np.fromiter((len(d) for d in docs), dtype=np.int64, count=len(docs))
+    flat = [s for doc in docs for s in doc]
+    if not flat:
+        return signatures
+    ids = np.fromiter(map(zlib.crc32, map(str.encode, flat)), dtype=np.uint64, count=len(flat))
+    rng = np.random.default_rng(seed)
+    a = rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+    b = rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64)
+
+    non_empty = np.flatnonzero(lengths)
+    starts = np.concatenate(([0], np.cumsum(lengths[non_empty])[:-1]))
+    # Bloques de documentos completos con unos CHUNK shingles cada uno
+    first = 0
+    while first < len(non_empty):
+        last = max(int(np.searchsorted(starts, starts[first] + CHUNK)), first + 1)
+        lo = starts[first]
+        hi = starts[last] if last < len(non_empty) else len(flat)
+        hashed = ((a[:, None] * ids[None, lo:hi] + b[:, None]) >> np.uint64(32)).astype(np.uint32)
+        signatures[non_empty[first:last]] = np.minimum.reduceat(
+            hashed, starts[first:last] - lo, axis=1
+        ).T
+        first = last
+    return signatures
+
+
+def lsh_params(num_perm: int, threshold: float) -> tuple[int, int]:
+    """
+    (bandas, filas) con bandas × filas = num_perm cuyo umbral aproximado (1/b)^(1/r)
+    queda algo por debajo de threshold: se prefiere recall y la verificación descarta el resto.
+    """
+    target = 0.85 * threshold
+    options = [(b, num_perm // b) for b in range(1, num_perm + 1) if num_perm % b == 0]
+    return min(options, key=lambda br: abs((1 / br[0]) ** (1 / br[1]) - target))
+
+
+def candidate_pairs(signatures: np.ndarray, bands: int, rows: int) -> np.ndarray:
+    """
+    Pares (i, j), i < j, que comparten cubo en alguna banda (array k × 2 sin repetir).
+    Cada cubo se agrupa con np.unique sobre las filas de la banda y sus miembros se
+    emparejan con el primero, así el coste es lineal en documentos y no cuadrático.
+    """
+    pairs = [np.empty((0, 2), dtype=np.int64)]
+    for band in range(bands):
+        block = np.ascontiguousarray(signatures[:, band * rows : (band + 1) * rows])
+        keys = block.view(np.dtype((np.void, block.dtype.itemsize * rows))).ravel()
+        _, first, bucket = np.unique(keys, return_index=True, return_inverse=True)
+        head = first[bucket.ravel()]
+        member = np.flatnonzero(head != np.arange(len(keys)))
+        pairs.append(np.column_stack((head[member], member)))
+    return np.unique(np.concatenate(pairs), axis=0)
+
+
+def cluster_near_duplicates(
+    items: list[Item], *, threshold: float = 0.6, num_perm: int = NUM_PERM
+) -> list[list[int]]:
+    """
+    Agrupa ítems casi duplicados: índices por grupo, en orden de primera aparición.
+
+    Hay dos firmas por ítem: la del título y la de título + inicio de la descripción. LSH
+    propone pares que comparten cubo en cualquiera de las dos y se unen si el Jaccard
+    estimado de los títulos llega a threshold, o si lo alcanza el del texto completo y los
+    títulos llegan a la mitad (mismo cuerpo con titular reescrito; una descripción
+    genérica repetida no basta). Un enlace de HN sin descripción se agrupa con el post de
+    Reddit con texto si el título es casi el mismo.
+    """
+    n = len(items)
+    parent = list(range(n))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    if n > 1:
+        bands, rows = lsh_params(num_perm, threshold)
+        titles = [shingles(item.title) for item in items]
+        descriptions = [shingles((item.description or "")[:DESCRIPTION_CHARS]) for item in items]
+        title_sigs = minhash_signatures(titles, num_perm=num_perm)
+        full_sigs = np.minimum(title_sigs, minhash_signatures(descriptions, num_perm=num_perm))
+        pairs = np.unique(
+            np.concatenate(
+                (
+                    candidate_pairs(title_sigs, bands, rows),
+                    candidate_pairs(full_sigs, bands, rows),
+                )
+            ),
+            axis=0,
+        )
+        left, right = pairs[:, 0], pairs[:, 1]
+        title_sim = (title_sigs[left] == title_sigs[right]).mean(axis=1)
+        full_sim = (full_sigs[left] == full_sigs[right]).mean(axis=1)
+        empty = np.fromiter((not t for t in titles), dtype=bool, count=n)
+        keep = (title_sim >= threshold) | ((full_sim >= threshold) & (title_sim >= threshold / 2))
+        keep &= ~empty[left] & ~empty[right]
+        for a, b in pairs[keep].tolist():
+            ra, rb = find(a), find(b)
+            if ra != rb:
+                parent[max(ra, rb)] = min(ra, rb)
+
+    groups: dict[int, list[int]] = {}
+    for i in range(n):
+        groups.setdefault(find(i), []).append(i)
+    return list(groups.values())
@@ -1,46 +1,369 @@
 """Caso de uso: pipeline completo hasta top N con resúmenes (fetch → dedup → filter → LLM → top)."""
 
+import asyncio
+import html
+import logging
+import math
+import re
 from pathlib import Path
 
+from digest.adapters.concurrency import Task, await_or_thread, run_tasks
 from digest.adapters.fetch_og_image import fetch_og_image
+from digest.adapters.llm_prompts import SUMMARY_MAX_TOKENS, summary_prompt
+from digest.adapters.og_cache import OgImageCache
+from digest.adapters.og_prefetch import OgPrefetcher
+from digest.adapters.summary_cache import CachingLLM, SummaryCache
 from digest.config.sources import SourcesConfig
-from digest.domain.llm_port import ItemWithSummary, LLMPort
+from digest.domain.llm_port import AsyncLLMPort, ItemWithSummary, LLMPort, SummaryRequest
+from digest.domain.models import Item
 
 from digest.use_cases.pipeline_core import run_core_pipeline
 
+logger = logging.getLogger(__name__)
+
+# Enriquecimiento OG: peticiones simultáneas y tope total (s) para todas las imágenes.
+OG_MAX_WORKERS = 8
+OG_DEADLINE = 8.0
+# Caracteres de descripción que se envían al LLM y que se usan como resumen de respaldo.
+SNIPPET_CHARS = 1500
+FALLBACK_SUMMARY_CHARS = 280
+
+_TAG_RE = re.compile(r"<[^>]+>")
+
 
 def build_digest(
     sources_config: SourcesConfig,
     links_path: str | Path,
     history_path: str | Path,
-    llm: LLMPort,
+    llm: LLMPort | AsyncLLMPort,
+    *,
+    prefilter_limit: int | None = 30,
+    top_n: int = 5,
+    fetch_timeout: float = 15.0,
+    cache_dir: str | Path | None = None,
+    digests_dir: str | Path | None = None,
+    og_deadline: float | None = OG_DEADLINE,
+) -> list[ItemWithSummary]:
+    """
+    Versión síncrona de build_digest_async (mismos argumentos): abre su propio event loop,
+    así que no puede llamarse desde código que ya corre dentro de uno.
+    """
+    return asyncio.run(
+        build_digest_async(
+            sources_config,
+            links_path,
+            history_path,
+            llm,
+            prefilter_limit=prefilter_limit,
+            top_n=top_n,
+            fetch_timeout=fetch_timeout,
+            cache_dir=cache_dir,
+            digests_dir=digests_dir,
+            og_deadline=og_deadline,
+        )
+    )
+
+
+async def build_digest_async(
+    sources_config: SourcesConfig,
+    links_path: str | Path,
+    history_path: str | Path,
+    llm: LLMPort | AsyncLLMPort,
     *,
     prefilter_limit: int | None = 30,
     top_n: int = 5,
     fetch_timeout: float = 15.0,
+    cache_dir: str | Path | None = None,
+    digests_dir: str | Path | None = None,
+    og_deadline: float | None = OG_DEADLINE,
 ) -> list[ItemWithSummary]:
     """
     Ejecuta el pipeline: candidatos (run_core_pipeline) → resumir cada uno → rankear → top_n.
     Devuelve la lista de ítems con resumen ya ordenada para el email.
+
+    Todo cuelga de un único event loop: el fetch (pool de hilos propio) y la búsqueda de
+    imágenes corren en hilos con asyncio.to_thread; un AsyncLLMPort se await-ea directamente
+    y un LLMPort síncrono se ejecuta en hilos. Los resúmenes se piden en paralelo
+    (llm.summarize_workers; de llm.batch_size en llm.batch_size si es > 1) y conservan el orden.
+    Las imágenes OG del top se buscan en paralelo con un tope total de og_deadline
+    segundos; lo que no llegue a tiempo queda sin imagen. Con cache_dir los resultados
+    (también los negativos) se guardan en cache_dir/og-images.json. Con og.prefetch las
+    búsquedas de todos los candidatos arrancan antes de resumir y el top solo las recoge.
+    Con cache_dir los resúmenes también se reutilizan (cache_dir/summaries.json): un
+    artículo con el mismo modelo, prompt, título y snippet no se vuelve a resumir.
+    Con llm.shortlist_factor > 0 un pre-ranking solo por título y fuente deja
+    shortlist_factor × top_n candidatos (nunca menos de top_n) y solo esos se resumen.
+    Con digests_dir el prefiltro prioriza en cada fuente lo más parecido a los digests
+    anteriores.
     """
-    candidates = run_core_pipeline(
+    candidates = await asyncio.to_thread(
+        run_core_pipeline,
         sources_config,
         links_path,
         history_path,
         prefilter_limit=prefilter_limit,
         fetch_timeout=fetch_timeout,
+        cache_dir=cache_dir,
+        digests_dir=digests_dir,
     )
     if not candidates:
         return []
-    # Resumir cada candidato
-    with_summaries: list[ItemWithSummary] = []
-    for item in candidates:
-        snippet = (item.description or "")[:1500]
-        summary = llm.summarize(item.title, snippet)
-        with_summaries.append(ItemWithSummary(item=item, summary=summary))
-    # Rankear y quedarnos con top_n
-    ranked = llm.rank(with_summaries, top_n=top_n)
-    # Enriquecer con imagen OG (solo los top_n para minimizar requests)
-    for x in ranked:
-        x.image_url = fetch_og_image(x.item.url)
+    og_config = sources_config.og
+    og_cache = OgImageCache.from_config(cache_dir, og_config) if cache_dir is not None else None
+    prefetcher = (
+        OgPrefetcher(
+            (item.url for item in candidates),
+            lambda url: fetch_og_image(url, cache=og_cache),
+            max_requests=og_config.prefetch_max,
+            max_workers=OG_MAX_WORKERS,
+        )
+        if og_config.prefetch
+        else None
+    )
+    summary_cache = (
+        SummaryCache.from_config(cache_dir, sources_config.llm) if cache_dir is not None else None
+    )
+    try:
+        if sources_config.llm.shortlist_factor > 0:
+            candidates = await shortlist_candidates(
+                candidates,
+                llm,
+                keep=max(top_n, math.ceil(top_n * sources_config.llm.shortlist_factor)),
+                chunk_size=sources_config.llm.rank_chunk_size,
+                max_workers=sources_config.llm.summarize_workers,
+            )
+        with_summaries = await summarize_candidates(
+            candidates,
+            CachingLLM(llm, summary_cache) if summary_cache is not None else llm,
+            max_workers=sources_config.llm.summarize_workers,
+            batch_size=sources_config.llm.batch_size,
+        )
+        if summary_cache is not None:
+            logger.info(
+                "Caché de resúmenes: %d hits, %d misses (%.0f %%)",
+                summary_cache.hits,
+                summary_cache.misses,
+                summary_cache.hit_rate * 100,
+            )
+            _save_cache(summary_cache, "summaries")
+        # Rankear y quedarnos con top_n
+        ranked = await rank_candidates(
+            with_summaries,
+            llm,
+            top_n=top_n,
+            chunk_size=sources_config.llm.rank_chunk_size,
+            max_workers=sources_config.llm.summarize_workers,
+        )
+        # Enriquecer con imagen OG (solo los top_n, o recoger lo ya prefetcheado)
+        await asyncio.to_thread(
+            enrich_with_og_images,
+            ranked,
+            deadline=og_deadline,
+            cache=og_cache,
+            prefetcher=prefetcher,
+        )
+    finally:
+        if prefetcher is not None:
+            stats = prefetcher.close()
+            logger.info(
+                "Prefetch OG: %d búsquedas, %d aprovechadas, %d extra, %d canceladas, "
+                "%d candidatos sobre el tope",
+                stats.submitted,
+                stats.used,
+                stats.extra,
+                stats.cancelled,
+                stats.over_cap,
+            )
+    if og_cache is not None:
+        logger.info("Caché OG: %d hits, %d misses", og_cache.hits, og_cache.misses)
+        _save_cache(og_cache, "og-images")
     return ranked
+
+
+def _save_cache(cache: OgImageCache | SummaryCache, name: str) -> None:
+    try:
+        cache.save()
+    except OSError as e:
+        logger.warning("No se pudo guardar la caché %s: %s", name, e)
+
+
+async def summarize_candidates(
+    candidates: list[Item],
+    llm: LLMPort | AsyncLLMPort,
+    *,
+    max_workers: int = 4,
+    batch_size: int = 1,
+) -> list[ItemWithSummary]:
+    """
+    Resume los candidatos con hasta max_workers llamadas simultáneas al LLM, en el mismo
+    orden que la entrada. Con batch_size > 1 (y un LLM con summarize_batch) van de
+    batch_size en batch_size por petición; lo que un lote no devuelva se pide de uno en
+    uno. Si una llamada falla, ese ítem lleva fallback_summary().
+    """
+    semaphore = asyncio.Semaphore(max(1, max_workers))
+    summaries: list[str | None] = [None] * len(candidates)
+    summarize_batch = getattr(llm, "summarize_batch", None)
+
+    async def summarize_chunk(indices: range) -> None:
+        requests = [
+            SummaryRequest(id=str(i), title=candidates[i].title, snippet=_snippet(candidates[i]))
+            for i in indices
+        ]
+        async with semaphore:
+            try:
+                found = await await_or_thread(summarize_batch, requests)
+            except Exception as e:  # noqa: BLE001
+                logger.warning("Lote de %d resúmenes falló: %s", len(requests), e)
+                return
+        for i in indices:
+            summaries[i] = found.get(str(i))
+
+    async def summarize_one(index: int) -> None:
+        item = candidates[index]
+        async with semaphore:
+            try:
+                summaries[index] = await await_or_thread(llm.summarize, item.title, _snippet(item))
+            except Exception as e:  # noqa: BLE001
+                logger.warning("Resumen de %s falló: %s", item.url, e)
+
+    if summarize_batch is not None and batch_size > 1 and len(candidates) > 1:
+        chunks = [
+            range(start, min(start + batch_size, len(candidates)))
+            for start in range(0, len(candidates), batch_size)
+        ]
+        await asyncio.gather(*(summarize_chunk(chunk) for chunk in chunks))
+        pending = [i for i, summary in enumerate(summaries) if summary is None]
+        if pending:
+            logger.info("%d resúmenes no llegaron en lote; se piden de uno en uno", len(pending))
+    else:
+        pending = list(range(len(candidates)))
+    await asyncio.gather(*(summarize_one(i) for i in pending))
+
+    failed = sum(1 for summary in summaries if summary is None)
+    if failed:
+        logger.warning(
+            "%d de %d resúmenes fallaron; se usa la descripción", failed, len(candidates)
+        )
+    return [
+        ItemWithSummary(
+            item=item, summary=summary if summary is not None else fallback_summary(item)
+        )
+        for item, summary in zip(candidates, summaries, strict=True)
+    ]
+
+
+async def shortlist_candidates(
+    candidates: list[Item],
+    llm: LLMPort | AsyncLLMPort,
+    *,
+    keep: int,
+    chunk_size: int = 0,
+    max_workers: int = 4,
+) -> list[Item]:
+    """
+    Primera etapa del flujo en dos etapas: rank_candidates sin resúmenes (el prompt solo
+    lleva título, URL y fuente) para quedarse con keep candidatos, en el orden del pre-ranking.
+    Registra cuántos resúmenes y tokens de prompt (estimados como caracteres / 4) se evitan.
+    """
+    if len(candidates) <= keep:
+        return candidates
+    bare = [ItemWithSummary(item=item, summary="") for item in candidates]
+    ranked = await rank_candidates(
+        bare, llm, top_n=keep, chunk_size=chunk_size, max_workers=max_workers
+    )
+    shortlist = [x.item for x in ranked]
+    kept = set(shortlist)
+    skipped = [item for item in candidates if item not in kept]
+    prompt_chars = sum(len(summary_prompt(item.title, _snippet(item))) for item in skipped)
+    logger.info(
+        "Dos etapas: %d candidatos → %d por título; %d resúmenes evitados "
+        "(~%d tokens de prompt y hasta %d de salida)",
+        len(candidates),
+        len(shortlist),
+        len(skipped),
+        prompt_chars // 4,
+        len(skipped) * SUMMARY_MAX_TOKENS,
+    )
+    return shortlist
+
+
+async def rank_candidates(
+    items: list[ItemWithSummary],
+    llm: LLMPort | AsyncLLMPort,
+    *,
+    top_n: int = 5,
+    chunk_size: int = 0,
+    max_workers: int = 4,
+) -> list[ItemWithSummary]:
+    """
+    llm.rank en una sola llamada, o por rondas si chunk_size > 0 y hay más candidatos:
+    se reparten en trozos de chunk_size, cada trozo se rankea en paralelo (hasta
+    max_workers llamadas) y sus top_n pasan a la ronda siguiente, hasta que caben en
+    una llamada final. Cada prompt queda acotado a chunk_size artículos y ningún ítem
+    del top_n global se pierde por el camino (también es top_n de su trozo).
+    """
+    # Un trozo tiene que poder devolver más de top_n para que las rondas reduzcan.
+    chunk_size = max(chunk_size, top_n + 1) if chunk_size > 0 else 0
+    semaphore = asyncio.Semaphore(max(1, max_workers))
+
+    async def rank_chunk(chunk: list[ItemWithSummary]) -> list[ItemWithSummary]:
+        async with semaphore:
+            return await await_or_thread(llm.rank, chunk, top_n=top_n)
+
+    rounds = 0
+    while chunk_size and len(items) > chunk_size:
+        chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+        winners = await asyncio.gather(*(rank_chunk(chunk) for chunk in chunks))
+        items = [x for chunk_winners in winners for x in chunk_winners]
+        rounds += 1
+        logger.info(
+            "Ranking por trozos, ronda %d: %d trozos → %d finalistas",
+            rounds,
+            len(chunks),
+            len(items),
+        )
+    return await await_or_thread(llm.rank, items, top_n=top_n)
+
+
+def _snippet(item: Item) -> str:
+    return (item.description or "")[:SNIPPET_CHARS]
+
+
+def fallback_summary(item: Item) -> str:
+    """Principio de la descripción en texto plano (o el título si no hay descripción)."""
+    text = " ".join(html.unescape(_TAG_RE.sub(" ", item.description or "")).split())
+    if not text:
+        return item.title
+    if len(text) <= FALLBACK_SUMMARY_CHARS:
+        return text
+    return text[:FALLBACK_SUMMARY_CHARS].rsplit(" ", 1)[0] + "…"
+
+
+def enrich_with_og_images(
+    items: list[ItemWithSummary],
+    *,
+    deadline: float | None = OG_DEADLINE,
+    max_workers: int = OG_MAX_WORKERS,
+    cache: OgImageCache | None = None,
+    prefetcher: OgPrefetcher | None = None,
+) -> None:
+    """
+    Rellena image_url de cada ítem buscando og:image en paralelo (con cache, solo red
+    para las URLs que no estén ya resueltas). Las URLs que el prefetcher ya lanzó se
+    recogen de él en lugar de pedirse de nuevo.
+
+    deadline es el tope total del conjunto: las búsquedas que no terminan a tiempo
+    se abandonan y su ítem queda con image_url=None (el email no depende de ellas).
+    """
+
+    def lookup(url: str) -> str | None:
+        if prefetcher is not None and url in prefetcher:
+            return prefetcher.result(url)
+        return fetch_og_image(url, cache=cache)
+
+    tasks = [
+        Task(label=f"Imagen OG {x.item.url}", fn=lambda url=x.item.url: lookup(url)) for x in items
+    ]
+    images = run_tasks(tasks, max_workers=max_workers, overall_deadline=deadline)
+    for x, image_url in zip(items, images, strict=True):
+        x.image_url = image_url
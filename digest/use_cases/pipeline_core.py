@@ -1,15 +1,22 @@
 """Núcleo del pipeline: dedup, filtro ya enviados, frescura, prefiltro y orquestación (Fase 4)."""
 
+import logging
+from collections.abc import Sequence
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from digest.config.digest_history import load_digest_titles
 from digest.config.history import load_sent_urls
 from digest.config.sources import SourcesConfig
 from digest.domain.models import Item
+from digest.domain.near_dup import cluster_near_duplicates
+from digest.domain.relevance import RelevanceScorer
 from digest.domain.urls import normalize_url
 
 from digest.adapters.fetch_all import fetch_all_items
 
+logger = logging.getLogger(__name__)
+
 
 def dedup_by_url(items: list[Item]) -> list[Item]:
     """
@@ -26,6 +33,17 @@ def dedup_by_url(items: list[Item]) -> list[Item]:
     return result
 
 
+def collapse_near_duplicates(items: list[Item], threshold: float = 0.6) -> list[Item]:
+    """
+    Deja un ítem por grupo de casi duplicados (MinHash/LSH sobre título y descripción):
+    el primero visto, como dedup_by_url. Conserva el orden.
+    """
+    groups = cluster_near_duplicates(items, threshold=threshold)
+    if len(groups) < len(items):
+        logger.info("Casi duplicados: %d candidatos → %d historias", len(items), len(groups))
+    return [items[group[0]] for group in groups]
+
+
 def filter_already_sent(items: list[Item], sent_urls: set[str]) -> list[Item]:
     """
     Descarta ítems cuya URL normalizada está en el historial de ya enviados.
@@ -53,14 +71,20 @@ def filter_stale(
 def prefilter_candidates(
     items: list[Item],
     limit: int | None = 30,
+    scores: Sequence[float] | None = None,
 ) -> list[Item]:
     """
     Si hay más de `limit` candidatos, selecciona round-robin por fuente
     para que todas las fuentes estén representadas (evita que RSS acapare todo).
     Si limit es None, no recorta. Usado para acotar coste/tiempo de LLM (RNF-02).
+    Con scores (uno por ítem, mayor = más relevante) cada fuente aporta primero sus
+    ítems más relevantes; el reparto de huecos entre fuentes es el mismo.
     """
     if limit is None or len(items) <= limit:
         return items
+    if scores is not None:
+        order = sorted(range(len(items)), key=lambda i: -scores[i])
+        items = [items[i] for i in order]
     by_source: dict[str, list[Item]] = {}
     for item in items:
         by_source.setdefault(item.source, []).append(item)
@@ -88,15 +112,30 @@ def run_core_pipeline(
     prefilter_limit: int | None = 30,
     fetch_timeout: float = 15.0,
     max_age_days: int = 90,
+    cache_dir: str | Path | None = None,
+    digests_dir: str | Path | None = None,
 ) -> list[Item]:
     """
     Orquesta: carga historial → fetch todas las fuentes → unión → dedup
-    → filtro ya enviados → filtro frescura → prefiltro balanceado.
+    → casi duplicados (dedup.near_dup) → filtro ya enviados → filtro frescura
+    → prefiltro balanceado.
     Devuelve lista de candidatos lista para LLM. No llama a LLM ni email.
+    cache_dir activa las cachés HTTP persistentes de los adaptadores.
+    Con digests_dir el prefiltro ordena cada fuente por relevancia (RelevanceScorer
+    sembrado con los títulos de los digests anteriores), sin llamadas a la API.
     """
     sent_urls = load_sent_urls(history_path)
-    combined = fetch_all_items(sources_config, links_path, timeout=fetch_timeout)
+    combined = fetch_all_items(
+        sources_config, links_path, timeout=fetch_timeout, cache_dir=cache_dir
+    )
     deduped = dedup_by_url(combined)
+    if sources_config.dedup.near_dup:
+        deduped = collapse_near_duplicates(deduped, sources_config.dedup.near_dup_threshold)
     filtered = filter_already_sent(deduped, sent_urls)
     fresh = filter_stale(filtered, max_age_days=max_age_days)
-    return prefilter_candidates(fresh, limit=prefilter_limit)
+    scores = None
+    if digests_dir is not None and prefilter_limit is not None and len(fresh) > prefilter_limit:
+        scorer = RelevanceScorer(load_digest_titles(digests_dir))
+        if not scorer.empty:
+            scores = scorer.score(fresh)
+    return prefilter_candidates(fresh, limit=prefilter_limit, scores=scores)
@@ -6,6 +6,7 @@ Credenciales y email desde variables de entorno (RF-17). Ejecutar desde la raíz
 o definir REPO_ROOT.
 """
 
+import asyncio
 import logging
 import os
 import sys
@@ -17,13 +18,15 @@ if str(_repo_root) not in sys.path:
     sys.path.insert(0, str(_repo_root))
 
 from digest.adapters.email_sendgrid import SendGridEmail, build_and_send_digest  # noqa: E402
-from digest.adapters.llm_anthropic import AnthropicLLM  # noqa: E402
-from digest.adapters.llm_openai import OpenAILLM  # noqa: E402
+from digest.adapters.fetch_all import commit_hn_watermarks  # noqa: E402
+from digest.adapters.http_session import close_session, configure_session  # noqa: E402
+from digest.adapters.llm_anthropic import AsyncAnthropicLLM  # noqa: E402
+from digest.adapters.llm_openai import AsyncOpenAILLM  # noqa: E402
 from digest.config.digest_history import save_digest_markdown  # noqa: E402
 from digest.config.history import load_sent_urls, save_sent_urls  # noqa: E402
-from digest.config.sources import load_sources  # noqa: E402
+from digest.config.sources import LlmConfig, load_sources  # noqa: E402
 from digest.domain.urls import normalize_url  # noqa: E402
-from digest.use_cases.build_digest import build_digest  # noqa: E402
+from digest.use_cases.build_digest import build_digest_async  # noqa: E402
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
@@ -34,6 +37,8 @@ SOURCES_PATH = REPO_ROOT / "config" / "sources.yaml"
 LINKS_PATH = REPO_ROOT / "config" / "links.md"
 HISTORY_PATH = REPO_ROOT / "data" / "sent-urls.json"
 DIGESTS_DIR = REPO_ROOT / "data" / "digests"
+# Cachés HTTP entre ejecuciones (no versionadas; en CI se restauran con actions/cache)
+CACHE_DIR = Path(os.environ.get("DIGEST_CACHE_DIR", REPO_ROOT / ".cache"))
 
 
 def _require_env(name: str) -> str:
@@ -44,14 +49,23 @@ def _require_env(name: str) -> str:
     return value.strip()
 
 
-def _make_llm() -> OpenAILLM | AnthropicLLM:
-    """Crea el adaptador LLM según LLM_PROVIDER (openai | anthropic)."""
+def _make_llm(config: LlmConfig) -> AsyncOpenAILLM | AsyncAnthropicLLM:
+    """Crea el adaptador LLM (cliente async) según LLM_PROVIDER (openai | anthropic)."""
     provider = os.environ.get("LLM_PROVIDER", "openai").lower()
+    options = {"timeout": config.request_timeout, "max_connections": config.max_connections}
     if provider == "anthropic":
         logger.info("Usando proveedor LLM: Anthropic")
-        return AnthropicLLM()
+        return AsyncAnthropicLLM(**options)
     logger.info("Usando proveedor LLM: OpenAI")
-    return OpenAILLM()
+    return AsyncOpenAILLM(**options)
+
+
+async def _build(llm: AsyncOpenAILLM | AsyncAnthropicLLM, **kwargs):
+    """build_digest_async y cierre del cliente LLM en el mismo event loop."""
+    try:
+        return await build_digest_async(llm=llm, **kwargs)
+    finally:
+        await llm.aclose()
 
 
 def main() -> None:
@@ -61,17 +75,37 @@ def main() -> None:
     _require_env("LLM_API_KEY")
 
     sources_config = load_sources(SOURCES_PATH)
-    llm = _make_llm()
+    llm = _make_llm(sources_config.llm)
     email = SendGridEmail()
 
-    top_items = build_digest(
-        sources_config,
-        LINKS_PATH,
-        HISTORY_PATH,
-        llm,
-        prefilter_limit=30,
-        top_n=5,
-    )
+    session = configure_session(sources_config.fetch)
+    try:
+        top_items = asyncio.run(
+            _build(
+                llm,
+                sources_config=sources_config,
+                links_path=LINKS_PATH,
+                history_path=HISTORY_PATH,
+                prefilter_limit=30,
+                top_n=5,
+                cache_dir=CACHE_DIR,
+                digests_dir=DIGESTS_DIR,
+            )
+        )
+    finally:
+        stats = session.stats
+        logger.info(
+            "HTTP: %d peticiones, %d conexiones abiertas, %d reutilizadas",
+            stats.requests,
+            stats.connections_opened,
+            stats.connections_reused,
+        )
+        if session.limiter is not None and (waited := session.limiter.waited()):
+            logger.info(
+                "Esperas por límite de tasa: %s",
+                ", ".join(f"{host} {secs:.1f}s" for host, secs in sorted(waited.items())),
+            )
+        close_session()
 
     if not top_items:
         logger.info("No hay candidatos para el digest; no se envía email.")
@@ -79,6 +113,8 @@ def main() -> None:
 
     build_and_send_digest(email, top_items, to=to_email)
     logger.info("Email enviado a %s con %d ítems.", to_email, len(top_items))
+    # Solo ahora las historias de HN de esta ejecución cuentan como vistas
+    commit_hn_watermarks(CACHE_DIR)
 
     # Persistir digest como Markdown (historial legible)
     digest_path = save_digest_markdown(top_items, DIGESTS_DIR)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Inspección y limpieza de las cachés HTTP del digest (.cache/ o DIGEST_CACHE_DIR).
+
+Uso:
+    python scripts/digest_cache.py stats            # resumen de todas las cachés
+    python scripts/digest_cache.py list hn-search   # entradas con edad y expiración
+    python scripts/digest_cache.py clear [nombre]   # borra una caché o todas
+    python scripts/digest_cache.py health           # salud y circuit breaker por fuente
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+_repo_root = Path(__file__).resolve().parent.parent
+if str(_repo_root) not in sys.path:
+    sys.path.insert(0, str(_repo_root))
+
+from digest.adapters.cache_store import CACHE_FILES, JsonCache
+
+REPO_ROOT = Path(os.environ.get("REPO_ROOT", _repo_root))
+CACHE_DIR = Path(os.environ.get("DIGEST_CACHE_DIR", REPO_ROOT / ".cache"))
+
+
+def _selected(name: str | None) -> dict[str, Path]:
+    if name is None:
+        return {n: CACHE_DIR / f for n, f in CACHE_FILES.items()}
+    if name not in CACHE_FILES:
+        sys.exit(f"Caché desconocida: {name} (opciones: {', '.join(CACHE_FILES)})")
+    return {name: CACHE_DIR / CACHE_FILES[name]}
+
+
+def cmd_stats(name: str | None) -> None:
+    now = time.time()
+    for cache_name, path in _selected(name).items():
+        if not path.exists():
+            print(f"{cache_name:<12} (vacía)")
+            continue
+        entries = JsonCache(path).entries()
+        expired = sum(1 for e in entries.values() if (e.get("expires_at") or now + 1) <= now)
+        print(
+            f"{cache_name:<12} {len(entries):>5} entradas  {expired:>4} expiradas  "
+            f"{path.stat().st_size:>9} bytes  {path}"
+        )
+
+
+def cmd_list(name: str) -> None:
+    now = time.time()
+    for key, entry in sorted(JsonCache(_selected(name)[name]).entries().items()):
+        age = now - entry.get("stored_at", now)
+        expires_at = entry.get("expires_at")
+        expiry = "nunca" if expires_at is None else f"{expires_at - now:+.0f}s"
+        print(f"edad {age:>8.0f}s  expira {expiry:>10}  {key}")
+
+
+def cmd_clear(name: str | None) -> None:
+    for cache_name, path in _selected(name).items():
+        if path.exists():
+            path.unlink()
+            print(f"Borrada {cache_name}: {path}")
+
+
+def cmd_health() -> None:
+    now = time.time()
+    path = CACHE_DIR / CACHE_FILES["source-health"]
+    entries = JsonCache(path).entries()
+    if not entries:
+        print("Sin historial de fuentes")
+        return
+    print(
+        f"{'estado':<8} {'ok':>4} {'fallos':>6} {'seguidos':>8} {'omit.':>5}  fuente / último error"
+    )
+    for label, entry in sorted(entries.items()):
+        record = entry["value"]
+        open_until = record.get("open_until")
+        state = "abierto" if open_until and open_until > now else "cerrado"
+        if open_until and open_until <= now:
+            state = "sondeo"
+        print(
+            f"{state:<8} {record.get('successes', 0):>4} {record.get('failures', 0):>6} "
+            f"{record.get('consecutive_failures', 0):>8} {record.get('skipped', 0):>5}  {label}"
+        )
+        if record.get("consecutive_failures") and record.get("last_error"):
+            print(f"{'':<36}{record['last_error']}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("stats", help="resumen por caché").add_argument("name", nargs="?")
+    sub.add_parser("list", help="entradas de una caché").add_argument("name")
+    sub.add_parser("clear", help="borra una caché o todas").add_argument("name", nargs="?")
+    sub.add_parser("health", help="salud y circuit breaker por fuente")
+    args = parser.parse_args()
+
+    if args.command == "stats":
+        cmd_stats(args.name)
+    elif args.command == "list":
+        cmd_list(args.name)
+    elif args.command == "health":
+        cmd_health()
+    else:
+        cmd_clear(args.name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Tests de la caché JSON persistente (TTL, LRU, archivo corrupto)."""
+
+from pathlib import Path
+
+from digest.adapters.cache_store import JsonCache
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_missing_counts_miss(tmp_path: Path) -> None:
+    cache = JsonCache(tmp_path / "c.json")
+    assert cache.get("x") is None
+    assert cache.misses == 1 and cache.hits == 0
+
+
+def test_set_get_and_persist(tmp_path: Path) -> None:
+    cache = JsonCache(tmp_path / "c.json")
+    cache.set("k", {"a": [1, 2]})
+    assert cache.get("k") == {"a": [1, 2]}
+    cache.save()
+    reloaded = JsonCache(tmp_path / "c.json")
+    assert reloaded.get("k") == {"a": [1, 2]}
+
+
+def test_ttl_expires_entries(tmp_path: Path) -> None:
+    clock = FakeClock()
+    cache = JsonCache(tmp_path / "c.json", ttl=60, clock=clock)
+    cache.set("k", 1)
+    clock.now += 59
+    assert cache.get("k") == 1
+    clock.now += 2
+    assert cache.get("k") is None
+    assert len(cache) == 0
+
+
+def test_per_entry_ttl_overrides_default(tmp_path: Path) -> None:
+    clock = FakeClock()
+    cache = JsonCache(tmp_path / "c.json", ttl=1000, clock=clock)
+    cache.set("short", 1, ttl=10)
+    cache.set("long", 2)
+    clock.now += 11
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+
+
+def test_evicts_least_recently_used(tmp_path: Path) -> None:
+    clock = FakeClock()
+    cache = JsonCache(tmp_path / "c.json", max_entries=2, clock=clock)
+    cache.set("a", 1)
+    clock.now += 1
+    cache.set("b", 2)
+    clock.now += 1
+    cache.get("a")  # "a" pasa a ser la más reciente
+    clock.now += 1
+    cache.set("c", 3)
+    assert set(cache.entries()) == {"a", "c"}
+
+
+def test_peek_does_not_count(tmp_path: Path) -> None:
+    cache = JsonCache(tmp_path / "c.json")
+    cache.set("k", 1)
+    assert cache.peek("k") == 1 and cache.peek("z") is None
+    assert cache.hits == 0 and cache.misses == 0
+
+
+def test_corrupt_file_is_empty_cache(tmp_path: Path) -> None:
+    (tmp_path / "c.json").write_text("no es json {")
+    cache = JsonCache(tmp_path / "c.json")
+    assert len(cache) == 0
+    cache.set("k", 1)
+    cache.save()
+    assert JsonCache(tmp_path / "c.json").get("k") == 1
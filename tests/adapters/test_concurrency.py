@@ -0,0 +1,92 @@
+"""Tests del pool acotado de tareas (fan-out por fuente con deadline)."""
+
+import threading
+import time
+
+from digest.adapters.concurrency import Task, run_tasks
+
+
+def test_run_tasks_empty():
+    assert run_tasks([]) == []
+
+
+def test_run_tasks_preserves_order():
+    def make(i: int, delay: float):
+        def fn():
+            time.sleep(delay)
+            return i
+
+        return fn
+
+    tasks = [Task(label=f"t{i}", fn=make(i, 0.05 * (3 - i))) for i in range(3)]
+    assert run_tasks(tasks, max_workers=3) == [0, 1, 2]
+
+
+def test_run_tasks_failure_does_not_abort_others():
+    def boom():
+        raise RuntimeError("caído")
+
+    tasks = [Task(label="ok", fn=lambda: 1), Task(label="bad", fn=boom), Task("ok2", lambda: 3)]
+    assert run_tasks(tasks, max_workers=2) == [1, None, 3]
+
+
+def test_run_tasks_runs_concurrently():
+    """Las cinco tareas solo cruzan la barrera si corren a la vez; si no, fallan (None)."""
+    barrier = threading.Barrier(5, timeout=2.0)
+
+    def fn():
+        barrier.wait()
+        return "x"
+
+    tasks = [Task(label=f"t{i}", fn=fn) for i in range(5)]
+    assert run_tasks(tasks, max_workers=5) == ["x"] * 5
+
+
+def test_run_tasks_respects_max_workers():
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def fn():
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        return True
+
+    run_tasks([Task(label=str(i), fn=fn) for i in range(8)], max_workers=2)
+    assert peak <= 2
+
+
+def test_run_tasks_task_deadline_drops_slow_task():
+    release = threading.Event()
+
+    def slow():
+        release.wait(2.0)
+        return "tarde"
+
+    tasks = [Task(label="slow", fn=slow), Task(label="fast", fn=lambda: "rápido")]
+    try:
+        result = run_tasks(tasks, max_workers=2, task_deadline=0.2)
+    finally:
+        release.set()
+    assert result == [None, "rápido"]
+
+
+def test_run_tasks_deadline_counts_from_task_start():
+    """Una tarea encolada detrás de otra no pierde su deadline por la espera."""
+    tasks = [Task(label=f"t{i}", fn=lambda: time.sleep(0.15) or "ok") for i in range(3)]
+    assert run_tasks(tasks, max_workers=1, task_deadline=0.4) == ["ok", "ok", "ok"]
+
+
+def test_run_tasks_overall_deadline():
+    release = threading.Event()
+    tasks = [Task(label="slow", fn=lambda: release.wait(2.0))]
+    try:
+        result = run_tasks(tasks, overall_deadline=0.1)
+    finally:
+        release.set()
+    assert result == [None]
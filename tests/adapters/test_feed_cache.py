@@ -0,0 +1,71 @@
+"""Tests del GET condicional (ETag / Last-Modified) en RSS y Reddit."""
+
+from pathlib import Path
+
+from digest.adapters.feed_cache import FeedCache
+from digest.adapters.input_reddit import _fetch_subreddit_rss
+from digest.adapters.input_rss import _fetch_one_feed
+
+FEED = """<?xml version="1.0"?>
+<rss version="2.0"><channel>
+  <item><title>Post</title><link>https://example.com/post</link>
+  <description>Resumen</description></item>
+</channel></rss>
+"""
+
+
+def test_first_fetch_stores_validators(httpx_mock, tmp_path: Path) -> None:
+    httpx_mock.add_response(
+        url="https://example.com/feed.xml",
+        text=FEED,
+        headers={"ETag": '"v1"', "Last-Modified": "Mon, 02 Mar 2026 10:00:00 GMT"},
+    )
+    cache = FeedCache(tmp_path / "feeds.json")
+    items = _fetch_one_feed("https://example.com/feed.xml", timeout=5.0, cache=cache)
+    assert [i.url for i in items] == ["https://example.com/post"]
+    assert cache.stats.misses == 1 and cache.stats.hits == 0
+    assert cache.conditional_headers("https://example.com/feed.xml") == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 02 Mar 2026 10:00:00 GMT",
+    }
+
+
+def test_304_reuses_items_without_parsing(httpx_mock, tmp_path: Path, monkeypatch) -> None:
+    httpx_mock.add_response(url="https://example.com/feed.xml", text=FEED, headers={"ETag": "v1"})
+    cache = FeedCache(tmp_path / "feeds.json")
+    first = _fetch_one_feed("https://example.com/feed.xml", timeout=5.0, cache=cache)
+    cache.save()
+
+    httpx_mock.add_response(
+        url="https://example.com/feed.xml",
+        status_code=304,
+        match_headers={"If-None-Match": "v1"},
+    )
+
+    def no_parse(*args, **kwargs):
+        raise AssertionError("no se debe parsear ante un 304")
+
+    monkeypatch.setattr("digest.adapters.input_rss.parse_payload", no_parse)
+    reloaded = FeedCache(tmp_path / "feeds.json")
+    again = _fetch_one_feed("https://example.com/feed.xml", timeout=5.0, cache=reloaded)
+    assert again == first
+    assert reloaded.stats.hits == 1
+    assert reloaded.stats.bytes_saved == len(FEED.encode())
+
+
+def test_response_without_validators_is_not_cached(httpx_mock, tmp_path: Path) -> None:
+    httpx_mock.add_response(url="https://example.com/feed.xml", text=FEED)
+    cache = FeedCache(tmp_path / "feeds.json")
+    _fetch_one_feed("https://example.com/feed.xml", timeout=5.0, cache=cache)
+    assert cache.conditional_headers("https://example.com/feed.xml") == {}
+
+
+def test_reddit_conditional_get(httpx_mock, tmp_path: Path) -> None:
+    url = "https://www.reddit.com/r/ml/.rss?limit=5"
+    httpx_mock.add_response(url=url, text=FEED, headers={"ETag": "r1"})
+    httpx_mock.add_response(url=url, status_code=304, match_headers={"If-None-Match": "r1"})
+    cache = FeedCache(tmp_path / "feeds.json")
+    first = _fetch_subreddit_rss("ml", 5, timeout=5.0, cache=cache)
+    second = _fetch_subreddit_rss("ml", 5, timeout=5.0, cache=cache)
+    assert first == second and first[0].source == "reddit"
+    assert cache.stats.hits == 1 and cache.stats.misses == 1
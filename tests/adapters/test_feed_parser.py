@@ -0,0 +1,99 @@
+"""Tests del parser nativo de RSS/Atom y de su respaldo con feedparser."""
+
+from digest.adapters.feed_parser import (
+    FeedEntry,
+    normalize_date,
+    parse_feed,
+    parse_with_feedparser,
+)
+from digest.adapters.feed_stream import parse_payload, read_feed
+
+RSS = b"""<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/"
+     xmlns:atom="http://www.w3.org/2005/Atom">
+<channel><title>Blog</title>
+  <item>
+    <title>  Post &amp; more </title>
+    <atom:link rel="self" href="https://blog.example.com/feed"/>
+    <link>https://blog.example.com/post</link>
+    <description><![CDATA[<p>Resumen</p>]]></description>
+    <pubDate>Tue, 02 Jan 2024 23:30:00 -0300</pubDate>
+    <guid isPermaLink="false">id-1</guid>
+    <category>ML</category>
+  </item>
+  <item>
+    <title>Solo guid</title>
+    <guid>https://blog.example.com/guid-post</guid>
+    <content:encoded>Cuerpo</content:encoded>
+  </item>
+</channel></rss>"""
+
+ATOM = b"""<?xml version="1.0"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <id>t3_abc</id>
+    <title>Atom post</title>
+    <link rel="replies" href="https://example.com/comments"/>
+    <link href="https://example.com/post"/>
+    <category term="MachineLearning" label="r/MachineLearning"/>
+    <published>2024-03-05T10:00:00+00:00</published>
+    <content type="xhtml"><div xmlns="http://www.w3.org/1999/xhtml"><b>Hola</b> mundo</div>
+    </content>
+  </entry>
+</feed>"""
+
+
+def test_rss_entry_fields():
+    first, second = parse_feed(RSS)
+    assert first == FeedEntry(
+        title="Post & more",
+        link="https://blog.example.com/post",
+        description="<p>Resumen</p>",
+        date="2024-01-03",  # 23:30 -03:00 es el día siguiente en UTC
+        id="id-1",
+        categories=("ML",),
+    )
+    assert second.link == "https://blog.example.com/guid-post"
+    assert second.description == "Cuerpo"
+    assert second.date is None
+
+
+def test_atom_entry_fields():
+    (entry,) = parse_feed(ATOM)
+    assert entry.link == "https://example.com/post"
+    assert entry.id == "t3_abc"
+    assert entry.categories == ("MachineLearning",)
+    assert entry.date == "2024-03-05"
+    assert entry.description == "Hola mundo"
+
+
+def test_matches_feedparser_on_well_formed_feeds():
+    for doc in (RSS, ATOM):
+        native = parse_feed(doc)
+        reference = parse_with_feedparser(doc)
+        assert [(e.title, e.link, e.date, e.id) for e in native] == [
+            (e.title, e.link, e.date, e.id) for e in reference
+        ]
+
+
+def test_parse_feed_stops_at_max_entries_and_accepts_a_cut_prefix():
+    assert [e.id for e in parse_feed(RSS, max_entries=1)] == ["id-1"]
+    # Descarga cortada tras la primera entrada: no es XML mal formado
+    cut = RSS[: RSS.index(b"</item>") + len(b"</item>")]
+    assert [e.id for e in parse_feed(cut)] == ["id-1"]
+
+
+def test_normalize_date_keeps_unknown_text():
+    assert normalize_date("2024-01-02") == "2024-01-02"
+    assert normalize_date("2024-01-02T10:00:00Z") == "2024-01-02"
+    assert normalize_date("ayer") == "ayer"
+    assert normalize_date("  ") is None
+
+
+def test_malformed_feed_falls_back_to_feedparser():
+    broken = b"<rss><channel><item><title>A&nbsp;B</title><link>https://x.com/1</link></item>"
+    assert parse_feed(broken) is None
+    payload = read_feed([broken])
+    assert payload.entries is None
+    (entry,) = parse_payload(payload)
+    assert entry.link == "https://x.com/1"
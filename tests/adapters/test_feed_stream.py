@@ -0,0 +1,78 @@
+"""Tests de la descarga de feeds en streaming (tope de bytes y corte por cuota)."""
+
+from digest.adapters.feed_stream import download_feed, read_feed
+from digest.adapters.input_rss import _fetch_one_feed
+
+
+def _rss(n: int) -> bytes:
+    items = "".join(
+        f"<item><title>T{i}</title><link>https://x.com/{i}</link></item>" for i in range(n)
+    )
+    return f'<?xml version="1.0"?><rss><channel>{items}</channel></rss>'.encode()
+
+
+def _chunks(data: bytes, size: int, consumed: list[int]):
+    for start in range(0, len(data), size):
+        consumed.append(start)
+        yield data[start : start + size]
+
+
+def test_stops_reading_once_quota_is_met():
+    consumed: list[int] = []
+    payload = read_feed(_chunks(_rss(1000), 256, consumed), max_entries=5)
+    assert payload.stopped_early
+    assert payload.entries_seen >= 5
+    assert len(consumed) < 5  # solo unos pocos trozos de ~60 KB
+    assert len(payload.content) == 256 * len(consumed)
+
+
+def test_counts_atom_entries_with_namespace():
+    atom = (
+        '<feed xmlns="http://www.w3.org/2005/Atom">'
+        + "<entry><title>a</title></entry>" * 3
+        + "</feed>"
+    ).encode()
+    payload = read_feed([atom], max_entries=10)
+    assert payload.entries_seen == 3
+    assert not payload.stopped_early
+
+
+def test_count_only_scans_bytes_across_chunk_boundaries():
+    atom = (
+        '<a:feed xmlns:a="http://www.w3.org/2005/Atom">'
+        + "<a:entry><a:title>a</a:title></a:entry>" * 4
+        + "</a:feed>"
+    ).encode()
+    payload = read_feed(_chunks(atom, 7, []), max_entries=10, extract=False)
+    assert payload.entries_seen == 4 and payload.entries is None
+
+    consumed: list[int] = []
+    payload = read_feed(_chunks(_rss(1000), 256, consumed), max_entries=5, extract=False)
+    assert payload.stopped_early and payload.entries_seen >= 5
+    assert len(consumed) < 5
+
+
+def test_byte_cap_truncates():
+    payload = read_feed(_chunks(_rss(1000), 1000, []), max_bytes=2500)
+    assert payload.truncated
+    assert len(payload.content) == 2500
+
+
+def test_malformed_xml_keeps_reading_until_the_end():
+    broken = b"<rss><channel><item><title>a & b</title></item>" + b"<item/>" * 50
+    payload = read_feed(_chunks(broken, 16, []), max_entries=2)
+    assert not payload.stopped_early
+    assert payload.content == broken
+
+
+def test_download_feed_returns_empty_payload_on_error(httpx_mock):
+    httpx_mock.add_response(url="https://example.com/feed", status_code=404, text="nope")
+    payload = download_feed("https://example.com/feed", timeout=5.0, max_entries=3)
+    assert payload.response.status_code == 404
+    assert payload.content == b""
+
+
+def test_fetch_one_feed_respects_item_quota(httpx_mock):
+    httpx_mock.add_response(url="https://example.com/big.xml", content=_rss(5000))
+    items = _fetch_one_feed("https://example.com/big.xml", timeout=5.0, max_items=10)
+    assert [i.title for i in items] == [f"T{i}" for i in range(10)]
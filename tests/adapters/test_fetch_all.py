@@ -1,10 +1,14 @@
 """Tests del orquestador fetch_all (T3.5)."""
 
 import tempfile
+import threading
 from pathlib import Path
 
-from digest.adapters.fetch_all import fetch_all_items
-from digest.config.sources import RssSource, SourcesConfig
+import httpx
+
+from digest.adapters.cache_store import JsonCache
+from digest.adapters.fetch_all import commit_hn_watermarks, fetch_all_items
+from digest.config.sources import FetchConfig, HackerNewsConfig, RssSource, SourcesConfig
 
 
 def test_fetch_all_items_empty_config():
@@ -43,6 +47,7 @@ def test_fetch_all_continues_if_rss_fails(httpx_mock):
             rss=[RssSource(name="Broken", url="https://broken.com/feed")],
             hacker_news=None,
             reddit=None,
+            fetch=FetchConfig(retries=0),
         )
         items = fetch_all_items(config, path, timeout=5.0)
         # Manual sigue funcionando aunque RSS falle
@@ -50,3 +55,85 @@ def test_fetch_all_continues_if_rss_fails(httpx_mock):
         assert items[0].url == "https://manual.com/one"
     finally:
         Path(path).unlink(missing_ok=True)
+
+
+def test_fetch_all_fetches_sources_concurrently(httpx_mock):
+    # Cada feed solo responde cuando los 4 están en vuelo a la vez
+    all_in_flight = threading.Barrier(4, timeout=5)
+
+    def feed(request: httpx.Request) -> httpx.Response:
+        all_in_flight.wait()
+        n = request.url.path.strip("/")
+        return httpx.Response(
+            200,
+            text=f"<rss><channel><item><title>{n}</title>"
+            f"<link>https://x.com/{n}</link></item></channel></rss>",
+        )
+
+    httpx_mock.add_callback(feed, is_reusable=True)
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
+        path = f.name
+    try:
+        config = SourcesConfig(
+            rss=[RssSource(name=str(i), url=f"https://feed{i}.com/{i}") for i in range(4)],
+            hacker_news=None,
+            reddit=None,
+            fetch=FetchConfig(max_workers=4, source_deadline=5.0),
+        )
+        items = fetch_all_items(config, path, timeout=5.0)
+        # Orden estable (el de sources.yaml) aunque terminen en cualquier orden
+        assert [i.url for i in items] == [f"https://x.com/{i}" for i in range(4)]
+    finally:
+        Path(path).unlink(missing_ok=True)
+
+
+def test_fetch_all_skips_source_with_open_circuit(httpx_mock, tmp_path):
+    httpx_mock.add_response(url="https://dead.com/feed", status_code=403, is_reusable=True)
+    config = SourcesConfig(
+        rss=[RssSource(name="Dead", url="https://dead.com/feed")],
+        hacker_news=None,
+        reddit=None,
+        fetch=FetchConfig(breaker_threshold=2),
+    )
+    links = tmp_path / "links.md"
+    links.write_text("")
+    for _ in range(3):
+        assert fetch_all_items(config, links, cache_dir=tmp_path / "cache") == []
+    # Dos fallos abren el circuito; la tercera ejecución ni siquiera pide el feed.
+    assert len(httpx_mock.get_requests()) == 2
+    assert (tmp_path / "cache" / "source-health.json").exists()
+
+
+def test_hn_watermarks_only_advance_after_commit(httpx_mock, tmp_path):
+    windows: list[str] = []
+
+    def search(request: httpx.Request) -> httpx.Response:
+        windows.append(request.url.params["numericFilters"])
+        hit = {"title": "S", "url": "https://s.com/1", "objectID": "1", "created_at_i": 2000}
+        return httpx.Response(200, json={"hits": [hit], "nbPages": 1})
+
+    httpx_mock.add_callback(search, is_reusable=True)
+    cache = tmp_path / "cache"
+    cache.mkdir()
+    marks = JsonCache(cache / "hn-watermarks.json")
+    marks.set("ml", 1000)
+    marks.save()
+    links = tmp_path / "links.md"
+    links.write_text("")
+    config = SourcesConfig(
+        rss=[],
+        hacker_news=HackerNewsConfig(
+            queries=["ml"], limit=5, incremental=True, cache_ttl_minutes=0
+        ),
+        reddit=None,
+    )
+
+    # Ejecución cuyo envío falla: la siguiente vuelve a pedir la misma ventana
+    fetch_all_items(config, links, cache_dir=cache)
+    fetch_all_items(config, links, cache_dir=cache)
+    assert windows == ["created_at_i>1000", "created_at_i>1000"]
+
+    assert commit_hn_watermarks(cache)
+    fetch_all_items(config, links, cache_dir=cache)
+    assert windows[-1] == "created_at_i>2000"
+    assert not commit_hn_watermarks(tmp_path / "empty")
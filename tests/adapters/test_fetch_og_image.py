@@ -172,3 +172,67 @@ class TestFetchOgImage:
         # Debe ser None (URL relativa no es usable en email) o URL absoluta
         if result is not None:
             assert result.startswith("http"), "Si se devuelve, debe ser URL absoluta"
+
+
+def _chunks(html: str, size: int = 64):
+    data = html.encode()
+    return (data[i : i + size] for i in range(0, len(data), size))
+
+
+class TestScanHead:
+    """Escaneo incremental: solo se consume el <head>."""
+
+    BIG_BODY = "<p>" + "x" * 200_000 + "</p>"
+
+    def test_stops_at_end_of_head(self) -> None:
+        from digest.adapters.fetch_og_image import scan_head
+
+        html = HTML_WITH_TWITTER_IMAGE.replace("<p>Content</p>", self.BIG_BODY)
+        scan = scan_head(_chunks(html))
+        assert scan.image == "https://example.com/images/twitter-card.png"
+        assert scan.finished_head
+        assert scan.bytes_read < 1_000
+
+    def test_og_image_later_in_head_beats_twitter(self) -> None:
+        from digest.adapters.fetch_og_image import scan_head
+
+        html = (
+            '<html><head><meta name="twitter:image" content="/tw.png">'
+            '<meta property="og:image" content="/og.png"></head><body></body></html>'
+        )
+        assert scan_head(_chunks(html, 8)).image == "/og.png"
+
+    def test_meta_after_body_is_ignored(self) -> None:
+        from digest.adapters.fetch_og_image import scan_head
+
+        html = '<html><body><meta property="og:image" content="https://x.com/i.png"></body>'
+        scan = scan_head(_chunks(html))
+        assert scan.image is None
+        assert scan.finished_head
+
+    def test_byte_cap(self) -> None:
+        from digest.adapters.fetch_og_image import scan_head
+
+        html = "<html><head><style>" + "a{}" * 100_000 + "</style></head>"
+        scan = scan_head(_chunks(html, 4096), max_bytes=10_000)
+        assert scan.bytes_read == 10_000
+        assert not scan.finished_head
+
+    def test_resolves_relative_url_against_page(self, httpx_mock) -> None:
+        httpx_mock.add_response(
+            url="https://example.com/blog/post",
+            text=HTML_RELATIVE_OG_IMAGE,
+            headers={"Content-Type": "text/html; charset=utf-8"},
+        )
+        assert (
+            fetch_og_image("https://example.com/blog/post")
+            == "https://example.com/images/local.jpg"
+        )
+
+    def test_binary_content_is_skipped(self, httpx_mock) -> None:
+        httpx_mock.add_response(
+            url="https://example.com/paper.pdf",
+            content=b"%PDF-1.7",
+            headers={"Content-Type": "application/pdf"},
+        )
+        assert fetch_og_image("https://example.com/paper.pdf") is None
@@ -0,0 +1,104 @@
+"""Tests del modo batch de Hacker News contra un stand-in local del multi-query de Algolia."""
+
+import json
+from urllib.parse import parse_qs
+
+from digest.adapters.input_hacker_news import (
+    _search_hn_batch,
+    fetch_hacker_news_items,
+    hacker_news_tasks,
+    merge_hacker_news_results,
+)
+from digest.config.sources import HackerNewsConfig
+from digest.domain.models import Item
+from tests.local_server import local_server
+
+
+def _algolia_stand_in(calls: list[dict]):
+    """Responde cada request del multi-query con 3 hits derivados de su query."""
+
+    def handler(method, path, headers, body):
+        assert method == "POST" and path == "/1/indexes/*/queries"
+        assert headers.get("x-algolia-api-key") == "test-key"
+        payload = json.loads(body)
+        calls.append(payload)
+        results = []
+        for req in payload["requests"]:
+            params = parse_qs(req["params"])
+            # API nativa: el filtro es tagFilters (tags solo existe en hn.algolia.com)
+            assert params["tagFilters"] == ["story"] and "tags" not in params
+            assert int(params["hitsPerPage"][0]) <= 100
+            query = params["query"][0]
+            hits = [
+                {"title": f"{query} {i}", "url": f"https://{query}.com/{i}", "objectID": str(i)}
+                for i in range(3)
+            ]
+            hits.append({"title": "Compartida", "url": "https://shared.com/x", "objectID": "s"})
+            results.append({"hits": hits, "nbPages": 1})
+        return 200, {"Content-Type": "application/json"}, json.dumps({"results": results}).encode()
+
+    return handler
+
+
+def test_batch_sends_all_queries_in_one_request():
+    calls: list[dict] = []
+    queries = [f"q{i}" for i in range(20)]
+    with local_server(_algolia_stand_in(calls)) as base:
+        items = _search_hn_batch(
+            queries,
+            2,
+            timeout=5.0,
+            endpoint=f"{base}/1/indexes/*/queries",
+            api_key="test-key",
+        )
+    assert len(calls) == 1
+    assert len(calls[0]["requests"]) == 20
+    assert parse_qs(calls[0]["requests"][0]["params"])["hitsPerPage"] == ["2"]
+    # Todas las queries representadas y sin duplicados
+    assert {i.title.split()[0] for i in items if i.title != "Compartida"} == set(queries)
+    assert len({i.url for i in items}) == len(items)
+
+
+def test_batch_interleaves_queries():
+    calls: list[dict] = []
+    with local_server(_algolia_stand_in(calls)) as base:
+        items = _search_hn_batch(
+            ["a", "b"], 2, timeout=5.0, endpoint=f"{base}/1/indexes/*/queries", api_key="test-key"
+        )
+    assert [i.url for i in items] == [
+        "https://a.com/0",
+        "https://b.com/0",
+        "https://a.com/1",
+        "https://b.com/1",
+    ]
+
+
+def test_fetch_uses_batch_task_when_key_present(monkeypatch):
+    calls: list[dict] = []
+    with local_server(_algolia_stand_in(calls)) as base:
+        monkeypatch.setenv("HN_ALGOLIA_API_KEY", "test-key")
+        monkeypatch.setenv("HN_ALGOLIA_MULTI_URL", f"{base}/1/indexes/*/queries")
+        cfg = HackerNewsConfig(queries=["a", "b", "c"], limit=6, batch=True)
+        items = fetch_hacker_news_items(cfg, timeout=5.0)
+    assert len(calls) == 1
+    assert len(items) == 6
+
+
+def test_batch_with_incremental_warns_and_uses_one_task_per_query(monkeypatch, caplog):
+    monkeypatch.setenv("HN_ALGOLIA_API_KEY", "test-key")
+    cfg = HackerNewsConfig(queries=["a", "b"], limit=4, batch=True, incremental=True)
+    tasks = hacker_news_tasks(cfg, timeout=5.0)
+    assert [t.label for t in tasks] == ["Hacker News query 'a'", "Hacker News query 'b'"]
+    assert "batch no admite modo incremental" in caplog.text
+
+
+def test_merge_gives_every_query_a_share():
+    def items(prefix: str, n: int) -> list[Item]:
+        return [
+            Item(title=prefix, url=f"https://{prefix}.com/{i}", source="hacker_news")
+            for i in range(n)
+        ]
+
+    cfg = HackerNewsConfig(queries=["a", "b"], limit=4)
+    merged = merge_hacker_news_results(cfg, [items("a", 4), items("b", 4)])
+    assert [i.title for i in merged] == ["a", "b", "a", "b"]
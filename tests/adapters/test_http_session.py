@@ -0,0 +1,104 @@
+"""Tests de la sesión HTTP compartida (pool keep-alive y métricas de conexiones)."""
+
+import threading
+import time
+
+from digest.adapters.http_session import (
+    DEFAULT_UA,
+    HttpSession,
+    close_session,
+    configure_session,
+    get_session,
+)
+from digest.config.sources import FetchConfig
+from tests.local_server import local_server
+
+
+def _ok(method, path, headers, body):
+    return 200, {"Content-Type": "text/plain"}, f"{headers.get('user-agent')}".encode()
+
+
+def test_reuses_connection_for_same_host():
+    with local_server(_ok) as base:
+        session = HttpSession()
+        try:
+            for i in range(3):
+                response = session.get(f"{base}/{i}", timeout=5.0)
+                assert response.status_code == 200
+            stats = session.stats
+        finally:
+            session.close()
+    assert stats.requests == 3
+    assert stats.connections_opened == 1
+    assert stats.connections_reused == 2
+
+
+def test_sends_custom_user_agent():
+    with local_server(_ok) as base:
+        session = HttpSession()
+        try:
+            assert session.get(base, timeout=5.0).text == DEFAULT_UA
+        finally:
+            session.close()
+
+
+def test_max_per_host_limits_parallel_requests():
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def slow(method, path, headers, body):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        return 200, {}, b"ok"
+
+    with local_server(slow) as base:
+        session = HttpSession(max_per_host=2)
+        try:
+            threads = [
+                threading.Thread(target=session.get, args=(f"{base}/{i}",)) for i in range(6)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        finally:
+            session.close()
+    assert peak <= 2
+
+
+def test_http2_without_h2_falls_back(monkeypatch, caplog):
+    monkeypatch.setattr("digest.adapters.http_session._h2_available", lambda: False)
+    session = HttpSession(http2=True)
+    session.close()
+    assert "HTTP/2" in caplog.text
+
+
+def test_accepts_and_decodes_gzip():
+    import gzip
+
+    def gzipped(method, path, headers, body):
+        assert "gzip" in headers.get("accept-encoding", "")
+        return 200, {"Content-Encoding": "gzip"}, gzip.compress(b"<rss/>" * 100)
+
+    with local_server(gzipped) as base:
+        session = HttpSession()
+        try:
+            assert session.get(base, timeout=5.0).text == "<rss/>" * 100
+        finally:
+            session.close()
+
+
+def test_configure_session_replaces_shared_session():
+    first = configure_session(FetchConfig(max_per_host=1))
+    assert get_session() is first
+    second = configure_session()
+    assert get_session() is second and second is not first
+    close_session()
+    assert get_session() is not second
+    close_session()
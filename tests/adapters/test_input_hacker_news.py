@@ -1,6 +1,17 @@
 """Tests del adaptador Hacker News (T3.3) con mocks."""
 
-from digest.adapters.input_hacker_news import fetch_hacker_news_items, _search_hn
+import re
+import time
+
+import httpx
+
+from digest.adapters.cache_store import JsonCache
+from digest.adapters.input_hacker_news import (
+    BOOTSTRAP_DAYS,
+    _search_hn,
+    _search_hn_since,
+    fetch_hacker_news_items,
+)
 from digest.config.sources import HackerNewsConfig
 
 
@@ -54,3 +65,93 @@ def test_fetch_hacker_news_items_respects_limit(httpx_mock):
     cfg = HackerNewsConfig(queries=["ml"], limit=3)
     items = fetch_hacker_news_items(cfg, timeout=5.0)
     assert len(items) == 3
+
+
+def test_search_hn_reuses_cached_response(httpx_mock, tmp_path):
+    httpx_mock.add_response(
+        url="https://hn.algolia.com/api/v1/search?query=ml&tags=story&hitsPerPage=2",
+        json={"hits": [{"title": "S", "url": "https://s.com/1", "objectID": "1"}]},
+    )
+    cache = JsonCache(tmp_path / "hn.json", ttl=3600)
+    first = _search_hn("ml", 2, timeout=5.0, cache=cache)
+    cache.save()
+    # Segunda ejecución (otra instancia, mismo archivo): no hay petición HTTP
+    second = _search_hn("ml", 2, timeout=5.0, cache=JsonCache(tmp_path / "hn.json", ttl=3600))
+    assert first == second
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_search_hn_cache_key_includes_hits_per_page(httpx_mock, tmp_path):
+    for n in (2, 3):
+        httpx_mock.add_response(
+            url=f"https://hn.algolia.com/api/v1/search?query=ml&tags=story&hitsPerPage={n}",
+            json={"hits": []},
+        )
+    cache = JsonCache(tmp_path / "hn.json", ttl=3600)
+    _search_hn("ml", 2, timeout=5.0, cache=cache)
+    _search_hn("ml", 3, timeout=5.0, cache=cache)
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def _since_hits(*stamps: int) -> list[dict]:
+    return [
+        {"title": f"S{ts}", "url": f"https://s.com/{ts}", "objectID": str(ts), "created_at_i": ts}
+        for ts in stamps
+    ]
+
+
+def test_incremental_uses_watermark_and_advances_it(httpx_mock, tmp_path):
+    seen_params: list[dict] = []
+
+    def since_search(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/api/v1/search"
+        seen_params.append(dict(request.url.params))
+        return httpx.Response(200, json={"hits": _since_hits(1300, 1200), "nbPages": 1})
+
+    httpx_mock.add_callback(since_search)
+    watermarks = JsonCache(tmp_path / "wm.json")
+    watermarks.set("ml", 1000)
+    items = _search_hn_since("ml", 5, timeout=5.0, watermarks=watermarks)
+    assert [i.url for i in items] == ["https://s.com/1300", "https://s.com/1200"]
+    assert seen_params[0]["numericFilters"] == "created_at_i>1000"
+    assert watermarks.peek("ml") == 1300
+
+
+def test_incremental_paginates_until_quota(httpx_mock):
+    def since_search(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        stamps = (2000 - page,)
+        return httpx.Response(200, json={"hits": _since_hits(*stamps), "nbPages": 3})
+
+    httpx_mock.add_callback(since_search, is_reusable=True)
+    items = _search_hn_since("ml", 2, timeout=5.0)
+    assert [i.url for i in items] == ["https://s.com/2000", "https://s.com/1999"]
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_incremental_without_watermark_uses_bootstrap_window(httpx_mock):
+    captured: list[str] = []
+
+    def since_search(request: httpx.Request) -> httpx.Response:
+        captured.append(request.url.params["numericFilters"])
+        return httpx.Response(200, json={"hits": [], "nbPages": 0})
+
+    httpx_mock.add_callback(since_search)
+    assert _search_hn_since("ml", 5, timeout=5.0) == []
+    since = int(captured[0].split(">")[1])
+    # Día completo: la misma clave de caché durante todo el día
+    assert since % 86400 == 0
+    assert 0 <= time.time() - BOOTSTRAP_DAYS * 86400 - since < 86400
+
+
+def test_fetch_hacker_news_items_incremental_mode(httpx_mock, tmp_path):
+    recent = int(time.time()) - 3600
+    httpx_mock.add_callback(
+        lambda request: httpx.Response(200, json={"hits": _since_hits(recent), "nbPages": 1}),
+        url=re.compile(r"https://hn\.algolia\.com/api/v1/search\?.*"),
+    )
+    watermarks = JsonCache(tmp_path / "wm.json")
+    cfg = HackerNewsConfig(queries=["ml"], limit=3, incremental=True)
+    items = fetch_hacker_news_items(cfg, timeout=5.0, watermarks=watermarks)
+    assert len(items) == 1
+    assert watermarks.peek("ml") == recent
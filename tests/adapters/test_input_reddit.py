@@ -39,3 +39,78 @@ def test_fetch_subreddit_rss_parses_external_and_selfposts(httpx_mock):
     assert items[1].title == "Reddit only"
     assert "reddit.com" in items[1].url
     assert items[1].source == "reddit"
+
+
+def _atom_page(entries: list[tuple[str, str]]) -> str:
+    """entries: (subreddit, post_id) → Atom como el de Reddit (categoría + id t3_)."""
+    body = "".join(
+        f"""<entry>
+          <id>t3_{pid}</id>
+          <title>{sub} {pid}</title>
+          <link href="https://www.reddit.com/r/{sub}/comments/{pid}/x/"/>
+          <category term="{sub}" label="r/{sub}"/>
+        </entry>"""
+        for sub, pid in entries
+    )
+    return f'<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom">{body}</feed>'
+
+
+def test_combined_mode_single_listing_with_cursor(httpx_mock):
+    import httpx
+
+    from digest.adapters.input_reddit import _fetch_combined_rss
+
+    pages = {
+        None: _atom_page(
+            [("MachineLearning", "a1"), ("MachineLearning", "a2"), ("artificial", "b1")]
+        ),
+        "t3_b1": _atom_page([("MachineLearning", "a3"), ("artificial", "b2")]),
+    }
+    seen: list[dict] = []
+
+    def listing(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/r/MachineLearning+artificial/.rss"
+        params = dict(request.url.params)
+        seen.append(params)
+        return httpx.Response(200, text=pages[params.get("after")])
+
+    httpx_mock.add_callback(listing, is_reusable=True)
+    items = _fetch_combined_rss(["MachineLearning", "artificial"], 2, timeout=5.0)
+    # Agrupado por subreddit en el orden de la config, con cuota de 2 cada uno
+    assert [i.title for i in items] == [
+        "MachineLearning a1",
+        "MachineLearning a2",
+        "artificial b1",
+        "artificial b2",
+    ]
+    assert [p.get("after") for p in seen] == [None, "t3_b1"]
+    # Páginas completas mientras falte algún subreddit
+    assert seen[0]["limit"] == seen[1]["limit"] == "100"
+
+
+def test_combined_mode_stops_when_listing_exhausted(httpx_mock):
+    from digest.adapters.input_reddit import _fetch_combined_rss
+
+    httpx_mock.add_response(text=_atom_page([("ml", "x1")]))
+    httpx_mock.add_response(text=_atom_page([]))
+    items = _fetch_combined_rss(["ml", "ai"], 5, timeout=5.0)
+    assert [i.title for i in items] == ["ml x1"]
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_fetch_reddit_items_combined_uses_one_task(httpx_mock):
+    httpx_mock.add_response(
+        url="https://www.reddit.com/r/ml+ai/.rss?limit=100",
+        text=_atom_page([("ml", "1"), ("ml", "1b"), ("ai", "2")]),
+    )
+    cfg = RedditConfig(subreddits=["ml", "ai"], limit_per_sub=1, combined=True)
+    items = fetch_reddit_items(cfg, timeout=5.0)
+    assert [i.title for i in items] == ["ml 1", "ai 2"]
+
+
+def test_single_mode_allows_limit_above_25(httpx_mock):
+    httpx_mock.add_response(
+        url="https://www.reddit.com/r/ml/.rss?limit=40",
+        text=_atom_page([("ml", str(i)) for i in range(40)]),
+    )
+    assert len(_fetch_subreddit_rss("ml", 40, timeout=5.0)) == 40
@@ -0,0 +1,101 @@
+"""Tests de los adaptadores LLM asíncronos contra stand-ins locales de las APIs."""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from digest.adapters.llm_anthropic import AsyncAnthropicLLM
+from digest.adapters.llm_openai import AsyncOpenAILLM
+from digest.domain.llm_port import ItemWithSummary
+from digest.domain.models import Item
+from tests.local_server import local_server
+
+# Las 5 peticiones concurrentes de _exercise solo reciben respuesta si llegan a la vez.
+CONCURRENT = 5
+_all_in_flight = threading.Barrier(CONCURRENT, timeout=5)
+
+
+def _wait_for_batch(prompt: str) -> None:
+    if "snippet" in prompt:
+        _all_in_flight.wait()
+
+
+def _openai_api(method: str, path: str, headers: dict[str, str], body: bytes):
+    prompt = json.loads(body)["messages"][0]["content"]
+    _wait_for_batch(prompt)
+    content = "2, 0, 1" if "Ordena" in prompt else "resumen: " + prompt.split("Título: ")[1][:2]
+    payload = {
+        "id": "chatcmpl-1",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "stand-in",
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }
+        ],
+    }
+    return 200, {"Content-Type": "application/json"}, json.dumps(payload).encode()
+
+
+def _anthropic_api(method: str, path: str, headers: dict[str, str], body: bytes):
+    prompt = json.loads(body)["messages"][0]["content"]
+    _wait_for_batch(prompt)
+    content = "2, 0, 1" if "Ordena" in prompt else "resumen: " + prompt.split("Título: ")[1][:2]
+    payload = {
+        "id": "msg_1",
+        "type": "message",
+        "role": "assistant",
+        "model": "stand-in",
+        "content": [{"type": "text", "text": content}],
+        "stop_reason": "end_turn",
+        "usage": {"input_tokens": 1, "output_tokens": 1},
+    }
+    return 200, {"Content-Type": "application/json"}, json.dumps(payload).encode()
+
+
+def _items(n: int) -> list[ItemWithSummary]:
+    return [
+        ItemWithSummary(
+            item=Item(title=f"T{i}", url=f"https://x.com/{i}", source="rss"), summary="s"
+        )
+        for i in range(n)
+    ]
+
+
+async def _exercise(llm) -> tuple[list[str], list[ItemWithSummary]]:
+    await llm.summarize("T0", "")  # calienta import del SDK, cliente y conexión
+    summaries = await asyncio.gather(
+        *(llm.summarize(f"T{i}", "snippet") for i in range(CONCURRENT))
+    )
+    ranked = await llm.rank(_items(3), top_n=2)
+    await llm.aclose()
+    return summaries, ranked
+
+
+@pytest.mark.parametrize(
+    ("adapter", "api", "env"),
+    [
+        (AsyncOpenAILLM, _openai_api, "OPENAI_BASE_URL"),
+        (AsyncAnthropicLLM, _anthropic_api, "ANTHROPIC_BASE_URL"),
+    ],
+)
+def test_async_adapter_summarizes_concurrently_and_ranks(
+    adapter, api, env, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    with local_server(api) as base:
+        monkeypatch.setenv(env, base + "/v1" if env == "OPENAI_BASE_URL" else base)
+        summaries, ranked = asyncio.run(_exercise(adapter(api_key="test")))
+
+    # Todas en vuelo a la vez (la barrera del stand-in), no en serie
+    assert summaries == [f"resumen: T{i}" for i in range(CONCURRENT)]
+    assert [x.item.title for x in ranked] == ["T2", "T0"]
+
+
+def test_async_rank_skips_call_when_few_items() -> None:
+    llm = AsyncOpenAILLM(api_key="test")
+    assert asyncio.run(llm.rank(_items(2), top_n=5)) == _items(2)
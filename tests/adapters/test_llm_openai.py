@@ -0,0 +1,52 @@
+"""Tests del adaptador OpenAI síncrono contra un stand-in local de la API."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import openai
+import pytest
+
+from digest.adapters.llm_openai import OpenAILLM
+from tests.local_server import local_server
+
+
+def _chat_api(method: str, path: str, headers: dict[str, str], body: bytes):
+    prompt = json.loads(body)["messages"][0]["content"]
+    payload = {
+        "id": "chatcmpl-1",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "stand-in",
+        "choices": [
+            {
+                "index": 0,
+                "message": {
+                    "role": "assistant",
+                    "content": "resumen " + prompt.split("Título: ")[1][:3],
+                },
+                "finish_reason": "stop",
+            }
+        ],
+    }
+    return 200, {"Content-Type": "application/json"}, json.dumps(payload).encode()
+
+
+def test_one_client_shared_by_all_calls(monkeypatch: pytest.MonkeyPatch) -> None:
+    built: list[object] = []
+
+    class CountingOpenAI(openai.OpenAI):
+        def __init__(self, **kwargs) -> None:
+            built.append(kwargs)
+            super().__init__(**kwargs)
+
+    monkeypatch.setattr(openai, "OpenAI", CountingOpenAI)
+    with local_server(_chat_api) as base:
+        monkeypatch.setenv("OPENAI_BASE_URL", base + "/v1")
+        llm = OpenAILLM(api_key="test", timeout=5.0, max_connections=4)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            summaries = list(pool.map(lambda i: llm.summarize(f"T{i:02d}", ""), range(12)))
+        llm.close()
+
+    assert summaries == [f"resumen T{i:02d}" for i in range(12)]
+    assert len(built) == 1
+    assert built[0]["timeout"] == 5.0
@@ -0,0 +1,69 @@
+"""Tests de los prompts compartidos y del parseo de respuestas por lotes."""
+
+from digest.adapters.llm_prompts import (
+    BATCH_TOKENS_PER_ITEM,
+    batch_summary_prompt,
+    parse_batch_summaries,
+    parse_order,
+    rank_prompt,
+    summarize_in_rounds,
+)
+from digest.domain.llm_port import ItemWithSummary, SummaryRequest
+from digest.domain.models import Item
+
+
+def _requests(n: int) -> list[SummaryRequest]:
+    return [SummaryRequest(id=str(i), title=f"T{i}", snippet=f"s{i}") for i in range(n)]
+
+
+def test_batch_prompt_lists_every_id() -> None:
+    prompt = batch_summary_prompt(_requests(3))
+    assert all(f"[id: {i}]" in prompt for i in range(3))
+    assert "JSON" in prompt
+
+
+def test_parse_batch_tolerates_fences_and_ignores_unknown_ids() -> None:
+    raw = '```json\n{"0": " uno ", "1": "", "7": "ajeno", "2": 3}\n```'
+    assert parse_batch_summaries(raw, ["0", "1", "2"]) == {"0": "uno"}
+    assert parse_batch_summaries("no es json", ["0"]) == {}
+    assert parse_batch_summaries("[1, 2]", ["0"]) == {}
+
+
+def test_rounds_rerequest_only_missing_ids() -> None:
+    prompts: list[tuple[str, int]] = []
+    answers = iter(['{"0": "a", "2": "c"}', '{"1": "b"}'])
+
+    def complete(prompt: str, max_tokens: int) -> str:
+        prompts.append((prompt, max_tokens))
+        return next(answers)
+
+    assert summarize_in_rounds(_requests(3), complete) == {"0": "a", "1": "b", "2": "c"}
+    assert prompts[0][1] == 3 * BATCH_TOKENS_PER_ITEM
+    assert "[id: 1]" in prompts[1][0] and "[id: 0]" not in prompts[1][0]
+
+
+def test_rounds_give_up_after_retries() -> None:
+    calls = 0
+
+    def complete(prompt: str, max_tokens: int) -> str:
+        nonlocal calls
+        calls += 1
+        return "{}"
+
+    assert summarize_in_rounds(_requests(2), complete, retries=1) == {}
+    assert calls == 2
+
+
+def test_parse_order_appends_unmentioned() -> None:
+    assert parse_order("2, 0, 9, 2", 4) == [2, 0, 1, 3]
+
+
+def test_rank_prompt_omits_summary_line_when_pre_ranking() -> None:
+    items = [
+        ItemWithSummary(item=Item(title=f"T{i}", url=f"https://x.com/{i}", source="rss"), summary=s)
+        for i, s in enumerate(["", ""])
+    ]
+    assert "Resumen:" not in rank_prompt(items)
+    assert "[1] Título: T1\nURL: https://x.com/1\nFuente: rss" in rank_prompt(items)
+    with_summary = [ItemWithSummary(item=x.item, summary="s") for x in items]
+    assert "Resumen: s" in rank_prompt(with_summary)
@@ -0,0 +1,77 @@
+"""Tests de la caché persistente de imágenes OG (positivos y negativos)."""
+
+from pathlib import Path
+
+import httpx
+
+from digest.adapters.fetch_og_image import fetch_og_image
+from digest.adapters.og_cache import OgImageCache
+
+PAGE = '<html><head><meta property="og:image" content="/img.png"></head><body></body></html>'
+
+
+def test_hit_skips_network_and_uses_normalized_key(httpx_mock, tmp_path: Path) -> None:
+    httpx_mock.add_response(url="https://example.com/post/", text=PAGE)
+    cache = OgImageCache(tmp_path / "og.json")
+    assert fetch_og_image("https://example.com/post/", cache=cache) == "https://example.com/img.png"
+    cache.save()
+
+    reloaded = OgImageCache(tmp_path / "og.json")
+    # Misma página con query y fragmento: sin petición (httpx_mock fallaría si la hubiera)
+    again = fetch_og_image("https://EXAMPLE.com/post?utm_source=x#top", cache=reloaded)
+    assert again == "https://example.com/img.png"
+    assert reloaded.hits == 1
+
+
+def test_negative_results_are_cached(httpx_mock, tmp_path: Path) -> None:
+    httpx_mock.add_response(url="https://example.com/gone", status_code=404)
+    httpx_mock.add_exception(httpx.ReadTimeout("slow"), url="https://slow.com/a")
+    httpx_mock.add_response(url="https://example.com/plain", text="<html><head></head></html>")
+    cache = OgImageCache(tmp_path / "og.json")
+    for url in ("https://example.com/gone", "https://slow.com/a", "https://example.com/plain"):
+        assert fetch_og_image(url, cache=cache) is None
+        assert fetch_og_image(url, cache=cache) is None  # segunda vez, desde la caché
+    assert [cache.get(u).outcome for u in ("https://example.com/gone", "https://slow.com/a")] == [
+        "http-404",
+        "timeout",
+    ]
+    assert cache.get("https://example.com/plain").outcome == "missing"
+    assert len(httpx_mock.get_requests()) == 3
+
+
+def test_transient_errors_are_not_cached(httpx_mock, tmp_path: Path) -> None:
+    httpx_mock.add_response(url="https://example.com/a", status_code=503)
+    httpx_mock.add_response(url="https://example.com/a", text=PAGE)
+    cache = OgImageCache(tmp_path / "og.json")
+    assert fetch_og_image("https://example.com/a", cache=cache) is None
+    assert fetch_og_image("https://example.com/a", cache=cache) == "https://example.com/img.png"
+
+
+def test_rate_limited_lookup_leaves_no_entry(httpx_mock, tmp_path: Path) -> None:
+    # Retry-After por encima de max_retry_after: la sesión no reintenta y devuelve el 429
+    httpx_mock.add_response(
+        url="https://example.com/a", status_code=429, headers={"Retry-After": "3600"}
+    )
+    httpx_mock.add_response(url="https://example.com/b", status_code=408)
+    cache = OgImageCache(tmp_path / "og.json")
+    for url in ("https://example.com/a", "https://example.com/b"):
+        assert fetch_og_image(url, cache=cache) is None
+        assert cache.get(url) is None
+
+
+def test_positive_and_negative_ttls(tmp_path: Path) -> None:
+    cache = OgImageCache(tmp_path / "og.json", ttl_days=30, negative_ttl_hours=2)
+    cache.store("https://a.com/x", "https://a.com/i.png", "found")
+    cache.store("https://b.com/y", None, "missing")
+    cache.save()
+    entries = {k: v for k, v in OgImageCache(tmp_path / "og.json")._store.entries().items()}
+    ttl = {k: v["expires_at"] - v["stored_at"] for k, v in entries.items()}
+    assert ttl == {"https://a.com/x": 30 * 86400, "https://b.com/y": 2 * 3600}
+
+
+def test_size_bound(tmp_path: Path) -> None:
+    cache = OgImageCache(tmp_path / "og.json", max_entries=2)
+    for i in range(3):
+        cache.store(f"https://a.com/{i}", None, "missing")
+    assert cache.get("https://a.com/0") is None
+    assert cache.get("https://a.com/2") is not None
@@ -0,0 +1,41 @@
+"""Tests del parseo de feeds en un pool de procesos."""
+
+from digest.adapters.feed_parser import FeedEntry
+from digest.adapters.feed_stream import FeedPayload
+from digest.adapters.input_rss import fetch_rss_items
+from digest.adapters.parse_pool import ParsePool, parse_pool_for
+from digest.config.sources import RssSource
+
+
+def _rss(prefix: str, n: int) -> bytes:
+    items = "".join(
+        f"<item><title>{prefix}{i}</title><link>https://{prefix}.com/{i}</link>"
+        f"<pubDate>Tue, 02 Jan 2024 10:00:00 +0000</pubDate></item>"
+        for i in range(n)
+    )
+    return f"<rss><channel>{items}</channel></rss>".encode()
+
+
+def test_small_source_lists_stay_in_process():
+    with parse_pool_for(3, workers=4, min_sources=8) as pool:
+        assert pool is None
+    with parse_pool_for(20, workers=0) as pool:
+        assert pool is None
+
+
+def test_pool_parses_in_worker_and_returns_entries():
+    with ParsePool(1) as pool:
+        entries = pool.parse(FeedPayload(content=_rss("a", 5)), max_entries=3)
+        fallback = pool.parse(FeedPayload(content=b"<rss><item><title>x&nbsp;</title>"))
+    assert entries == [
+        FeedEntry(title=f"a{i}", link=f"https://a.com/{i}", date="2024-01-02") for i in range(3)
+    ]
+    assert [e.title for e in fallback] == ["x"]
+
+
+def test_fetch_rss_items_with_process_pool(httpx_mock):
+    sources = [RssSource(name=n, url=f"https://{n}.com/feed") for n in ("a", "b", "c")]
+    for src in sources:
+        httpx_mock.add_response(url=src.url, content=_rss(src.name, 4))
+    items = fetch_rss_items(sources, timeout=5.0, max_items=2, parse_workers=2, parse_min_sources=2)
+    assert [i.title for i in items] == ["a0", "a1", "b0", "b1", "c0", "c1"]
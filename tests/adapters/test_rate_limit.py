@@ -0,0 +1,117 @@
+"""Tests del limitador por host (token bucket) y del manejo de 429 / Retry-After."""
+
+from digest.adapters.http_session import HttpSession
+from digest.adapters.rate_limit import HostRateLimiter, retry_after_seconds
+from digest.config.sources import HostLimit
+from tests.local_server import local_server
+
+
+class FakeTime:
+    """Reloj y sleep simulados: sleep avanza el reloj sin esperar."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.slept: list[float] = []
+
+    def clock(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def test_bucket_allows_burst_then_spaces_requests():
+    t = FakeTime()
+    limiter = HostRateLimiter(
+        {"api.example.com": HostLimit(rate=2.0, burst=2)}, clock=t.clock, sleep=t.sleep
+    )
+    waits = [limiter.acquire("api.example.com") for _ in range(4)]
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == 0.5 and waits[3] == 0.5
+    assert limiter.waited() == {"api.example.com": 1.0}
+
+
+def test_hosts_are_independent_and_unlisted_hosts_unlimited():
+    t = FakeTime()
+    limiter = HostRateLimiter({"slow.com": HostLimit(rate=1.0)}, clock=t.clock, sleep=t.sleep)
+    limiter.acquire("slow.com")
+    assert limiter.acquire("fast.com") == 0.0
+    assert limiter.acquire("fast.com") == 0.0
+    assert limiter.acquire("slow.com") == 1.0
+
+
+def test_default_rate_applies_to_unlisted_hosts():
+    t = FakeTime()
+    limiter = HostRateLimiter(default_rate=1.0, clock=t.clock, sleep=t.sleep)
+    limiter.acquire("publisher.com")
+    assert limiter.acquire("publisher.com") == 1.0
+
+
+def test_pause_blocks_host():
+    t = FakeTime()
+    limiter = HostRateLimiter(clock=t.clock, sleep=t.sleep)
+    limiter.pause("reddit.com", 5.0)
+    assert limiter.acquire("reddit.com") == 5.0
+    assert limiter.acquire("other.com") == 0.0
+
+
+def test_concurrency_override():
+    limiter = HostRateLimiter({"www.reddit.com": HostLimit(concurrency=1)})
+    assert limiter.concurrency("WWW.REDDIT.COM") == 1
+    assert limiter.concurrency("other.com") is None
+
+
+def test_retry_after_parsing():
+    assert retry_after_seconds("3") == 3.0
+    assert retry_after_seconds(None) is None
+    assert retry_after_seconds("mañana") is None
+    assert retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_session_retries_after_429():
+    calls: list[str] = []
+
+    def throttled(method, path, headers, body):
+        calls.append(path)
+        if len(calls) == 1:
+            return 429, {"Retry-After": "0"}, b"slow down"
+        return 200, {}, b"ok"
+
+    with local_server(throttled) as base:
+        session = HttpSession(limiter=HostRateLimiter())
+        try:
+            response = session.get(f"{base}/x", timeout=5.0)
+        finally:
+            session.close()
+    assert response.status_code == 200
+    assert len(calls) == 2
+
+
+def test_session_gives_up_when_retry_after_too_long():
+    def throttled(method, path, headers, body):
+        return 429, {"Retry-After": "3600"}, b""
+
+    with local_server(throttled) as base:
+        session = HttpSession(limiter=HostRateLimiter(), max_retry_after=10)
+        try:
+            response = session.get(base, timeout=5.0)
+        finally:
+            session.close()
+    assert response.status_code == 429
+
+
+def test_503_without_retry_after_is_not_retried():
+    calls: list[str] = []
+
+    def unavailable(method, path, headers, body):
+        calls.append(path)
+        return 503, {}, b""
+
+    with local_server(unavailable) as base:
+        session = HttpSession()
+        try:
+            assert session.get(base, timeout=5.0).status_code == 503
+        finally:
+            session.close()
+    assert len(calls) == 1
@@ -0,0 +1,176 @@
+"""Tests de reintentos con backoff y del circuit breaker por fuente."""
+
+import random
+import threading
+
+import httpx
+import pytest
+
+from digest.adapters.concurrency import Task, run_tasks
+from digest.adapters.resilience import SourceHealth, is_transient, with_retries
+
+
+def _status_error(status: int, headers: dict | None = None) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://example.com/feed")
+    return httpx.HTTPStatusError(
+        "error", request=request, response=httpx.Response(status, headers=headers, request=request)
+    )
+
+
+def test_is_transient_classifies_errors():
+    assert is_transient(httpx.ConnectError("boom"))
+    assert is_transient(httpx.ReadTimeout("slow"))
+    assert is_transient(_status_error(503))
+    assert not is_transient(_status_error(403))
+    assert not is_transient(_status_error(429))
+    assert not is_transient(ValueError("parse"))
+
+
+def test_is_transient_leaves_retry_after_503_to_the_session():
+    """La sesión HTTP ya reintentó el 503 con Retry-After: no hay segunda capa de reintentos."""
+    assert not is_transient(_status_error(503, {"Retry-After": "5"}))
+    assert not is_transient(_status_error(503, {"Retry-After": "3600"}))
+    assert is_transient(_status_error(503, {"Retry-After": "pronto"}))
+
+
+def test_with_retries_recovers_from_transient_error():
+    calls = []
+    sleeps: list[float] = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise httpx.ConnectError("boom")
+        return "ok"
+
+    result = with_retries(
+        flaky, retries=2, base_delay=1.0, sleep=sleeps.append, rng=random.Random(0)
+    )
+    assert result == "ok"
+    assert len(calls) == 3
+    # Full jitter: cada espera está en [0, base * 2^intento].
+    assert 0 <= sleeps[0] <= 1.0 and 0 <= sleeps[1] <= 2.0
+
+
+def test_with_retries_does_not_retry_permanent_errors():
+    calls = []
+
+    def forbidden():
+        calls.append(1)
+        raise _status_error(403)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        with_retries(forbidden, retries=3, sleep=lambda s: None)
+    assert len(calls) == 1
+
+
+def test_with_retries_stops_when_backoff_exceeds_deadline():
+    calls = []
+    sleeps: list[float] = []
+
+    def down():
+        calls.append(1)
+        raise httpx.ConnectError("boom")
+
+    with pytest.raises(httpx.ConnectError):
+        with_retries(
+            down,
+            retries=5,
+            base_delay=4.0,
+            deadline=1.0,
+            sleep=sleeps.append,
+            rng=random.Random(0),
+            clock=lambda: 0.0,
+        )
+    # Sin tiempo para la espera no se reintenta (ni se duerme) más allá del deadline.
+    assert all(delay < 1.0 for delay in sleeps)
+    assert len(calls) == len(sleeps) + 1
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _failing_task(calls: list) -> Task:
+    def fn():
+        calls.append(1)
+        raise _status_error(404)
+
+    return Task(label="RSS feed https://dead.com/feed", fn=fn)
+
+
+def test_circuit_opens_after_threshold_and_probes_after_cooldown(tmp_path):
+    clock = Clock()
+    health = SourceHealth(tmp_path / "h.json", threshold=2, cooldown_hours=1, clock=clock)
+    calls: list = []
+    task = health.guard(_failing_task(calls), retries=0)
+
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            task.fn()
+    assert health.state(task.label) == "open"
+
+    assert task.fn() is None  # omitida sin petición
+    assert len(calls) == 2
+    assert health.record(task.label)["skipped"] == 1
+
+    clock.now += 3601
+    assert health.state(task.label) == "half_open"
+    with pytest.raises(httpx.HTTPStatusError):
+        task.fn()  # sondeo fallido: la espera se duplica
+    assert health.record(task.label)["open_until"] == pytest.approx(clock.now + 7200)
+
+
+def test_successful_probe_closes_circuit_and_state_persists(tmp_path):
+    clock = Clock()
+    path = tmp_path / "h.json"
+    health = SourceHealth(path, threshold=1, cooldown_hours=1, clock=clock)
+    with pytest.raises(httpx.HTTPStatusError):
+        health.guard(_failing_task([]), retries=0).fn()
+    health.save()
+
+    reloaded = SourceHealth(path, threshold=1, cooldown_hours=1, clock=clock)
+    assert reloaded.state("RSS feed https://dead.com/feed") == "open"
+    clock.now += 3601
+    recovered = Task(label="RSS feed https://dead.com/feed", fn=lambda: ["item"])
+    assert reloaded.guard(recovered).fn() == ["item"]
+    record = reloaded.record(recovered.label)
+    assert reloaded.state(recovered.label) == "closed"
+    assert record["successes"] == 1 and record["failures"] == 1
+    assert reloaded.summary.probed == 1
+
+
+def test_source_abandoned_by_deadline_counts_as_failure(tmp_path):
+    path = tmp_path / "h.json"
+    health = SourceHealth(path, threshold=1, cooldown_hours=1)
+    release, finished = threading.Event(), threading.Event()
+
+    def hung():
+        release.wait(5)
+        return ["late"]
+
+    guarded = health.guard(Task(label="RSS feed https://slow.com/feed", fn=hung), retries=0)
+
+    def run():
+        try:
+            return guarded.fn()
+        finally:
+            finished.set()
+
+    task = Task(label=guarded.label, fn=run)
+    assert run_tasks([task], task_deadline=0.1, on_expired=health.expire) == [None]
+    health.save()
+
+    reloaded = SourceHealth(path, threshold=1, cooldown_hours=1)
+    assert reloaded.state(task.label) == "open"
+    assert "TimeoutError" in reloaded.record(task.label)["last_error"]
+
+    # El resultado tardío del hilo abandonado no cierra el circuito.
+    release.set()
+    assert finished.wait(5)
+    assert health.record(task.label).get("successes", 0) == 0
+    assert health.state(task.label) == "open"
@@ -0,0 +1,73 @@
+"""Tests de la caché de resúmenes por contenido y del envoltorio CachingLLM."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from digest.adapters import llm_prompts
+from digest.adapters.summary_cache import CachingLLM, SummaryCache, summary_key
+from digest.domain.llm_port import SummaryRequest
+
+
+class CountingLLM:
+    model = "m1"
+
+    def __init__(self) -> None:
+        self.single: list[str] = []
+        self.batched: list[list[str]] = []
+
+    def summarize(self, title: str, snippet: str) -> str:
+        self.single.append(title)
+        return f"R {title}"
+
+    def summarize_batch(self, requests: list[SummaryRequest]) -> dict[str, str]:
+        self.batched.append([r.id for r in requests])
+        return {r.id: f"R {r.title}" for r in requests}
+
+    def rank(self, items, top_n=5):
+        return items[:top_n]
+
+
+def test_key_depends_on_model_prompt_version_and_content(monkeypatch: pytest.MonkeyPatch) -> None:
+    key = summary_key("m1", "t", "s")
+    assert key == summary_key("m1", "t", "s")
+    assert len({key, summary_key("m2", "t", "s"), summary_key("m1", "t", "s2")}) == 3
+    monkeypatch.setattr(
+        "digest.adapters.summary_cache.PROMPT_VERSION", llm_prompts.PROMPT_VERSION + 1
+    )
+    assert summary_key("m1", "t", "s") != key
+
+
+def test_summaries_survive_runs_and_are_not_requested_again(tmp_path: Path) -> None:
+    path = tmp_path / "summaries.json"
+    llm = CountingLLM()
+    first = CachingLLM(llm, SummaryCache(path))
+    assert asyncio.run(first.summarize("A", "snip")) == "R A"
+    first.cache.save()
+
+    second = CachingLLM(llm, SummaryCache(path))
+    assert asyncio.run(second.summarize("A", "snip")) == "R A"
+    assert asyncio.run(second.summarize("A", "otro snippet")) == "R A"
+    assert llm.single == ["A", "A"]  # el snippet cambió: nueva entrada
+    assert (second.cache.hits, second.cache.misses, second.cache.hit_rate) == (1, 1, 0.5)
+
+
+def test_batch_forwards_only_misses(tmp_path: Path) -> None:
+    llm = CountingLLM()
+    caching = CachingLLM(llm, SummaryCache(tmp_path / "s.json"))
+    asyncio.run(caching.summarize("T0", "s"))
+    requests = [SummaryRequest(id=str(i), title=f"T{i}", snippet="s") for i in range(3)]
+    result = asyncio.run(caching.summarize_batch(requests))
+    assert result == {"0": "R T0", "1": "R T1", "2": "R T2"}
+    assert llm.batched == [["1", "2"]]
+    assert asyncio.run(caching.summarize_batch(requests)) == result
+    assert llm.batched == [["1", "2"]]
+
+
+def test_lru_bound(tmp_path: Path) -> None:
+    cache = SummaryCache(tmp_path / "s.json", max_entries=2)
+    for i in range(3):
+        cache.store(f"k{i}", f"v{i}")
+    assert cache.get("k0") is None
+    assert cache.get("k2") == "v2"
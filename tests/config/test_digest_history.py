@@ -0,0 +1,23 @@
+"""Tests de la lectura de títulos de digests guardados."""
+
+from pathlib import Path
+
+from digest.config.digest_history import load_digest_titles, save_digest_markdown
+from digest.domain.llm_port import ItemWithSummary
+from digest.domain.models import Item
+
+
+def test_load_titles_roundtrip_newest_first(tmp_path: Path) -> None:
+    (tmp_path / "2026-01-01.md").write_text("# Digest\n\n## 1. Viejo\n\n- **URL:** x\n")
+    items = [
+        ItemWithSummary(item=Item(title="A | B", url="https://a.com", source="rss"), summary="s"),
+        ItemWithSummary(item=Item(title="C", url="https://c.com", source="reddit"), summary="s"),
+    ]
+    save_digest_markdown(items, tmp_path)
+
+    assert load_digest_titles(tmp_path) == ["A | B", "C", "Viejo"]
+    assert load_digest_titles(tmp_path, max_files=1) == ["A | B", "C"]
+
+
+def test_missing_dir_returns_empty(tmp_path: Path) -> None:
+    assert load_digest_titles(tmp_path / "nope") == []
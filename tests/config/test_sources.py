@@ -4,7 +4,9 @@ from pathlib import Path
 
 
 from digest.config.sources import (
+    FetchConfig,
     HackerNewsConfig,
+    HostLimit,
     RedditConfig,
     RssSource,
     load_sources,
@@ -74,3 +76,111 @@ reddit:
         assert len(cfg.rss) == 1 and cfg.rss[0].url == "https://r.com/feed"
         assert cfg.hacker_news and cfg.hacker_news.queries == ["ai"] and cfg.hacker_news.limit == 10
         assert cfg.reddit and cfg.reddit.subreddits == ["ML"] and cfg.reddit.limit_per_sub == 3
+
+    def test_fetch_section_defaults_when_missing(self, tmp_path: Path) -> None:
+        (tmp_path / "s.yaml").write_text("rss: []\n")
+        cfg = load_sources(tmp_path / "s.yaml")
+        assert cfg.fetch == FetchConfig()
+
+    def test_parses_fetch_section(self, tmp_path: Path) -> None:
+        (tmp_path / "s.yaml").write_text("""
+fetch:
+  max_workers: 4
+  source_deadline: 12.5
+""")
+        cfg = load_sources(tmp_path / "s.yaml")
+        assert cfg.fetch == FetchConfig(max_workers=4, source_deadline=12.5)
+
+    def test_fetch_null_deadline_disables_it(self, tmp_path: Path) -> None:
+        (tmp_path / "s.yaml").write_text("""
+fetch:
+  max_workers: 0
+  source_deadline: null
+""")
+        cfg = load_sources(tmp_path / "s.yaml")
+        assert cfg.fetch.max_workers == FetchConfig().max_workers
+        assert cfg.fetch.source_deadline is None
+
+    def test_parses_hacker_news_cache_ttl(self, tmp_path: Path) -> None:
+        (tmp_path / "s.yaml").write_text("""
+hacker_news:
+  queries: ["ai"]
+  limit: 5
+  cache_ttl_minutes: 0
+""")
+        cfg = load_sources(tmp_path / "s.yaml")
+        assert cfg.hacker_news and cfg.hacker_news.cache_ttl_minutes == 0
+
+    def test_parses_host_limits(self, tmp_path: Path) -> None:
+        (tmp_path / "s.yaml").write_text("""
+fetch:
+  default_host_rate: 2
+  host_limits:
+    WWW.Reddit.com: {rate: 0.5, burst: 2, concurrency: 1}
+    bad: 3
+""")
+        cfg = load_sources(tmp_path / "s.yaml")
+        assert cfg.fetch.default_host_rate == 2.0
+        assert cfg.fetch.host_limits == {
+            "www.reddit.com": HostLimit(rate=0.5, burst=2, concurrency=1)
+        }
+
+    def test_parses_retry_and_breaker_settings(self, tmp_path: Path) -> None:
+        (tmp_path / "s.yaml").write_text(
+            "fetch:\n  retries: 0\n  retry_base_delay: 0.5\n"
+            "  breaker_threshold: 5\n  breaker_cooldown_hours: 12\n"
+        )
+        fetch = load_sources(tmp_path / "s.yaml").fetch
+        assert fetch.retries == 0
+        assert fetch.retry_base_delay == 0.5
+        assert fetch.breaker_threshold == 5
+        assert fetch.breaker_cooldown_hours == 12.0
+
+    def test_parses_feed_limits(self, tmp_path: Path) -> None:
+        (tmp_path / "s.yaml").write_text(
+            "fetch:\n  max_feed_bytes: 1000\n  max_items_per_feed: 0\n"
+        )
+        fetch = load_sources(tmp_path / "s.yaml").fetch
+        assert fetch.max_feed_bytes == 1000
+        assert fetch.max_items_per_feed is None
+        assert FetchConfig().max_items_per_feed == 50
+
+    def test_parses_parse_pool_settings(self, tmp_path: Path) -> None:
+        (tmp_path / "s.yaml").write_text(
+            "fetch:\n  parse_workers: 4\n  parse_pool_min_sources: 2\n"
+        )
+        fetch = load_sources(tmp_path / "s.yaml").fetch
+        assert (fetch.parse_workers, fetch.parse_pool_min_sources) == (4, 2)
+        assert FetchConfig().parse_workers == 0
+
+    def test_parses_og_section(self, tmp_path: Path) -> None:
+        (tmp_path / "s.yaml").write_text(
+            "og:\n  cache_ttl_days: 7\n  negative_ttl_hours: 12\n  cache_max_entries: 50\n"
+            "  prefetch: true\n  prefetch_max: 10\n"
+        )
+        og = load_sources(tmp_path / "s.yaml").og
+        assert (og.cache_ttl_days, og.negative_ttl_hours, og.cache_max_entries) == (7.0, 12.0, 50)
+        assert (og.prefetch, og.prefetch_max) == (True, 10)
+
+    def test_parses_dedup_section(self, tmp_path: Path) -> None:
+        (tmp_path / "s.yaml").write_text("dedup:\n  near_dup: false\n  near_dup_threshold: 0.8\n")
+        dedup = load_sources(tmp_path / "s.yaml").dedup
+        assert (dedup.near_dup, dedup.near_dup_threshold) == (False, 0.8)
+        (tmp_path / "s.yaml").write_text("dedup:\n  near_dup_threshold: 3\n")
+        dedup = load_sources(tmp_path / "s.yaml").dedup
+        assert (dedup.near_dup, dedup.near_dup_threshold) == (True, 0.6)
+
+    def test_parses_llm_section(self, tmp_path: Path) -> None:
+        (tmp_path / "s.yaml").write_text(
+            "llm:\n  summarize_workers: 8\n  batch_size: 10\n"
+            "  summary_cache_days: 14\n  summary_cache_max_entries: 100\n"
+            "  request_timeout: 20\n  max_connections: 3\n  rank_chunk_size: 12\n"
+            "  shortlist_factor: 2.5\n"
+        )
+        llm = load_sources(tmp_path / "s.yaml").llm
+        assert (llm.request_timeout, llm.max_connections) == (20.0, 3)
+        assert (llm.rank_chunk_size, llm.shortlist_factor) == (12, 2.5)
+        assert (llm.summarize_workers, llm.batch_size) == (8, 10)
+        assert (llm.summary_cache_days, llm.summary_cache_max_entries) == (14.0, 100)
+        (tmp_path / "s.yaml").write_text("llm:\n  summarize_workers: 0\n")
+        assert load_sources(tmp_path / "s.yaml").llm.summarize_workers == 4
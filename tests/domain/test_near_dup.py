@@ -0,0 +1,65 @@
+"""Tests del agrupado de casi duplicados (MinHash + LSH)."""
+
+import numpy as np
+
+from digest.domain.models import Item
+from digest.domain.near_dup import (
+    candidate_pairs,
+    cluster_near_duplicates,
+    lsh_params,
+    minhash_signatures,
+    shingles,
+)
+
+BODY = "Today OpenAI announced GPT-5, its newest model, with better reasoning and a lower price."
+
+
+def _item(title: str, url: str, source: str = "rss", description: str | None = None) -> Item:
+    return Item(title=title, url=url, source=source, description=description)
+
+
+def test_same_story_from_three_sources_is_one_cluster() -> None:
+    items = [
+        _item("OpenAI releases GPT-5", "https://blog.example/gpt5", description=BODY),
+        _item("Artículo A", "https://x.com/a"),
+        _item("OpenAI releases GPT-5 (openai.com)", "https://openai.com/?utm=hn", "hacker_news"),
+        _item("[N] OpenAI releases GPT-5", "https://reddit.com/r/ml/1", "reddit", "Hilo. " + BODY),
+        _item("Artículo B", "https://x.com/b"),
+    ]
+    assert cluster_near_duplicates(items) == [[0, 2, 3], [1], [4]]
+
+
+def test_shared_boilerplate_description_is_not_enough() -> None:
+    items = [
+        _item("Gardening tips for spring", "https://g.com/1", description=BODY),
+        _item("OpenAI releases GPT-5", "https://o.com/1", description=BODY),
+    ]
+    assert cluster_near_duplicates(items) == [[0], [1]]
+
+
+def test_signature_agreement_estimates_jaccard() -> None:
+    a = {f"w{i}" for i in range(100)}
+    b = {f"w{i}" for i in range(50, 150)}  # Jaccard 1/3
+    sigs = minhash_signatures([a, b, set()], num_perm=256)
+    assert sigs.shape == (3, 256) and sigs.dtype == np.uint32
+    assert abs((sigs[0] == sigs[1]).mean() - 1 / 3) < 0.1
+    assert (sigs[2] == np.iinfo(np.uint32).max).all()
+
+
+def test_lsh_buckets_identical_bands_only() -> None:
+    sigs = minhash_signatures([shingles("a b c d"), shingles("x y z"), shingles("a b c d")])
+    bands, rows = lsh_params(64, 0.6)
+    assert bands * rows == 64
+    assert candidate_pairs(sigs, bands, rows).tolist() == [[0, 2]]
+
+
+def test_chunked_signatures_match_single_pass(monkeypatch) -> None:
+    docs = [shingles(f"story {i} about topic {i * 7}") for i in range(50)] + [set()]
+    whole = minhash_signatures(docs)
+    monkeypatch.setattr("digest.domain.near_dup.CHUNK", 16)
+    assert (minhash_signatures(docs) == whole).all()
+
+    items = [_item(f"Story {i} about topic {i * 7}", f"https://s.com/{i}") for i in range(200)]
+    items.append(_item("Story 3 about topic 21", "https://copy.com/3"))
+    groups = cluster_near_duplicates(items)
+    assert [3, 200] in groups and len(groups) == 200
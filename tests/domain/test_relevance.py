@@ -0,0 +1,36 @@
+"""Tests del scorer de relevancia local (TF-IDF con NumPy)."""
+
+from digest.domain.models import Item
+from digest.domain.relevance import RelevanceScorer, tokenize
+
+
+def _item(title: str, description: str | None = None) -> Item:
+    return Item(title=title, url="https://x.com/a", source="rss", description=description)
+
+
+def test_tokenize_drops_html_stopwords_and_numbers() -> None:
+    assert tokenize("<p>The new LLM of 2026</p> is <b>fast</b>") == ["llm", "fast"]
+
+
+def test_scores_follow_seed_topics() -> None:
+    scorer = RelevanceScorer(
+        ["Quantization of LLM weights", "LLM inference benchmark", "Diffusion models for video"]
+    )
+    scores = scorer.score(
+        [
+            _item("Cooking pasta at home"),
+            _item("Faster LLM quantization", "Benchmark of 4-bit inference"),
+            _item("Weekly news", "A new diffusion model for video generation"),
+        ]
+    )
+    assert scores.shape == (3,)
+    assert scores[0] == 0.0
+    assert scores[1] > scores[2] > 0.0
+    assert (scores <= 1.0 + 1e-9).all()
+
+
+def test_empty_seed_scores_zero() -> None:
+    scorer = RelevanceScorer(["", "the of 2026"])
+    assert scorer.empty
+    assert scorer.score([_item("LLM")]).tolist() == [0.0]
+    assert RelevanceScorer(["LLM"]).score([]).shape == (0,)
@@ -41,6 +41,7 @@ class TestBuildDigestE2E:
             "digest.use_cases.build_digest.run_core_pipeline",
             mock_run,
         )
+        monkeypatch.setattr("digest.use_cases.build_digest.fetch_og_image", lambda url, **k: None)
         result = build_digest(sources, links_file, history_file, MockLLM())
         assert result == []
 
@@ -65,6 +66,7 @@ class TestBuildDigestE2E:
             "digest.use_cases.build_digest.run_core_pipeline",
             mock_run,
         )
+        monkeypatch.setattr("digest.use_cases.build_digest.fetch_og_image", lambda url, **k: None)
         result = build_digest(sources, links_file, history_file, MockLLM(), top_n=2)
         assert len(result) == 2
         assert result[0].summary == "Resumen de: Artículo A"
@@ -96,7 +98,420 @@ class TestBuildDigestE2E:
             "digest.use_cases.build_digest.run_core_pipeline",
             mock_run,
         )
+        monkeypatch.setattr("digest.use_cases.build_digest.fetch_og_image", lambda url, **k: None)
         build_digest(sources, links_file, history_file, CaptureRankLLM())
         assert len(rank_calls) == 1
         assert len(rank_calls[0]) == 1
         assert rank_calls[0][0].summary == "Resumen de: One"
+
+
+class TestOgEnrichment:
+    def test_og_images_fetched_concurrently_with_deadline(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import threading
+
+        from digest.use_cases.build_digest import enrich_with_og_images
+
+        # Las 5 búsquedas rápidas solo cruzan la barrera si están en vuelo a la vez
+        all_in_flight = threading.Barrier(5, timeout=5)
+        release_slow = threading.Event()
+
+        def og(url: str, **kwargs) -> str | None:
+            if "slow" in url:
+                release_slow.wait(5)
+            else:
+                all_in_flight.wait()
+            return f"{url}/og.png"
+
+        monkeypatch.setattr("digest.use_cases.build_digest.fetch_og_image", og)
+        items = [
+            ItemWithSummary(item=_item(f"T{i}", f"https://site{i}.com/a"), summary="s")
+            for i in range(5)
+        ] + [ItemWithSummary(item=_item("Lento", "https://slow.com/a"), summary="s")]
+
+        try:
+            enrich_with_og_images(items, deadline=1.0)
+        finally:
+            release_slow.set()
+
+        assert [x.image_url for x in items[:5]] == [
+            f"https://site{i}.com/a/og.png" for i in range(5)
+        ]
+        assert items[5].image_url is None  # abandonado por el deadline
+
+    def test_prefetch_overlaps_og_lookups_with_llm(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import threading
+
+        from digest.config.sources import OgConfig
+
+        calls: list[str] = []
+        lock = threading.Lock()
+        # Cada etapa espera a ver la otra en marcha: solo termina a tiempo si se solapan
+        summarizing, og_in_flight = threading.Event(), threading.Event()
+        overlapped: list[bool] = []
+
+        def og(url: str, **kwargs) -> str | None:
+            with lock:
+                calls.append(url)
+            og_in_flight.set()
+            overlapped.append(summarizing.wait(5))
+            return f"{url}/og.png"
+
+        class WaitingLLM(MockLLM):
+            def summarize(self, title: str, snippet: str) -> str:
+                summarizing.set()
+                overlapped.append(og_in_flight.wait(5))
+                return super().summarize(title, snippet)
+
+        candidates = [_item(f"T{i}", f"https://site{i}.com/a") for i in range(6)]
+        monkeypatch.setattr("digest.use_cases.build_digest.fetch_og_image", og)
+        monkeypatch.setattr(
+            "digest.use_cases.build_digest.run_core_pipeline", lambda *a, **k: candidates
+        )
+        sources = SourcesConfig(
+            rss=[], hacker_news=None, reddit=None, og=OgConfig(prefetch=True, prefetch_max=4)
+        )
+
+        result = build_digest(
+            sources, tmp_path / "l.md", tmp_path / "h.json", WaitingLLM(), top_n=2
+        )
+
+        assert overlapped and all(overlapped)
+        assert [x.image_url for x in result] == [
+            "https://site0.com/a/og.png",
+            "https://site1.com/a/og.png",
+        ]
+        assert sorted(calls) == [f"https://site{i}.com/a" for i in range(4)]  # tope prefetch_max
+
+
+def test_prefetcher_reports_extra_and_cancelled() -> None:
+    import threading
+
+    from digest.adapters.og_prefetch import OgPrefetcher
+
+    release = threading.Event()
+
+    def fetch(url: str) -> str | None:
+        release.wait(1.0)
+        return url + "/og.png"
+
+    prefetcher = OgPrefetcher(
+        ["https://a.com", "https://b.com", "https://a.com", "https://c.com"],
+        fetch,
+        max_requests=2,
+        max_workers=1,
+    )
+    assert "https://c.com" not in prefetcher
+    release.set()
+    assert prefetcher.result("https://b.com") == "https://b.com/og.png"
+    stats = prefetcher.close()
+    assert (stats.submitted, stats.used, stats.over_cap) == (2, 1, 1)
+    assert stats.extra + stats.cancelled == 1
+
+
+class TestSummarizeCandidates:
+    def test_concurrent_in_order_with_fallback(self) -> None:
+        import asyncio
+        import threading
+
+        from digest.use_cases.build_digest import summarize_candidates
+
+        class FlakyLLM(MockLLM):
+            def __init__(self) -> None:
+                self.lock = threading.Lock()
+                self.in_flight = 0
+                self.peak = 0
+                # Cada llamada espera a otras dos: solo avanza con 3 en vuelo a la vez
+                self.batch = threading.Barrier(3, timeout=5)
+
+            def summarize(self, title: str, snippet: str) -> str:
+                with self.lock:
+                    self.in_flight += 1
+                    self.peak = max(self.peak, self.in_flight)
+                self.batch.wait()
+                with self.lock:
+                    self.in_flight -= 1
+                if title == "T2":
+                    raise RuntimeError("rate limited")
+                return super().summarize(title, snippet)
+
+        candidates = [_item(f"T{i}", f"https://x.com/{i}") for i in range(6)]
+        candidates[2] = Item(
+            title="T2",
+            url="https://x.com/2",
+            source="rss",
+            description="<p>Texto &amp; más   texto</p>",
+        )
+
+        llm = FlakyLLM()
+        result = asyncio.run(summarize_candidates(candidates, llm, max_workers=3))
+
+        assert llm.peak == 3  # en vuelo a la vez, sin pasar de max_workers
+        assert [x.item.title for x in result] == [f"T{i}" for i in range(6)]
+        assert result[0].summary == "Resumen de: T0"
+        assert result[2].summary == "Texto & más texto"
+
+    def test_fallback_summary_truncates_or_uses_title(self) -> None:
+        from digest.use_cases.build_digest import FALLBACK_SUMMARY_CHARS, fallback_summary
+
+        assert fallback_summary(_item("Solo título", "https://x.com")) == "Solo título"
+        long = Item(title="t", url="https://x.com", source="rss", description="palabra " * 100)
+        summary = fallback_summary(long)
+        assert summary.endswith("…")
+        assert len(summary) <= FALLBACK_SUMMARY_CHARS + 1
+
+
+class TestBuildDigestAsync:
+    def test_async_llm_is_awaited_on_one_loop(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import asyncio
+
+        from digest.use_cases.build_digest import build_digest_async
+
+        class AsyncMockLLM:
+            def __init__(self) -> None:
+                self.in_flight = 0
+                self.peak = 0
+
+            async def summarize(self, title: str, snippet: str) -> str:
+                self.in_flight += 1
+                self.peak = max(self.peak, self.in_flight)
+                await asyncio.sleep(0.1)
+                self.in_flight -= 1
+                return f"Resumen de: {title}"
+
+            async def rank(self, items, top_n=5):
+                return list(reversed(items))[:top_n]
+
+        candidates = [_item(f"T{i}", f"https://site{i}.com/a") for i in range(8)]
+        monkeypatch.setattr(
+            "digest.use_cases.build_digest.run_core_pipeline", lambda *a, **k: candidates
+        )
+        monkeypatch.setattr("digest.use_cases.build_digest.fetch_og_image", lambda url, **k: None)
+        sources = SourcesConfig(rss=[], hacker_news=None, reddit=None)
+        llm = AsyncMockLLM()
+
+        result = asyncio.run(
+            build_digest_async(sources, tmp_path / "l.md", tmp_path / "h.json", llm, top_n=2)
+        )
+
+        assert [x.summary for x in result] == ["Resumen de: T7", "Resumen de: T6"]
+        assert llm.peak == sources.llm.summarize_workers
+
+    def test_sync_wrapper_accepts_async_llm(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        class AsyncMockLLM:
+            async def summarize(self, title: str, snippet: str) -> str:
+                return f"Resumen de: {title}"
+
+            async def rank(self, items, top_n=5):
+                return items[:top_n]
+
+        monkeypatch.setattr(
+            "digest.use_cases.build_digest.run_core_pipeline",
+            lambda *a, **k: [_item("A", "https://a.com/1")],
+        )
+        monkeypatch.setattr("digest.use_cases.build_digest.fetch_og_image", lambda url, **k: None)
+        sources = SourcesConfig(rss=[], hacker_news=None, reddit=None)
+        result = build_digest(sources, tmp_path / "l.md", tmp_path / "h.json", AsyncMockLLM())
+        assert [x.summary for x in result] == ["Resumen de: A"]
+
+
+class TestBatchSummaries:
+    def test_batches_then_per_item_for_missing(self) -> None:
+        import asyncio
+
+        from digest.use_cases.build_digest import summarize_candidates
+
+        class BatchLLM(MockLLM):
+            def __init__(self) -> None:
+                self.batches: list[list[str]] = []
+                self.singles: list[str] = []
+
+            def summarize_batch(self, requests):
+                self.batches.append([r.id for r in requests])
+                # El modelo "olvida" el id 3
+                return {r.id: f"Lote: {r.title}" for r in requests if r.id != "3"}
+
+            def summarize(self, title: str, snippet: str) -> str:
+                self.singles.append(title)
+                return super().summarize(title, snippet)
+
+        candidates = [_item(f"T{i}", f"https://x.com/{i}") for i in range(7)]
+        llm = BatchLLM()
+        result = asyncio.run(summarize_candidates(candidates, llm, batch_size=3))
+
+        assert sorted(llm.batches) == [["0", "1", "2"], ["3", "4", "5"], ["6"]]
+        assert llm.singles == ["T3"]
+        assert [x.summary for x in result] == [
+            "Lote: T0",
+            "Lote: T1",
+            "Lote: T2",
+            "Resumen de: T3",
+            "Lote: T4",
+            "Lote: T5",
+            "Lote: T6",
+        ]
+
+    def test_failed_batch_falls_back_to_single_calls(self) -> None:
+        import asyncio
+
+        from digest.use_cases.build_digest import summarize_candidates
+
+        class BrokenBatchLLM(MockLLM):
+            def summarize_batch(self, requests):
+                raise RuntimeError("JSON mode no disponible")
+
+        candidates = [_item(f"T{i}", f"https://x.com/{i}") for i in range(4)]
+        result = asyncio.run(summarize_candidates(candidates, BrokenBatchLLM(), batch_size=2))
+        assert [x.summary for x in result] == [f"Resumen de: T{i}" for i in range(4)]
+
+
+def test_second_run_reuses_cached_summaries(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[str] = []
+
+    class CountingLLM(MockLLM):
+        def summarize(self, title: str, snippet: str) -> str:
+            calls.append(title)
+            return super().summarize(title, snippet)
+
+    monkeypatch.setattr(
+        "digest.use_cases.build_digest.run_core_pipeline",
+        lambda *a, **k: [_item("A", "https://a.com/1"), _item("B", "https://b.com/2")],
+    )
+    monkeypatch.setattr("digest.use_cases.build_digest.fetch_og_image", lambda url, **k: None)
+    sources = SourcesConfig(rss=[], hacker_news=None, reddit=None)
+    for _run in range(2):
+        result = build_digest(
+            sources, tmp_path / "l.md", tmp_path / "h.json", CountingLLM(), cache_dir=tmp_path
+        )
+    assert sorted(calls) == ["A", "B"]
+    assert [x.summary for x in result] == ["Resumen de: A", "Resumen de: B"]
+    assert (tmp_path / "summaries.json").exists()
+
+
+class TestChunkedRanking:
+    class ScoreLLM(MockLLM):
+        """Rankea por el número del título (mayor = mejor) y anota el tamaño de cada llamada."""
+
+        def __init__(self) -> None:
+            self.calls: list[int] = []
+
+        def rank(self, items, top_n=5):
+            self.calls.append(len(items))
+            return sorted(items, key=lambda x: -int(x.item.title[1:]))[:top_n]
+
+    def _items(self, n: int) -> list[ItemWithSummary]:
+        import random
+
+        numbers = list(range(n))
+        random.Random(7).shuffle(numbers)
+        return [
+            ItemWithSummary(item=_item(f"T{i}", f"https://x.com/{i}"), summary="s") for i in numbers
+        ]
+
+    def test_chunks_keep_global_top_and_bound_prompt_size(self) -> None:
+        import asyncio
+
+        from digest.use_cases.build_digest import rank_candidates
+
+        llm = self.ScoreLLM()
+        ranked = asyncio.run(rank_candidates(self._items(100), llm, top_n=5, chunk_size=20))
+
+        assert [x.item.title for x in ranked] == ["T99", "T98", "T97", "T96", "T95"]
+        assert max(llm.calls) <= 20
+        # 5 trozos → 25 finalistas → 2 trozos → 10 → llamada final
+        assert llm.calls.count(20) == 6 and len(llm.calls) == 8
+
+    def test_single_call_when_it_fits_or_disabled(self) -> None:
+        import asyncio
+
+        from digest.use_cases.build_digest import rank_candidates
+
+        llm = self.ScoreLLM()
+        asyncio.run(rank_candidates(self._items(30), llm, top_n=5, chunk_size=0))
+        asyncio.run(rank_candidates(self._items(15), llm, top_n=5, chunk_size=20))
+        assert llm.calls == [30, 15]
+
+
+class TestTwoStage:
+    class TitleLLM(MockLLM):
+        """Rankea por el número del título (mayor = mejor) y anota qué se resume y rankea."""
+
+        def __init__(self) -> None:
+            self.summarized: list[str] = []
+            self.rank_summaries: list[list[str]] = []
+
+        def summarize(self, title: str, snippet: str) -> str:
+            self.summarized.append(title)
+            return f"Resumen de: {title}"
+
+        def rank(self, items, top_n=5):
+            self.rank_summaries.append([x.summary for x in items])
+            return sorted(items, key=lambda x: -int(x.item.title[1:]))[:top_n]
+
+    def test_only_shortlist_is_summarized(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from digest.config.sources import LlmConfig
+
+        candidates = [_item(f"T{i}", f"https://site{i}.com/a") for i in range(30)]
+        monkeypatch.setattr(
+            "digest.use_cases.build_digest.run_core_pipeline", lambda *a, **k: candidates
+        )
+        monkeypatch.setattr("digest.use_cases.build_digest.fetch_og_image", lambda url, **k: None)
+        sources = SourcesConfig(
+            rss=[], hacker_news=None, reddit=None, llm=LlmConfig(shortlist_factor=2.0)
+        )
+        llm = self.TitleLLM()
+
+        result = build_digest(sources, tmp_path / "l.md", tmp_path / "h.json", llm, top_n=5)
+
+        assert [x.item.title for x in result] == ["T29", "T28", "T27", "T26", "T25"]
+        assert sorted(llm.summarized) == sorted(f"T{i}" for i in range(20, 30))
+        # Pre-ranking sin resúmenes sobre los 30; ranking final con resumen sobre 10
+        assert llm.rank_summaries[0] == [""] * 30
+        assert len(llm.rank_summaries[1]) == 10 and all(llm.rank_summaries[1])
+
+    def test_factor_below_one_keeps_top_n(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from digest.config.sources import LlmConfig
+
+        candidates = [_item(f"T{i}", f"https://site{i}.com/a") for i in range(30)]
+        monkeypatch.setattr(
+            "digest.use_cases.build_digest.run_core_pipeline", lambda *a, **k: candidates
+        )
+        monkeypatch.setattr("digest.use_cases.build_digest.fetch_og_image", lambda url, **k: None)
+        sources = SourcesConfig(
+            rss=[], hacker_news=None, reddit=None, llm=LlmConfig(shortlist_factor=0.5)
+        )
+        llm = self.TitleLLM()
+
+        result = build_digest(sources, tmp_path / "l.md", tmp_path / "h.json", llm, top_n=5)
+
+        # 0.5 × 5 redondearía a 3: la preselección nunca deja menos de top_n
+        assert len(result) == 5
+        assert len(llm.summarized) == 5
+
+    def test_disabled_summarizes_everything(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        candidates = [_item(f"T{i}", f"https://site{i}.com/a") for i in range(12)]
+        monkeypatch.setattr(
+            "digest.use_cases.build_digest.run_core_pipeline", lambda *a, **k: candidates
+        )
+        monkeypatch.setattr("digest.use_cases.build_digest.fetch_og_image", lambda url, **k: None)
+        sources = SourcesConfig(rss=[], hacker_news=None, reddit=None)
+        llm = self.TitleLLM()
+
+        build_digest(sources, tmp_path / "l.md", tmp_path / "h.json", llm, top_n=5)
+
+        assert len(llm.summarized) == 12 and len(llm.rank_summaries) == 1
@@ -137,3 +137,45 @@ class TestRunCorePipeline:
         result = run_core_pipeline(sources, links_file, history_file)
         assert len(result) == 1
         assert result[0].url == "https://new.com/1"
+
+    def test_digests_dir_prefers_past_topics(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        history_file = tmp_path / "sent.json"
+        links_file = tmp_path / "links.md"
+        links_file.write_text("")
+        digests = tmp_path / "digests"
+        digests.mkdir()
+        (digests / "2026-03-30.md").write_text("## 1. LLM quantization tricks\n")
+        sources = SourcesConfig(rss=[], hacker_news=None, reddit=None)
+        items = [_item(f"Gardening tips {i}", f"https://g.com/{i}") for i in range(5)]
+        items.append(_item("Quantization for small LLM", "https://q.com/1"))
+        monkeypatch.setattr("digest.use_cases.pipeline_core.fetch_all_items", lambda *a, **k: items)
+
+        blind = run_core_pipeline(sources, links_file, history_file, prefilter_limit=2)
+        scored = run_core_pipeline(
+            sources, links_file, history_file, prefilter_limit=2, digests_dir=digests
+        )
+
+        assert "https://q.com/1" not in {i.url for i in blind}
+        assert scored[0].url == "https://q.com/1"
+
+    def test_near_duplicates_collapse_to_first_seen(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from digest.config.sources import DedupConfig
+
+        links_file = tmp_path / "links.md"
+        links_file.write_text("")
+        items = [
+            _item("OpenAI releases GPT-5", "https://blog.example/gpt5"),
+            _item("OpenAI releases GPT-5 (openai.com)", "https://openai.com/?ref=hn"),
+            _item("Otra noticia", "https://other.com/1"),
+        ]
+        monkeypatch.setattr("digest.use_cases.pipeline_core.fetch_all_items", lambda *a, **k: items)
+        sources = SourcesConfig(rss=[], hacker_news=None, reddit=None)
+        result = run_core_pipeline(sources, links_file, tmp_path / "sent.json")
+        assert [i.url for i in result] == ["https://blog.example/gpt5", "https://other.com/1"]
+
+        sources.dedup = DedupConfig(near_dup=False)
+        assert len(run_core_pipeline(sources, links_file, tmp_path / "sent.json")) == 3
@@ -115,3 +115,24 @@ class TestPrefilterBalanced:
         ]
         result = prefilter_candidates(items, limit=15)
         assert len(result) == 15
+
+
+class TestPrefilterWithScores:
+    """Con puntuaciones de relevancia, cada fuente aporta primero sus mejores ítems."""
+
+    def test_picks_most_relevant_per_source_and_keeps_balance(self) -> None:
+        rss = [_item(f"RSS {i}", f"https://rss.com/{i}", "rss") for i in range(20)]
+        hn = [_item(f"HN {i}", f"https://hn.com/{i}", "hacker_news") for i in range(5)]
+        # RSS relevantes al final del feed; HN todos iguales salvo el último
+        scores = [i / 100 for i in range(20)] + [0.0, 0.0, 0.0, 0.0, 0.5]
+
+        result = prefilter_candidates(rss + hn, limit=6, scores=scores)
+
+        assert sum(it.source == "rss" for it in result) == 3
+        assert {it.title for it in result if it.source == "rss"} == {"RSS 19", "RSS 18", "RSS 17"}
+        # Empates: se conserva el orden original de la fuente
+        assert [it.title for it in result if it.source == "hacker_news"] == ["HN 4", "HN 0", "HN 1"]
+
+    def test_scores_ignored_when_under_limit(self) -> None:
+        items = [_item(f"RSS {i}", f"https://rss.com/{i}", "rss") for i in range(3)]
+        assert prefilter_candidates(items, limit=5, scores=[0.0, 1.0, 0.5]) == items
@@ -63,6 +63,8 @@ class TestSourceDiversityE2E:
             mock_core_pipeline,
         )
 
+        monkeypatch.setattr("digest.use_cases.build_digest.fetch_og_image", lambda url, **k: None)
+
         result = build_digest(sources, links_file, history_file, MockLLM(), top_n=5)
         sources_in_result = {x.item.source for x in result}
 
@@ -108,6 +110,8 @@ class TestSourceDiversityE2E:
             mock_core_pipeline,
         )
 
+        monkeypatch.setattr("digest.use_cases.build_digest.fetch_og_image", lambda url, **k: None)
+
         result = build_digest(sources, links_file, history_file, MockLLM(), top_n=5)
         sources_in_result = {x.item.source for x in result}
 